@@ -5,7 +5,7 @@ This file manages environment variables and application settings.
 """
 
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Literal, Optional
 
 class Settings(BaseSettings):
     """
@@ -21,15 +21,61 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret-key-change-this-in-production-min-32-chars"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+
+    # Password hashing (bcrypt cost; worker processes, 0 = hash on the request thread)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
     
     # Groq:
     GROQ_API_KEY: str = ""  # Groq API key for AI analysis
+    GROQ_BASE_URL: Optional[str] = None  # Other endpoint, e.g. benchmarks/fake_llm.py (default: Groq cloud)
+    GROQ_MAX_RETRIES: int = 2  # Client retries on 429/5xx/connection errors (with backoff)
+    AI_JSON_MODE: bool = True  # Ask the provider for JSON replies (response_format json_object)
+    AI_REASK_ATTEMPTS: int = 1  # Re-asks of a case whose reply can't be parsed before storing ERROR
+    AI_MAX_OPINION_TOKENS: int = 1000  # Opinion text per prompt (less if the model's context window is smaller)
+    TOKENIZER_DIR: Optional[str] = None  # <model>.json tokenizer files for exact counts (needs `tokenizers`)
+    BUDGET_WAIT_SECONDS: int = 60  # A call that fits only after in-flight calls settle waits this long before halting
+
+    # Authenticated user cache (get_current_user)
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_SIZE: int = 1024
+
+    # Computed results of closed module rounds kept in memory (get_module_results)
+    RESULTS_CACHE_SIZE: int = 256
+
+    # Feedback examples in round 2+ prompts (most relevant first, within budget)
+    FEEDBACK_TOKEN_BUDGET: int = 1500
+    FEEDBACK_MAX_EXAMPLES: int = 8
+
+    # Local embedding index (memory-mapped vectors per project)
+    EMBEDDING_DIR: str = "uploads/embeddings"
+    EMBEDDING_DIM: int = 256
+
+    # Columnar analytics snapshots (Parquet per project) for cross-module reports
+    ANALYTICS_DIR: str = "uploads/analytics"
     
     class Config:
         env_file = ".env"
 
     # Database
     DATABASE_URL: str = "sqlite:///./database.db"
+    DATABASE_REPLICA_URL: Optional[str] = None  # Read replica for dashboards/analytics (optional)
+    REPLICA_STICKY_SECONDS: int = 10  # After a write, the user reads from the primary this long
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced (Postgres)
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 268435456  # 256 MB memory-mapped reads
+    
+    # Instrumentation (GET /metrics, slow-request log)
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: Optional[str] = None  # Bearer token for scrapers; without it only admins can read /metrics
+    SLOW_REQUEST_MS: int = 1000  # Requests slower than this are logged with their top queries
+    SLOW_REQUEST_TOP_QUERIES: int = 5
+    # AI pipeline tracing: off | round (stages) | case (+ per-case spans) | debug (+ raw responses)
+    TRACE_LEVEL: Literal["off", "round", "case", "debug"] = "case"
+    TRACE_FILE: str = "logs/ai_traces.jsonl"
     
     # Application
     APP_NAME: str = "Court Opinions Analyzer"
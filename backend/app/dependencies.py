@@ -2,11 +2,16 @@
 Dependencies for FastAPI routes.
 
 Provides reusable dependencies for authentication and authorization.
+Role checks use the user resolved by get_current_user, which comes from the
+in-process user cache, so they add no database queries.
 """
 
-from fastapi import Depends, HTTPException, status
+import hmac
+
+from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.database import get_db
 from app.models import User, UserRole
 from app.routers.auth import get_current_user
@@ -65,4 +70,26 @@ def require_validator(current_user: User = Depends(get_current_user)):
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Validator access required"
         )
-    return current_user
\ No newline at end of file
+    return current_user
+
+
+def require_ops_access(request: Request, db: Session = Depends(get_db)):
+    """
+    Dependency for operational endpoints (/metrics, /health/db): a bearer
+    token equal to METRICS_TOKEN (for scrapers, which can't log in) or an
+    admin user's access token.
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if settings.METRICS_TOKEN and hmac.compare_digest(token.encode(), settings.METRICS_TOKEN.encode()):
+        return
+    if get_current_user(token, db).role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
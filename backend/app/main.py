@@ -1,14 +1,33 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from app.database import engine, replica_engine, pool_metrics
 from app.routers import auth, projects, uploads, modules
+from app.dependencies import require_ops_access
+from app.utils.search_index import create_search_index
+from app.utils.auth import shutdown_password_pool
+from app.utils.metrics import MetricsMiddleware, registry as metrics_registry
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup/shutdown hooks"""
+    # Create the full-text search index on existing databases (no-op if present)
+    with engine.begin() as connection:
+        create_search_index(connection)
+    yield
+    shutdown_password_pool()
+
 
 app = FastAPI(
     title="Court Opinions Analyzer API",
     description="API for AI-powered legal corpus analysis with human verification",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # ============================================================================
@@ -29,6 +48,13 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# ============================================================================
+# Instrumentation
+# ============================================================================
+
+# Per-route latency, SQL statement count/time and response size (GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
 # ============================================================================
 # ROUTES
 # ============================================================================
@@ -65,4 +91,25 @@ def health_check():
     return {
         "status": "healthy",
         "database": "connected"
-    }
\ No newline at end of file
+    }
+
+
+@app.get("/health/db", dependencies=[Depends(require_ops_access)])
+def database_health():
+    """Database backend and connection pool usage, primary and read replica (admin or METRICS_TOKEN)"""
+    health = {
+        "backend": engine.dialect.name,
+        **pool_metrics()
+    }
+    if replica_engine is not engine:
+        health["replica"] = pool_metrics(replica_engine)
+    return health
+
+
+@app.get("/metrics", response_class=PlainTextResponse, dependencies=[Depends(require_ops_access)])
+def metrics():
+    """Request metrics in Prometheus text format (admin or METRICS_TOKEN)"""
+    return PlainTextResponse(
+        metrics_registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
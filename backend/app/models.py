@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, ForeignKey, Text, Boolean, JSON, Float
+from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, ForeignKey, Text, Boolean, JSON, Float, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -75,7 +75,7 @@ class Project(Base):
     
     # Foreign Keys
     admin_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    scholar_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    scholar_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
 
     # AI provider selection
     ai_provider = Column(String, default="groq-llama-70b")
@@ -103,7 +103,7 @@ class Project(Base):
     # AI Configuration (DUMMY FEATURE FOR NOW)
     ai_model = Column(String, default="Sonnet 4.5")  # Selected AI model
     
-    # API Usage Tracking (DUMMY FEATURE FOR NOW)
+    # API usage and spend ceiling (kept by app/utils/budget.py; NULL limit = no ceiling)
     total_tokens_used = Column(Integer, default=0)
     total_cost = Column(Float, default=0.0)
     budget_limit = Column(Float, default=1000.0)  # Default $1000 budget
@@ -120,6 +120,14 @@ class CourtCase(Base):
     Each case belongs to one project and can have multiple assignments.
     """
     __tablename__ = "court_cases"
+    __table_args__ = (
+        # Case browser: keyset pagination and filters within a project
+        Index("ix_court_cases_project_id_id", "project_id", "id"),
+        Index("ix_court_cases_project_id_court", "project_id", "court"),
+        Index("ix_court_cases_project_id_state", "project_id", "state"),
+        Index("ix_court_cases_project_id_case_date", "project_id", "case_date"),
+        Index("ix_court_cases_project_id_election_type", "project_id", "election_type"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -281,7 +289,7 @@ class VerificationModule(Base):
     __tablename__ = "verification_modules"
     
     id = Column(Integer, primary_key=True)
-    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"))
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), index=True)
     
     # Module identification
     module_number = Column(Integer)  # 1, 2, 3...
@@ -299,6 +307,7 @@ class VerificationModule(Base):
     
     # Sampling configuration
     sample_size = Column(Integer)  # How many cases to analyze (e.g., 20, 30)
+    inclusion_query = Column(JSON, nullable=True)  # Restricts the sampling frame, e.g. {"text": "recount", "state": "OH"}
     
     ai_provider = Column(String, default="ollama-8b")  # "dummy", "ollama-8b", "ollama-70b"
 
@@ -427,6 +436,10 @@ class ValidationFeedback(Base):
     Validator's review of AI's answer.
     """
     __tablename__ = "validation_feedback"
+    __table_args__ = (
+        # One validation per case assignment (target of bulk upserts)
+        UniqueConstraint("assignment_id", name="uq_validation_feedback_assignment"),
+    )
     
     id = Column(Integer, primary_key=True)
     assignment_id = Column(Integer, ForeignKey("validator_assignments.id", ondelete="CASCADE"))
@@ -468,6 +481,10 @@ class FeedbackLibrary(Base):
     Only scholar-approved corrections go here.
     """
     __tablename__ = "feedback_library"
+    __table_args__ = (
+        # One library entry per example case per module
+        UniqueConstraint("module_id", "example_case_id", name="uq_feedback_library_module_case"),
+    )
     
     id = Column(Integer, primary_key=True)
     module_id = Column(Integer, ForeignKey("verification_modules.id", ondelete="CASCADE"))
@@ -10,7 +10,8 @@ from datetime import timedelta
 from app.database import get_db
 from app.models import User, UserRole
 from app.schemas import UserCreate, UserResponse, UserLogin, Token
-from app.utils.auth import hash_password, verify_password, create_access_token, decode_access_token
+from app.utils.auth import hash_password, verify_and_update_password, create_access_token, decode_access_token
+from app.utils.user_cache import user_cache
 from app.core.config import settings
 from typing import List
 
@@ -32,6 +33,10 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
         @router.get("/protected")
         def protected_route(current_user: User = Depends(get_current_user)):
             return {"user": current_user.email}
+    
+    Users are served from a short-lived in-process cache (app.utils.user_cache),
+    so most requests don't query the users table. The returned User is not
+    attached to the request's session.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -48,11 +53,16 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     if email is None:
         raise credentials_exception
     
-    # Get user from database
+    # Get user from cache, falling back to the database
+    user = user_cache.get(email)
+    if user is not None:
+        return user
+    
     user = db.query(User).filter(User.email == email).first()
     if user is None:
         raise credentials_exception
     
+    user_cache.put(email, user)
     return user
 
 
@@ -111,6 +121,9 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     - username: email address
     - password: user's password
     
+    Stored hashes made with an outdated bcrypt cost are upgraded to
+    BCRYPT_ROUNDS on successful login.
+    
     Returns:
     {
         "access_token": "eyJ0eXAiOiJKV1QiLCJhbGc...",
@@ -120,13 +133,23 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     # Find user
     user = db.query(User).filter(User.email == form_data.username).first()
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user:
+        password_valid, new_hash = False, None
+    else:
+        password_valid, new_hash = verify_and_update_password(form_data.password, user.hashed_password)
+    
+    if not password_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Re-hash with the current bcrypt cost
+    if new_hash:
+        user.hashed_password = new_hash
+        db.commit()
+    
     # Check if user is active
     if not user.is_active:
         raise HTTPException(
@@ -2,23 +2,41 @@
 Verification module management routes - scholars create and manage research questions.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query, Response
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, literal, select
 from typing import Optional, List
 from datetime import datetime
 from typing import Optional
+import logging
 import random
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from app.database import get_db
+from app.core.config import settings
+from app.database import get_db, get_async_db, get_read_db, get_async_read_db, dialect_insert
 from app.models import User, Project, VerificationModule, ModuleCaseSample, ValidatorAssignment, CourtCase, AIAnalysis, ValidationFeedback, FeedbackLibrary
 from app.schemas import (
     VerificationModuleCreate, 
     VerificationModuleResponse, 
-    VerificationModuleUpdate
+    VerificationModuleUpdate,
+    SamplingFilter
 )
 from app.dependencies import get_current_user
+from app.utils.sampling import draw_sample, sampling_frame_ids
+from app.utils.feedback_selector import FeedbackExampleSelector
+from app.utils.embeddings import load_embedding_index
+from app.utils.case_queries import METADATA_COLUMNS
+from app.utils.tracing import start_trace, span
+from app.utils.response_parser import parse_reply
+from app.utils.budget import BudgetExceeded, RoundBudget, check_round, estimate_round_cost, price_per_token
+from app.utils.tokens import reply_token_cap, token_counter
+from app.utils.exports import export_response, export_statement
+from app.utils.http_cache import (
+    etag_matches, make_etag, not_modified, results_cache, set_cache_headers
+)
+
+logger = logging.getLogger(__name__)
 
 
 class ReviewCorrectionRequest(BaseModel):
@@ -26,11 +44,38 @@ class ReviewCorrectionRequest(BaseModel):
     approve: bool
     scholar_notes: Optional[str] = None
 
+class BatchReviewCorrectionsRequest(BaseModel):
+    decisions: List[ReviewCorrectionRequest] = Field(..., min_length=1, max_length=1000)
+
+class ValidationItem(BaseModel):
+    case_id: int
+    is_correct: bool
+    corrected_answer: Optional[str] = None
+    validator_reasoning: Optional[str] = None
+    validator_notes: Optional[str] = None
+
+class BulkValidationRequest(BaseModel):
+    validations: List[ValidationItem] = Field(..., min_length=1, max_length=1000)
+
 router = APIRouter(prefix="/modules", tags=["Verification Modules"])
 
 
+def _inclusion_query_to_json(inclusion_query: Optional[SamplingFilter]) -> Optional[dict]:
+    """Store only the filters that are set; an empty filter clears the inclusion query."""
+    if inclusion_query is None:
+        return None
+    return inclusion_query.model_dump(mode="json", exclude_none=True) or None
+
+
+# The provider list only changes with a deploy: browsers may reuse it for an hour
+AI_PROVIDERS_CACHE_CONTROL = "public, max-age=3600"
+
+
 @router.get("/ai-providers")
-def get_ai_providers():
+def get_ai_providers(
+    response: Response,
+    if_none_match: Optional[str] = Header(None)
+):
     """Get list of available AI providers"""
     providers = [
         {"value": "dummy", "label": "Dummy AI (Testing)"},
@@ -39,10 +84,15 @@ def get_ai_providers():
         {"value": "groq-llama-405b", "label": "🔥 Llama 4 Maverick 17B (Groq - Best Quality)"}
     ]
     
-    return {
+    payload = {
         "providers": providers,
         "default": "groq-llama-70b"
     }
+    etag = make_etag(payload)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, AI_PROVIDERS_CACHE_CONTROL)
+    set_cache_headers(response, etag, AI_PROVIDERS_CACHE_CONTROL)
+    return payload
 
 
 @router.post("/projects/{project_id}/modules", response_model=VerificationModuleResponse, status_code=status.HTTP_201_CREATED)
@@ -106,6 +156,7 @@ def create_module(
         answer_options=module_data.answer_options,
         module_context=module_data.module_context,
         sample_size=module_data.sample_size,
+        inclusion_query=_inclusion_query_to_json(module_data.inclusion_query),
         ai_provider=module_data.ai_provider,
         status="draft"
     )
@@ -120,16 +171,31 @@ def create_module(
 @router.get("/projects/{project_id}/modules", response_model=List[VerificationModuleResponse])
 def list_modules(
     project_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     List all modules for a project.
+
+    The ETag covers the count, newest id and latest change of the project's
+    modules, so an unchanged list is answered with 304 before it is loaded.
     """
     # Verify project exists and user has access
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
+
+    version = db.query(
+        func.count(VerificationModule.id),
+        func.max(VerificationModule.id),
+        func.max(func.coalesce(VerificationModule.updated_at, VerificationModule.created_at))
+    ).filter(VerificationModule.project_id == project_id).one()
+    etag = make_etag("modules", project_id, *version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
     
     # Get modules ordered by module_number
     modules = db.query(VerificationModule).filter(
@@ -142,16 +208,23 @@ def list_modules(
 @router.get("/modules/{module_id}", response_model=VerificationModuleResponse)
 def get_module(
     module_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get a specific module by ID.
+    Get a specific module by ID (ETag from its updated_at).
     """
     module = db.query(VerificationModule).filter(VerificationModule.id == module_id).first()
     
     if not module:
         raise HTTPException(status_code=404, detail="Module not found")
+
+    etag = make_etag("module", module.id, module.updated_at or module.created_at)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
     
     return module
 
@@ -217,6 +290,8 @@ def update_module(
         module.module_context = module_data.module_context
     if module_data.sample_size is not None:
         module.sample_size = module_data.sample_size    
+    if module_data.inclusion_query is not None:
+        module.inclusion_query = _inclusion_query_to_json(module_data.inclusion_query)
     
     module.updated_at = datetime.utcnow()
     
@@ -234,7 +309,7 @@ def clone_module(
     """
     Clone an existing module into a new draft module.
     Copies: question_text, answer_type, answer_options, module_context,
-            sample_size, ai_provider, and validator assignment (if any).
+            sample_size, inclusion_query, ai_provider, and validator assignment (if any).
     Leaves module_name blank for the scholar to fill in.
     """
     # Get source module
@@ -266,6 +341,7 @@ def clone_module(
         answer_options=source.answer_options,
         module_context=source.module_context,
         sample_size=source.sample_size,
+        inclusion_query=source.inclusion_query,
         ai_provider=source.ai_provider,
         status="draft"
     )
@@ -329,7 +405,8 @@ def sample_cases(
 ):
     """
     Generate random case sample for a module.
-    Randomly selects N cases from project's cases where N = module.sample_size.
+    Randomly selects N cases from the module's sampling frame where N = module.sample_size.
+    The frame is every case in the project, narrowed by the module's inclusion query.
     """
     # Get module
     module = db.query(VerificationModule).filter(VerificationModule.id == module_id).first()
@@ -354,15 +431,16 @@ def sample_cases(
             detail=f"Cases already sampled for this module. Delete existing samples first."
         )
     
-    # Get random cases from project
-    random_cases = db.query(CourtCase).filter(
-        CourtCase.project_id == module.project_id
-    ).order_by(func.random()).limit(module.sample_size).all()
+    # Get random cases from the sampling frame
+    try:
+        random_cases, frame_size = draw_sample(db, module, module.sample_size)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     if len(random_cases) < module.sample_size:
         raise HTTPException(
             status_code=400,
-            detail=f"Not enough cases in project. Need {module.sample_size}, found {len(random_cases)}"
+            detail=f"Not enough cases in sampling frame. Need {module.sample_size}, found {frame_size}"
         )
     
     # Create samples
@@ -380,8 +458,36 @@ def sample_cases(
     
     return {
         "success": True,
-        "message": f"Sampled {len(random_cases)} cases for module",
-        "sampled_count": len(random_cases)
+        "message": f"Sampled {len(random_cases)} of {frame_size} cases for module",
+        "sampled_count": len(random_cases),
+        "frame_size": frame_size
+    }
+
+
+@router.get("/modules/{module_id}/sampling-frame")
+def get_sampling_frame(
+    module_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Preview how many cases the module's inclusion query leaves to sample from.
+    """
+    module = db.query(VerificationModule).filter(VerificationModule.id == module_id).first()
+    if not module:
+        raise HTTPException(status_code=404, detail="Module not found")
+    
+    try:
+        frame_size = len(sampling_frame_ids(db, module.project_id, module.inclusion_query, module_id=module.id))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "module_id": module_id,
+        "inclusion_query": module.inclusion_query,
+        "frame_size": frame_size,
+        "sample_size": module.sample_size,
+        "sample_fits": frame_size >= module.sample_size
     }
 
 
@@ -617,8 +723,8 @@ def launch_mock_ai_analysis(
 
 
 @router.get("/validators/my-assignments")
-def get_my_assignments(
-    db: Session = Depends(get_db),
+async def get_my_assignments(
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -628,45 +734,41 @@ def get_my_assignments(
     if current_user.role.value != "validator":
         raise HTTPException(status_code=403, detail="Only validators can access this endpoint")
     
-    # Get all assignments for this validator
-    assignments = db.query(ValidatorAssignment).filter(
+    # Per-module totals for this validator in one grouped query:
+    # total = assignments, completed = validations submitted against them
+    progress = select(
+        ValidatorAssignment.module_id.label("module_id"),
+        func.count(ValidatorAssignment.id).label("total_cases"),
+        func.count(ValidationFeedback.id).label("completed_cases")
+    ).outerjoin(
+        ValidationFeedback,
+        ValidationFeedback.assignment_id == ValidatorAssignment.id
+    ).where(
         ValidatorAssignment.validator_id == current_user.id
-    ).all()
-    
-    # Group by module to get unique modules
-    module_ids = list(set([a.module_id for a in assignments]))
-    
+    ).group_by(
+        ValidatorAssignment.module_id
+    ).subquery()
+
+    # Join module, project and scholar onto the totals (same single round trip)
+    Scholar = aliased(User)
+    rows = (await db.execute(
+        select(
+            VerificationModule,
+            Project,
+            Scholar.email,
+            progress.c.total_cases,
+            progress.c.completed_cases
+        ).join(
+            progress, progress.c.module_id == VerificationModule.id
+        ).join(
+            Project, Project.id == VerificationModule.project_id
+        ).outerjoin(
+            Scholar, Scholar.id == Project.scholar_id
+        ).order_by(VerificationModule.id)
+    )).all()
+
     result = []
-    for module_id in module_ids:
-        module = db.query(VerificationModule).filter(VerificationModule.id == module_id).first()
-        if not module:
-            continue
-        
-        project = db.query(Project).filter(Project.id == module.project_id).first()
-        if not project:
-            continue
-
-        # Get scholar email
-        scholar_email = None
-        if project.scholar_id:
-            scholar = db.query(User).filter(User.id == project.scholar_id).first()
-            if scholar:
-                scholar_email = scholar.email
-
-        # Count total cases and completed validations
-        total_cases = db.query(ValidatorAssignment).filter(
-            ValidatorAssignment.module_id == module_id,
-            ValidatorAssignment.validator_id == current_user.id
-        ).count()
-        
-        completed_cases = db.query(ValidationFeedback).join(
-            ValidatorAssignment,
-            ValidationFeedback.assignment_id == ValidatorAssignment.id
-        ).filter(
-            ValidatorAssignment.module_id == module_id,
-            ValidatorAssignment.validator_id == current_user.id
-        ).count()
-        
+    for module, project, scholar_email, total_cases, completed_cases in rows:
         result.append({
             "module_id": module.id,
             "module_name": module.module_name,
@@ -699,7 +801,6 @@ def launch_module(
         Project, CourtCase, ModuleCaseSample, ValidatorAssignment, 
         AIAnalysis, VerificationModule
     )
-    import random
     
     # Get module
     module = db.query(VerificationModule).filter(VerificationModule.id == module_id).first()
@@ -738,115 +839,134 @@ def launch_module(
             detail=f"Module round {module.ai_round} already launched"
         )
     
-    # STEP 1: Sample cases
-    all_cases = db.query(CourtCase).filter(
-        CourtCase.project_id == module.project_id
-    ).all()
-    
-    if len(all_cases) == 0:
-        raise HTTPException(status_code=400, detail="No cases available to sample")
-    
-    sample_size = min(module.sample_size, len(all_cases))
-    sampled_cases = random.sample(all_cases, sample_size)
-    
-    # Create case samples for this round
-    for idx, case in enumerate(sampled_cases, start=1):
-        sample = ModuleCaseSample(
-            module_id=module_id,
-            case_id=case.id,
-            sample_order=idx,
-            round=module.ai_round
-        )
-        db.add(sample)
-    
-    # Update module status
-    module.status = "ai_analyzing"
-    module.launched_at = datetime.utcnow()
-    db.commit()
-    
-    # STEP 2: Run AI analysis based on project's ai_provider
-    # Use module's AI provider first, then project's, then fallback
+    # AI provider: module's first, then project's, then fallback
     ai_provider = module.ai_provider or project.ai_provider or "dummy"
 
-    # Fetch feedback library for round 2+ (in-context learning)
-    feedback_examples = []
-    if module.ai_round > 1:
-        feedback_items = db.query(FeedbackLibrary).filter(
-            FeedbackLibrary.module_id == module_id
-        ).all()
-        feedback_examples = [
-            {
-                "wrong_answer": f.wrong_answer,
-                "correct_answer": f.correct_answer,
-                "correction_reason": f.correction_reason,
-            }
-            for f in feedback_items
-        ]
-        print(f"🔍 DEBUG: Round {module.ai_round} — loaded {len(feedback_examples)} feedback examples")
-
-    # DEBUG LINE:
-    print(f"DEBUG: ai_provider = {ai_provider}")
-
-    # if ai_provider == "dummy":
-    #     # Use mock AI
-    #     _run_mock_ai_analysis(module, sampled_cases, db)
-    #     ai_used = "Dummy AI (Mock)"
-    # elif ai_provider in ["groq-llama-8b", "groq-llama-70b", "groq-llama-405b"]:
-    #     # Use Llama via Groq API
-    #     _run_groq_ai_analysis(module, sampled_cases, ai_provider, project, db)
-    #     model_size = ai_provider.split('-')[2].upper()  # Extracts "8B", "70B", or "405B"
-    #     ai_used = f"Llama 3.1 {model_size} (Groq Cloud)"
-    # else:
-    #     # Fallback to mock
-    #     _run_mock_ai_analysis(module, sampled_cases, db)
-    #     ai_used = "Dummy AI (Mock - fallback)"
-
-    if ai_provider == "dummy":
-        print("DEBUG: Calling _run_mock_ai_analysis (dummy)")
-        _run_mock_ai_analysis(module, sampled_cases, db)
-        ai_used = "Dummy AI (Mock)"
-    elif ai_provider in ["groq-llama-8b", "groq-llama-70b", "groq-llama-405b"]:
-        print("DEBUG: Calling _run_groq_ai_analysis")
-        _run_groq_ai_analysis(module, sampled_cases, ai_provider, project, db, feedback_examples)
-        model_size = ai_provider.split('-')[2].upper()
-        ai_used = f"Llama 3.3 {model_size} (Groq Cloud)"
-    else:
-        print(f"DEBUG: Fallback - ai_provider was {ai_provider}")
-        _run_mock_ai_analysis(module, sampled_cases, db)
-        ai_used = "Dummy AI (Mock - fallback)"
-
-    # STEP 3: Create ValidatorAssignment records for each sampled case
-    # Get the validator who was assigned to this module
-    validator_assignment = db.query(ValidatorAssignment).filter(
-        ValidatorAssignment.module_id == module_id
-    ).first()
-
-    if validator_assignment:
-        validator_id = validator_assignment.validator_id
+    with start_trace("launch_module", module_id=module_id, project_id=project.id,
+                     round=module.ai_round, ai_provider=ai_provider) as launch_span:
+        # STEP 1: Sample cases from the module's sampling frame
+        with span("sampling", inclusion_query=bool(module.inclusion_query)) as sampling_span:
+            try:
+                sampled_cases, frame_size = draw_sample(db, module, module.sample_size)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            sampling_span.set(frame_size=frame_size, cases_sampled=len(sampled_cases))
         
-        # Delete the single module-level assignment
-        db.delete(validator_assignment)
+        if frame_size == 0:
+            detail = "No cases match the module's inclusion query" if module.inclusion_query else "No cases available to sample"
+            raise HTTPException(status_code=400, detail=detail)
         
-        # Create one assignment per case
-        for case in sampled_cases:
-            case_assignment = ValidatorAssignment(
-                module_id=module_id,
-                validator_id=validator_id,
-                case_id=case.id,
-                round=module.ai_round
-            )
-            db.add(case_assignment)
+        sample_size = len(sampled_cases)
+        
+        # Feedback library for round 2+ (in-context learning):
+        # each case gets the most relevant corrections that fit the token budget
+        feedback_selector = None
+        if module.ai_round > 1:
+            with span("feedback_selection") as feedback_span:
+                feedback_selector = FeedbackExampleSelector(db, module)
+                feedback_span.set(examples=len(feedback_selector))
+        
+        # Worst-case cost of the round must fit the project's remaining budget
+        price = price_per_token(ai_provider)
+        estimate = None
+        if price > 0:
+            with span("budget_check") as budget_span:
+                prompt_tokens = _estimate_prompt_tokens(
+                    module, sampled_cases, GROQ_MODELS.get(ai_provider, DEFAULT_GROQ_MODEL),
+                    _project_context_text(db, project.id), feedback_selector
+                )
+                estimate = estimate_round_cost(
+                    prompt_tokens, reply_token_cap(module.answer_type, module.answer_options), price
+                )
+                budget_span.set(**estimate)
+                try:
+                    check_round(db, project.id, estimate)
+                except BudgetExceeded as e:
+                    raise HTTPException(status_code=400, detail=f"Budget limit: {e}")
+        
+        # Create case samples for this round
+        with span("sample_write", cases=sample_size):
+            for idx, case in enumerate(sampled_cases, start=1):
+                sample = ModuleCaseSample(
+                    module_id=module_id,
+                    case_id=case.id,
+                    sample_order=idx,
+                    round=module.ai_round
+                )
+                db.add(sample)
+            
+            # Update module status
+            module.status = "ai_analyzing"
+            module.launched_at = datetime.utcnow()
+            case_ids = [case.id for case in sampled_cases]
+            db.commit()
+            # The commit expired the cases: reload them in one query, not one per case
+            db.query(CourtCase).filter(CourtCase.id.in_(case_ids)).all()
+        
+        # STEP 2: Run AI analysis based on the AI provider
+
+        # if ai_provider == "dummy":
+        #     # Use mock AI
+        #     _run_mock_ai_analysis(module, sampled_cases, db)
+        #     ai_used = "Dummy AI (Mock)"
+        # elif ai_provider in ["groq-llama-8b", "groq-llama-70b", "groq-llama-405b"]:
+        #     # Use Llama via Groq API
+        #     _run_groq_ai_analysis(module, sampled_cases, ai_provider, project, db)
+        #     model_size = ai_provider.split('-')[2].upper()  # Extracts "8B", "70B", or "405B"
+        #     ai_used = f"Llama 3.1 {model_size} (Groq Cloud)"
+        # else:
+        #     # Fallback to mock
+        #     _run_mock_ai_analysis(module, sampled_cases, db)
+        #     ai_used = "Dummy AI (Mock - fallback)"
+
+        if ai_provider == "dummy":
+            _run_mock_ai_analysis(module, sampled_cases, db)
+            ai_used = "Dummy AI (Mock)"
+        elif ai_provider in ["groq-llama-8b", "groq-llama-70b", "groq-llama-405b"]:
+            _run_groq_ai_analysis(module, sampled_cases, ai_provider, project, db, feedback_selector)
+            model_size = ai_provider.split('-')[2].upper()
+            ai_used = f"Llama 3.3 {model_size} (Groq Cloud)"
+        else:
+            _run_mock_ai_analysis(module, sampled_cases, db)
+            ai_used = "Dummy AI (Mock - fallback)"
 
-    # Update module status to ready for validation
-    module.status = "validation_in_progress"
-    db.commit()
+        # STEP 3: Create ValidatorAssignment records for each sampled case
+        with span("assignment_creation", cases=sample_size):
+            # Get the validator who was assigned to this module
+            validator_assignment = db.query(ValidatorAssignment).filter(
+                ValidatorAssignment.module_id == module_id
+            ).first()
+
+            if validator_assignment:
+                validator_id = validator_assignment.validator_id
+                
+                # Delete the single module-level assignment
+                db.delete(validator_assignment)
+                
+                # Create one assignment per case
+                for case_id in case_ids:
+                    case_assignment = ValidatorAssignment(
+                        module_id=module_id,
+                        validator_id=validator_id,
+                        case_id=case_id,
+                        round=module.ai_round
+                    )
+                    db.add(case_assignment)
+
+            # Update module status to ready for validation
+            module.status = "validation_in_progress"
+            db.commit()
+
+        launch_span.set(cases_sampled=sample_size, frame_size=frame_size, ai_used=ai_used)
     
     return {
         "success": True,
-        "message": f"Module launched successfully! {sample_size} cases sampled and analyzed using {ai_used}.",
+        "message": f"Module launched successfully! {sample_size} of {frame_size} cases sampled and analyzed using {ai_used}.",
         "cases_sampled": sample_size,
+        "frame_size": frame_size,
         "ai_provider": ai_provider,
-        "ai_used": ai_used
+        "ai_used": ai_used,
+        "estimated_max_cost": estimate["max_cost"] if estimate else 0.0
     }
 
 
@@ -855,193 +975,369 @@ def _run_mock_ai_analysis(module: VerificationModule, sampled_cases: list, db: S
     from app.models import AIAnalysis
     import random
     
-    # Generate mock responses for each case
-    for case in sampled_cases:
-        if module.answer_type == "yes_no":
-            ai_answer = random.choice(["Yes", "No"])
-        elif module.answer_type == "multiple_choice" and module.answer_options:
-            ai_answer = random.choice(module.answer_options)
-        elif module.answer_type == "integer":
-            ai_answer = str(random.randint(1, 100))
-        elif module.answer_type == "date":
-            ai_answer = f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}"
-        else:
-            ai_answer = "Mock AI response for text question"
+    with span("ai_analysis", model="dummy-ai-v1", cases=len(sampled_cases)) as analysis_span:
+        total_tokens = 0
         
-        ai_analysis = AIAnalysis(
-            module_id=module.id,
-            case_id=case.id,
-            ai_answer=ai_answer,
-            ai_reasoning="Mock reasoning generated by dummy AI",
-            ai_confidence=random.uniform(0.7, 0.99),
-            ai_round=module.ai_round,
-            model_used="dummy-ai-v1",
-            tokens_used=random.randint(100, 500),
-            cost=0.0
+        # Generate mock responses for each case
+        for case in sampled_cases:
+            if module.answer_type == "yes_no":
+                ai_answer = random.choice(["Yes", "No"])
+            elif module.answer_type == "multiple_choice" and module.answer_options:
+                ai_answer = random.choice(module.answer_options)
+            elif module.answer_type == "integer":
+                ai_answer = str(random.randint(1, 100))
+            elif module.answer_type == "date":
+                ai_answer = f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}"
+            else:
+                ai_answer = "Mock AI response for text question"
+            
+            ai_analysis = AIAnalysis(
+                module_id=module.id,
+                case_id=case.id,
+                ai_answer=ai_answer,
+                ai_reasoning="Mock reasoning generated by dummy AI",
+                ai_confidence=random.uniform(0.7, 0.99),
+                ai_round=module.ai_round,
+                model_used="dummy-ai-v1",
+                tokens_used=random.randint(100, 500),
+                cost=0.0
+            )
+            db.add(ai_analysis)
+            total_tokens += ai_analysis.tokens_used
+        
+        analysis_span.set(total_tokens=total_tokens)
+
+
+# Map provider names to Groq model names
+GROQ_MODELS = {
+    "groq-llama-8b": "llama-3.1-8b-instant",
+    "groq-llama-70b": "llama-3.3-70b-versatile",
+    "groq-llama-405b": "meta-llama/llama-4-maverick-17b-128e-instruct"
+}
+DEFAULT_GROQ_MODEL = "llama-3.3-70b-versatile"
+
+
+def _project_context_text(db: Session, project_id: int) -> Optional[str]:
+    from app.models import ProjectContext
+    project_context_obj = db.query(ProjectContext).filter(
+        ProjectContext.project_id == project_id
+    ).first()
+    return project_context_obj.context_text if project_context_obj else None
+
+
+def _estimate_prompt_tokens(module: VerificationModule, cases: list, model: str,
+                            project_context: str = None,
+                            feedback_selector: FeedbackExampleSelector = None) -> List[int]:
+    """
+    Prompt tokens per case for budgeting, without building every prompt:
+    the prompt around the opinion, plus the most feedback examples could
+    add, plus the part of the opinion that fits.
+    """
+    counter = token_counter(model)
+    template_tokens = counter.count(_build_llama_prompt(
+        question=module.question_text,
+        case_text="",
+        answer_type=module.answer_type,
+        answer_options=module.answer_options,
+        project_context=project_context,
+        module_context=module.module_context,
+        json_mode=settings.AI_JSON_MODE
+    ))
+    feedback_tokens = 0
+    if feedback_selector:
+        feedback_tokens = min(
+            feedback_selector.token_budget,
+            sum(example["tokens"] for example, _ in feedback_selector.examples)
         )
-        db.add(ai_analysis)
+    allowance = counter.opinion_allowance(
+        template_tokens + feedback_tokens, reply_token_cap(module.answer_type, module.answer_options)
+    )
+    return [
+        template_tokens + feedback_tokens + counter.count(counter.truncate(case.opinion_text or "", allowance))
+        for case in cases
+    ]
+
+
+_shared_groq_http_client = None
+
+
+def _groq_http_client():
+    """
+    One connection pool for all Groq calls (keep-alive across cases and launches).
+    
+    Passing our own client also sidesteps groq 0.11's default client, which
+    hands httpx >= 0.28 a `proxies` argument it no longer accepts.
+    """
+    global _shared_groq_http_client
+    if _shared_groq_http_client is None:
+        from groq import DefaultHttpxClient
+        _shared_groq_http_client = DefaultHttpxClient()
+    return _shared_groq_http_client
 
 
 def _run_groq_ai_analysis(module: VerificationModule, sampled_cases: list, 
                           ai_provider: str, project: Project, db: Session,
-                          feedback_examples: list = None):
-    """Run AI analysis using Groq API (cloud-hosted Llama models)"""
+                          feedback_selector: FeedbackExampleSelector = None):
+    """
+    Run AI analysis using Groq API (cloud-hosted Llama models).
+    
+    Replies are read with parse_reply (JSON output requested when
+    AI_JSON_MODE is on) and normalized per answer type. Cases whose reply
+    can't be parsed are re-asked, with the parse error, up to
+    AI_REASK_ATTEMPTS times; only those still unreadable are stored as ERROR.
+    
+    Prompts take as much of the opinion as the model's token allowance
+    (AI_MAX_OPINION_TOKENS, within its context window) and max_tokens is
+    sized by answer type (app/utils/tokens.py).
+    
+    Each call's worst-case cost is reserved against the project's budget
+    before dispatch and its actual usage charged to the project (in its own
+    transaction) when it returns; once the budget is reached, remaining
+    cases are stored as ERROR "Budget limit reached" instead of being sent.
+    The analyses are committed together at the end.
+    
+    Traced per case: prompt_build, provider_call (latency, token counts),
+    parse and db_write spans under a "case" span, plus "reask" spans.
+    """
+    groq_model = GROQ_MODELS.get(ai_provider, DEFAULT_GROQ_MODEL)
+    
     try:
-        from app.models import AIAnalysis
-        from groq import Groq
-        import os
-        
-        print(f"🔍 DEBUG: Inside _run_groq_ai_analysis with {len(sampled_cases)} cases")
-        
-        # Map provider names to Groq model names
-        model_map = {
-            "groq-llama-8b": "llama-3.1-8b-instant",
-            "groq-llama-70b": "llama-3.3-70b-versatile",
-            "groq-llama-405b": "meta-llama/llama-4-maverick-17b-128e-instruct"
-        }
-        
-        groq_model = model_map.get(ai_provider, "llama-3.3-70b-versatile")
-        print(f"🔍 DEBUG: Using Groq model: {groq_model}")
-        
-        # Initialize Groq client
-        api_key = os.getenv("GROQ_API_KEY")
-        print(f"🔍 DEBUG: GROQ_API_KEY exists: {bool(api_key)}, length: {len(api_key) if api_key else 0}")
-        
-        if not api_key:
-            print("❌ DEBUG: No API key found - falling back to mock")
-            _run_mock_ai_analysis(module, sampled_cases, db)
-            return
-        
-        print(f"🔍 DEBUG: Creating Groq client...")
-        client = Groq(api_key=api_key)
-        print(f"✅ DEBUG: Groq client created successfully")
-        
-        # Get project context
-        print(f"🔍 DEBUG: Fetching project context...")
-        from app.models import ProjectContext
-        project_context_obj = db.query(ProjectContext).filter(
-            ProjectContext.project_id == project.id
-        ).first()
-        project_context = project_context_obj.context_text if project_context_obj else None
-        print(f"✅ DEBUG: Project context fetched (exists: {bool(project_context)})")
-        
-        print(f"🔍 DEBUG: Starting loop through {len(sampled_cases)} cases...")
-        
-        # Process each case
-        for case in sampled_cases:
-            print(f"🔍 DEBUG: Processing case {case.id}...")
+        with span("ai_analysis", model=groq_model, cases=len(sampled_cases)) as analysis_span:
+            from app.models import AIAnalysis
+            from groq import Groq
+            import os
             
-            try:
-                # Build the prompt
-                prompt = _build_llama_prompt(
-                    question=module.question_text,
-                    case_text=case.opinion_text or "",
-                    answer_type=module.answer_type,
-                    answer_options=module.answer_options,
-                    project_context=project_context,
-                    module_context=module.module_context,
-                    feedback_examples=feedback_examples
-                )
-                
-                print(f"🔍 DEBUG: Prompt built, calling Groq API...")
-                
-                # Call Groq API
-                response = client.chat.completions.create(
-                    model=groq_model,
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.1,
-                    max_tokens=500
-                )
-                
-                print(f"✅ DEBUG: Got API response for case {case.id}")
-                print(f"🔍 DEBUG: Raw response: {response.choices[0].message.content[:500]}")
-
-                # Parse structured response
-                raw_response = response.choices[0].message.content.strip()
-                
-                ai_answer = raw_response  # fallback
-                ai_reasoning = "No reasoning provided"
-                ai_confidence = 0.85  # fallback
-
-                for line in raw_response.splitlines():
-                    line = line.strip()
-                    if line.startswith("ANSWER:"):
-                        ai_answer = line[len("ANSWER:"):].strip()
-                    elif line.startswith("REASONING:"):
-                        ai_reasoning = line[len("REASONING:"):].strip()
-                    elif line.startswith("CONFIDENCE:"):
-                        try:
-                            ai_confidence = float(line[len("CONFIDENCE:"):].strip())
-                        except ValueError:
-                            ai_confidence = 0.85
-
-                # Extract token usage first
+            # Initialize Groq client
+            api_key = os.getenv("GROQ_API_KEY")
+            if not api_key:
+                logger.warning("GROQ_API_KEY is not set - falling back to mock AI")
+                analysis_span.set(fallback="mock", fallback_reason="no_api_key")
+                _run_mock_ai_analysis(module, sampled_cases, db)
+                return
+            
+            client = Groq(
+                api_key=api_key,
+                base_url=settings.GROQ_BASE_URL,
+                max_retries=settings.GROQ_MAX_RETRIES,
+                http_client=_groq_http_client()
+            )
+            
+            project_context = _project_context_text(db, project.id)
+            
+            # Reply cap by answer type; prompt sizes from the model's token counter
+            counter = token_counter(groq_model)
+            reply_tokens = reply_token_cap(module.answer_type, module.answer_options)
+            
+            cost_per_token = price_per_token(ai_provider)
+            budget = RoundBudget(db, project.id, cost_per_token, reply_tokens)
+            
+            json_mode = settings.AI_JSON_MODE
+            
+            def ask(messages, prompt_tokens):
+                """
+                One chat completion within the budget; returns (reply text, tokens used).
+                Raises BudgetExceeded instead of sending a call that doesn't fit.
+                """
+                reserved = budget.reserve(prompt_tokens)
+                try:
+                    with span("provider_call", level="case", model=groq_model,
+                              max_tokens=reply_tokens, estimated_prompt_tokens=prompt_tokens) as call_span:
+                        response = client.chat.completions.create(
+                            model=groq_model,
+                            messages=messages,
+                            temperature=0.1,
+                            max_tokens=reply_tokens,
+                            **({"response_format": {"type": "json_object"}} if json_mode else {})
+                        )
+                        reply = response.choices[0].message.content or ""
+                        if response.usage:
+                            call_span.set(
+                                prompt_tokens=response.usage.prompt_tokens,
+                                completion_tokens=response.usage.completion_tokens,
+                                total_tokens=response.usage.total_tokens
+                            )
+                        call_span.debug(raw_response=reply)
+                except Exception:
+                    budget.release(reserved)
+                    raise
                 tokens_used = response.usage.total_tokens if response.usage else 0
-
-                # Cost calculation
-                if "8b" in ai_provider:
-                    cost_per_token = 0.00000027
-                else:
-                    cost_per_token = 0.00000059
-
-                cost = tokens_used * cost_per_token
+                budget.charge(reserved, tokens_used)
+                if response.usage:
+                    counter.observe("\n".join(m["content"] for m in messages), response.usage.prompt_tokens)
+                return reply, tokens_used
+            
+            def parse(reply):
+                with span("parse", level="case") as parse_span:
+                    parsed = parse_reply(reply, module.answer_type, module.answer_options)
+                    parse_span.set(format=parsed.format, ok=parsed.ok)
+                    if not parsed.ok:
+                        parse_span.set(parse_error=parsed.error)
+                return parsed
+            
+            def store(case, ai_answer, ai_reasoning, ai_confidence, tokens_used):
+                with span("db_write", level="case"):
+                    db.add(AIAnalysis(
+                        module_id=module.id,
+                        case_id=case.id,
+                        ai_answer=ai_answer,
+                        ai_reasoning=ai_reasoning,
+                        ai_confidence=ai_confidence,
+                        ai_round=module.ai_round,
+                        model_used=groq_model,
+                        tokens_used=tokens_used,
+                        cost=tokens_used * cost_per_token
+                    ))
+            
+            total_tokens = 0
+            failed_cases = 0
+            # Replies that couldn't be parsed: [case, messages so far, last reply, parsed, tokens]
+            reask_queue = []
+            # Why dispatch stopped, once the budget is reached
+            budget_halt = None
+            
+            # Usage is charged on another connection; lazy loads in between
+            # mustn't flush (and write-lock) pending rows while calls are in flight
+            with db.no_autoflush:
+                # Process each case
+                for case in sampled_cases:
+                    if budget_halt:
+                        failed_cases += 1
+                        store(case, "ERROR", f"Budget limit reached: {budget_halt}", 0.0, 0)
+                        continue
+                    with span("case", level="case", case_id=case.id) as case_span:
+                        try:
+                            with span("prompt_build", level="case") as prompt_span:
+                                # Pick the feedback examples most relevant to this case
+                                feedback_examples = feedback_selector.select(case) if feedback_selector else None
+                                
+                                # Build the prompt: as much of the opinion as the token allowance takes
+                                prompt_parts = dict(
+                                    question=module.question_text,
+                                    answer_type=module.answer_type,
+                                    answer_options=module.answer_options,
+                                    project_context=project_context,
+                                    module_context=module.module_context,
+                                    feedback_examples=feedback_examples,
+                                    json_mode=json_mode
+                                )
+                                template_tokens = counter.count(_build_llama_prompt(case_text="", **prompt_parts))
+                                opinion = counter.truncate(
+                                    case.opinion_text or "", counter.opinion_allowance(template_tokens, reply_tokens)
+                                )
+                                prompt = _build_llama_prompt(case_text=opinion, **prompt_parts)
+                                prompt_tokens = template_tokens + counter.count(opinion)
+                                prompt_span.set(
+                                    prompt_chars=len(prompt),
+                                    prompt_tokens=prompt_tokens,
+                                    opinion_truncated=len(opinion) < len(case.opinion_text or ""),
+                                    feedback_examples=len(feedback_examples) if feedback_examples else 0
+                                )
+                            
+                            messages = [{"role": "user", "content": prompt}]
+                            reply, tokens_used = ask(messages, prompt_tokens)
+                            total_tokens += tokens_used
+                            parsed = parse(reply)
+                            
+                            if parsed.ok:
+                                store(case, parsed.answer, parsed.reasoning, parsed.confidence, tokens_used)
+                            else:
+                                # Not stored: re-asked below with the parse error
+                                reask_queue.append([case, messages, reply, parsed, tokens_used])
+                                case_span.set(reask=True)
+                            case_span.set(tokens=tokens_used)
+                            
+                        except BudgetExceeded as e:
+                            logger.warning("Module %s: AI dispatch halted - %s", module.id, e)
+                            case_span.record_error(e)
+                            budget_halt = str(e)
+                            failed_cases += 1
+                            store(case, "ERROR", f"Budget limit reached: {budget_halt}", 0.0, 0)
+                            
+                        except Exception as e:
+                            # Handle errors for individual cases
+                            logger.warning("Groq analysis failed for case %s: %s: %s", case.id, type(e).__name__, e)
+                            case_span.record_error(e)
+                            failed_cases += 1
+                            
+                            # Create error record
+                            store(case, "ERROR", f"Groq API error: {str(e)}", 0.0, 0)
                 
-                # Create AI analysis record
-                ai_analysis = AIAnalysis(
-                    module_id=module.id,
-                    case_id=case.id,
-                    ai_answer=ai_answer,
-                    ai_reasoning=ai_reasoning,
-                    ai_confidence=ai_confidence,   
-                    ai_round=module.ai_round,
-                    model_used=groq_model,
-                    tokens_used=tokens_used,
-                    cost=cost
-                )
-                db.add(ai_analysis)
-                print(f"✅ DEBUG: AI analysis record created for case {case.id}")
+                # Targeted re-ask: only the cases whose reply couldn't be parsed,
+                # continuing their conversation with what was wrong
+                for attempt in range(1, settings.AI_REASK_ATTEMPTS + 1):
+                    if not reask_queue:
+                        break
+                    still_failing = []
+                    for item in reask_queue:
+                        case, messages, reply, parsed, tokens_used = item
+                        if budget_halt:
+                            still_failing.append(item)
+                            continue
+                        with span("reask", level="case", case_id=case.id, attempt=attempt) as reask_span:
+                            messages = messages + [
+                                {"role": "assistant", "content": reply},
+                                {"role": "user", "content": _reask_instruction(parsed.error, module.answer_type,
+                                                                               module.answer_options, json_mode)}
+                            ]
+                            try:
+                                reply, reask_tokens = ask(messages, counter.count_messages(messages))
+                            except BudgetExceeded as e:
+                                reask_span.record_error(e)
+                                budget_halt = str(e)
+                                still_failing.append(item)
+                                continue
+                            except Exception as e:
+                                reask_span.record_error(e)
+                                still_failing.append(item)
+                                continue
+                            total_tokens += reask_tokens
+                            tokens_used += reask_tokens
+                            parsed = parse(reply)
+                            reask_span.set(ok=parsed.ok)
+                            if parsed.ok:
+                                store(case, parsed.answer, parsed.reasoning, parsed.confidence, tokens_used)
+                            else:
+                                still_failing.append([case, messages, reply, parsed, tokens_used])
+                    reask_queue = still_failing
                 
-            except Exception as e:
-                # Handle errors for individual cases
-                print(f"❌ ERROR processing case {case.id}: {str(e)}")
-                print(f"❌ Error type: {type(e).__name__}")
-                import traceback
-                traceback.print_exc()
+                # Still unreadable after re-asking: stored as errors for review
+                for case, messages, reply, parsed, tokens_used in reask_queue:
+                    failed_cases += 1
+                    store(case, "ERROR", f"Unparseable reply ({parsed.error}): {reply[:500]}", 0.0, tokens_used)
                 
-                # Create error record
-                ai_analysis = AIAnalysis(
-                    module_id=module.id,
-                    case_id=case.id,
-                    ai_answer="ERROR",
-                    ai_reasoning=f"Groq API error: {str(e)}",
-                    ai_confidence=0.0,
-                    ai_round=module.ai_round,
-                    model_used=groq_model,
-                    tokens_used=0,
-                    cost=0.0
-                )
-                db.add(ai_analysis)
-        
-        # Commit all analyses
-        print(f"🔍 DEBUG: Committing {len(sampled_cases)} AI analyses to database...")
-        db.commit()
-        print(f"✅ DEBUG: All AI analyses committed successfully")
+            # Record which feedback examples were used
+            if feedback_selector:
+                feedback_selector.record_usage()
+            
+            # Commit all analyses
+            with span("db_commit", cases=len(sampled_cases)):
+                db.commit()
+            
+            analysis_span.set(total_tokens=total_tokens, failed_cases=failed_cases,
+                              cost=round(budget.cost, 6), budget_halted=bool(budget_halt),
+                              max_tokens=reply_tokens, exact_token_counts=counter.exact,
+                              chars_per_token=round(counter.chars_per_token, 3))
         
-    except Exception as e:
+    except Exception:
         # Handle function-level errors
-        print(f"❌ ERROR in _run_groq_ai_analysis: {str(e)}")
-        print(f"❌ Error type: {type(e).__name__}")
-        import traceback
-        traceback.print_exc()
-        print("❌ Falling back to mock AI due to error")
+        logger.exception("Groq analysis failed - falling back to mock AI")
+        db.rollback()  # drop this round's pending analyses; mock replaces them all
         _run_mock_ai_analysis(module, sampled_cases, db)
 
 
+# Confidence scale shown in both reply formats
+CONFIDENCE_CRITERIA = """  0.90-1.00 = answer is explicitly and unambiguously stated in the opinion
+  0.70-0.89 = answer is strongly implied but not directly stated
+  0.50-0.69 = opinion is ambiguous or answer requires significant interpretation
+  0.00-0.49 = opinion lacks sufficient information or question does not apply"""
+
+
 def _build_llama_prompt(question: str, case_text: str, answer_type: str, 
                         answer_options: list = None, project_context: str = None,
                         module_context: str = None,
-                        feedback_examples: list = None) -> str:
-    """Build a structured prompt for Llama"""
+                        feedback_examples: list = None,
+                        json_mode: bool = False) -> str:
+    """Build a structured prompt for Llama (JSON reply format when json_mode)"""
     
     prompt_parts = []
     
@@ -1080,89 +1376,125 @@ def _build_llama_prompt(question: str, case_text: str, answer_type: str,
     else:
         prompt_parts.append("ANSWER FORMAT: Provide a brief, direct answer.\n")
     
-    # Add the case text (limit to avoid token limits)
-    prompt_parts.append(f"COURT OPINION:\n{case_text[:4000]}\n")
+    # Add the case text (callers fit it to the model's token allowance)
+    prompt_parts.append(f"COURT OPINION:\n{case_text}\n")
     
     # Final instruction
-    prompt_parts.append("""Based on the court opinion above, answer the question.
+    if json_mode:
+        prompt_parts.append(f"""Based on the court opinion above, answer the question.
+You MUST respond with only a JSON object with exactly these keys:
+{{"answer": "your answer", "reasoning": "2-4 sentences explaining why, citing specific parts of the opinion", "confidence": 0.0}}
+confidence is a number between 0.0 and 1.0 based on these criteria:
+{CONFIDENCE_CRITERIA}""")
+    else:
+        prompt_parts.append(f"""Based on the court opinion above, answer the question.
 You MUST respond in exactly this format and nothing else:
 ANSWER: [your answer here]
 REASONING: [2-4 sentences explaining why, citing specific parts of the opinion]
 CONFIDENCE: [a number between 0.0 and 1.0 based on these criteria:
-  0.90-1.00 = answer is explicitly and unambiguously stated in the opinion
-  0.70-0.89 = answer is strongly implied but not directly stated
-  0.50-0.69 = opinion is ambiguous or answer requires significant interpretation
-  0.00-0.49 = opinion lacks sufficient information or question does not apply]""")
+{CONFIDENCE_CRITERIA}]""")
     
     return "\n".join(prompt_parts)
 
 
+def _reask_instruction(parse_error: str, answer_type: str, answer_options: list = None,
+                       json_mode: bool = False) -> str:
+    """Follow-up message asking the model to restate an unreadable reply."""
+    if answer_type == "yes_no":
+        expected = "'Yes' or 'No'"
+    elif answer_type == "multiple_choice" and answer_options:
+        expected = "exactly one of: " + ", ".join(answer_options)
+    elif answer_type == "integer":
+        expected = "a single whole number"
+    elif answer_type == "date":
+        expected = "a date in YYYY-MM-DD format"
+    else:
+        expected = "a brief, direct answer"
+    
+    if json_mode:
+        reply_format = 'a JSON object with the keys "answer", "reasoning" and "confidence"'
+    else:
+        reply_format = "the ANSWER / REASONING / CONFIDENCE format"
+    return (f"Your reply could not be read: {parse_error}. "
+            f"Reply again in {reply_format} and nothing else. The answer must be {expected}.")
+
+
 @router.get("/modules/{module_id}/validation-cases")
-def get_validation_cases(
+async def get_validation_cases(
     module_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get all cases assigned to validator for this module with AI analyses.
     Includes validation status.
+    
+    Each case comes with the AI analysis and sample order of its assignment's
+    round, all loaded in one joined query.
     """
     if current_user.role.value != "validator":
         raise HTTPException(status_code=403, detail="Only validators can access this endpoint")
     
     # Get module
-    module = db.query(VerificationModule).filter(VerificationModule.id == module_id).first()
+    module = await db.get(VerificationModule, module_id)
     if not module:
         raise HTTPException(status_code=404, detail="Module not found")
     
     # Verify this validator is assigned to this module
-    assignment_check = db.query(ValidatorAssignment).filter(
-        ValidatorAssignment.module_id == module_id,
-        ValidatorAssignment.validator_id == current_user.id
-    ).first()
+    assignment_check = (await db.execute(
+        select(ValidatorAssignment.id).where(
+            ValidatorAssignment.module_id == module_id,
+            ValidatorAssignment.validator_id == current_user.id
+        ).limit(1)
+    )).first()
     
     if not assignment_check:
         raise HTTPException(status_code=403, detail="You are not assigned to this module")
     
-    # Get all assignments for this validator in this module
-    assignments = db.query(ValidatorAssignment).filter(
-        ValidatorAssignment.module_id == module_id,
-        ValidatorAssignment.validator_id == current_user.id
-    ).all()
+    # All case assignments with case, AI analysis, validation and sample order
+    # (module-level assignments without a case drop out of the inner join)
+    rows = (await db.execute(
+        select(
+            CourtCase,
+            AIAnalysis,
+            ValidationFeedback,
+            ModuleCaseSample.sample_order
+        ).select_from(
+            ValidatorAssignment
+        ).join(
+            CourtCase, CourtCase.id == ValidatorAssignment.case_id
+        ).outerjoin(
+            AIAnalysis,
+            and_(
+                AIAnalysis.module_id == module_id,
+                AIAnalysis.case_id == ValidatorAssignment.case_id,
+                AIAnalysis.ai_round == ValidatorAssignment.round
+            )
+        ).outerjoin(
+            ValidationFeedback,
+            ValidationFeedback.assignment_id == ValidatorAssignment.id
+        ).outerjoin(
+            ModuleCaseSample,
+            and_(
+                ModuleCaseSample.module_id == module_id,
+                ModuleCaseSample.case_id == ValidatorAssignment.case_id,
+                ModuleCaseSample.round == ValidatorAssignment.round
+            )
+        ).where(
+            ValidatorAssignment.module_id == module_id,
+            ValidatorAssignment.validator_id == current_user.id
+        ).order_by(ValidatorAssignment.id)
+    )).all()
     
     result = []
-    for assignment in assignments:
-        # Get case
-        case = db.query(CourtCase).filter(CourtCase.id == assignment.case_id).first()
-        
-        # Null Check
-        if not case:
-            continue  # Skip if case doesn't exist
-        
-        # Get AI analysis
-        ai_analysis = db.query(AIAnalysis).filter(
-            AIAnalysis.module_id == module_id,
-            AIAnalysis.case_id == assignment.case_id
-        ).first()
-        
-        # Get validation through assignment relationship
-        validation = db.query(ValidationFeedback).filter(
-            ValidationFeedback.assignment_id == assignment.id
-        ).first()
-        
-        # Get sample order
-        sample = db.query(ModuleCaseSample).filter(
-            ModuleCaseSample.module_id == module_id,
-            ModuleCaseSample.case_id == assignment.case_id
-        ).first()
-        
+    for case, ai_analysis, validation, sample_order in rows:
         case_data = {
             "case_id": case.id,
             "case_name": case.case_name,
             "court": case.court,
             "case_date": case.case_date,
             "state": case.state,
-            "sample_order": sample.sample_order if sample else None,
+            "sample_order": sample_order,
             # Additional fields validators might want to see
             "docket_number": case.docket_number,
             "judges_names": case.judges_names,
@@ -1240,7 +1572,7 @@ def submit_validation(
         existing.validator_correction = corrected_answer
         existing.validator_reasoning = validator_reasoning
         existing.validator_notes = validator_notes
-        existing.submitted_at = func.now()
+        existing.submitted_at = datetime.utcnow()  # sub-second: results ETags track edits
         db.commit()
         
         return {
@@ -1278,6 +1610,109 @@ def submit_validation(
         }
     
 
+@router.post("/modules/{module_id}/validations/bulk")
+def submit_validations_bulk(
+    module_id: int,
+    request: BulkValidationRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Submit or update many validations for the module's current round at once.
+    All rows are upserted in one transaction: if any case is not assigned to
+    this validator or has no AI analysis, nothing is saved.
+    """
+    if current_user.role.value != "validator":
+        raise HTTPException(status_code=403, detail="Only validators can submit validations")
+    
+    module = db.query(VerificationModule).filter(VerificationModule.id == module_id).first()
+    if not module:
+        raise HTTPException(status_code=404, detail="Module not found")
+    
+    # Last entry wins if a case appears twice
+    items_by_case = {item.case_id: item for item in request.validations}
+    case_ids = list(items_by_case)
+    
+    # Set query 1: this validator's assignments for these cases (+ existing validation, if any)
+    assignment_rows = db.query(
+        ValidatorAssignment.id,
+        ValidatorAssignment.case_id,
+        ValidationFeedback.id
+    ).outerjoin(
+        ValidationFeedback,
+        ValidationFeedback.assignment_id == ValidatorAssignment.id
+    ).filter(
+        ValidatorAssignment.module_id == module_id,
+        ValidatorAssignment.validator_id == current_user.id,
+        ValidatorAssignment.round == module.ai_round,
+        ValidatorAssignment.case_id.in_(case_ids)
+    ).all()
+    
+    assignment_by_case = {case_id: assignment_id for assignment_id, case_id, _ in assignment_rows}
+    unassigned = sorted(set(case_ids) - set(assignment_by_case))
+    if unassigned:
+        raise HTTPException(
+            status_code=403,
+            detail=f"You are not assigned to validate case(s): {unassigned}"
+        )
+    
+    # Set query 2: AI analyses for these cases in this round
+    analysis_by_case = dict(db.query(
+        AIAnalysis.case_id,
+        AIAnalysis.id
+    ).filter(
+        AIAnalysis.module_id == module_id,
+        AIAnalysis.ai_round == module.ai_round,
+        AIAnalysis.case_id.in_(case_ids)
+    ).all())
+    
+    missing_analyses = sorted(set(case_ids) - set(analysis_by_case))
+    if missing_analyses:
+        raise HTTPException(
+            status_code=404,
+            detail=f"AI analysis not found for case(s): {missing_analyses}"
+        )
+    
+    # Upsert every validation in one statement (keyed on assignment_id)
+    submitted_at = datetime.utcnow()
+    rows = [
+        {
+            "assignment_id": assignment_by_case[case_id],
+            "ai_analysis_id": analysis_by_case[case_id],
+            "round": module.ai_round,
+            "is_correct": item.is_correct,
+            "validator_correction": item.corrected_answer,
+            "validator_reasoning": item.validator_reasoning,
+            "validator_notes": item.validator_notes,
+            "submitted_at": submitted_at,
+        }
+        for case_id, item in items_by_case.items()
+    ]
+    insert_stmt = dialect_insert(db, ValidationFeedback).values(rows)
+    upsert_stmt = insert_stmt.on_conflict_do_update(
+        index_elements=["assignment_id"],
+        set_={
+            "is_correct": insert_stmt.excluded.is_correct,
+            "validator_correction": insert_stmt.excluded.validator_correction,
+            "validator_reasoning": insert_stmt.excluded.validator_reasoning,
+            "validator_notes": insert_stmt.excluded.validator_notes,
+            "submitted_at": insert_stmt.excluded.submitted_at,
+        }
+    )
+    db.execute(upsert_stmt)
+    db.commit()
+    
+    updated = sum(1 for _, _, validation_id in assignment_rows if validation_id is not None)
+    
+    return {
+        "success": True,
+        "message": f"{len(rows)} validations saved",
+        "submitted": len(rows),
+        "created": len(rows) - updated,
+        "updated": updated
+    }
+
+
 @router.post("/modules/{module_id}/submit-validation")
 def submit_all_validations(
     module_id: int,
@@ -1358,7 +1793,7 @@ def submit_all_validations(
 @router.get("/modules/{module_id}/validation-summary")
 def get_validation_summary(
     module_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -1518,6 +1953,93 @@ def get_corrections_for_review(
     return result
 
 
+@router.get("/modules/{module_id}/corrections/{validation_id}/similar-cases")
+def get_cases_similar_to_correction(
+    module_id: int,
+    validation_id: int,
+    k: int = Query(20, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Find project cases most similar to the case behind a correction.
+    
+    Uses the project's embedding index (cosine similarity of opinion text).
+    Cases already sampled for this module are left out, so the result is a
+    list of candidates where the AI is likely to make the same mistake.
+    """
+    # Get module
+    module = db.query(VerificationModule).filter(VerificationModule.id == module_id).first()
+    if not module:
+        raise HTTPException(status_code=404, detail="Module not found")
+    
+    # Check permissions
+    project = db.query(Project).filter(Project.id == module.project_id).first()
+    if current_user.role.value == "scholar" and project.scholar_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    elif current_user.role.value not in ["scholar", "admin"]:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    row = db.query(ValidatorAssignment.case_id).join(
+        ValidationFeedback,
+        ValidationFeedback.assignment_id == ValidatorAssignment.id
+    ).filter(
+        ValidatorAssignment.module_id == module_id,
+        ValidationFeedback.id == validation_id
+    ).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Validation not found in this module")
+    case_id = row.case_id
+    
+    index = load_embedding_index(module.project_id)
+    if index is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Embedding index is not built for this project"
+        )
+    if case_id not in index:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Case is not in the embedding index yet; rebuild the index"
+        )
+    
+    sampled_ids = [
+        sampled_id for (sampled_id,) in db.query(ModuleCaseSample.case_id).filter(
+            ModuleCaseSample.module_id == module_id
+        ).all()
+    ]
+    neighbours = index.most_similar(index.vector(case_id), k=k, exclude=[case_id, *sampled_ids])
+    
+    cases_by_id = {
+        case.id: case
+        for case in db.query(*METADATA_COLUMNS).filter(
+            CourtCase.id.in_([neighbour_id for neighbour_id, _ in neighbours])
+        ).all()
+    }
+    
+    results = []
+    for neighbour_id, score in neighbours:
+        case = cases_by_id.get(neighbour_id)
+        if case is None:
+            continue  # Deleted since the index was built
+        results.append({
+            "case_id": case.id,
+            "case_name": case.case_name,
+            "court": case.court,
+            "case_date": str(case.case_date)[:10] if case.case_date else None,
+            "state": case.state,
+            "score": score
+        })
+    
+    return {
+        "module_id": module_id,
+        "validation_id": validation_id,
+        "case_id": case_id,
+        "count": len(results),
+        "results": results
+    }
+
+
 @router.post("/modules/{module_id}/review-correction")
 def review_correction(
     module_id: int,
@@ -1545,72 +2067,143 @@ def review_correction(
     elif current_user.role.value not in ["scholar", "admin"]:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    # Get validation
-    validation = db.query(ValidationFeedback).filter(
-        ValidationFeedback.id == validation_id
-    ).first()
+    summary = _apply_correction_reviews(db, module, [request])
+
+    return {
+        "success": True,
+        "validation_id": validation_id,
+        "approved": approve,
+        "added_to_feedback_library": approve,
+        "corrections_reviewed": summary["corrections_reviewed"]
+    }
+
+
+@router.post("/modules/{module_id}/review-corrections")
+def review_corrections_batch(
+    module_id: int,
+    request: BatchReviewCorrectionsRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Scholar approves or rejects many corrections in one request.
+    All decisions are applied in one transaction: if any validation is not
+    part of this module, nothing is changed.
+    Approved corrections are added to the feedback library for Round 2.
+    """
+    # Get module
+    module = db.query(VerificationModule).filter(VerificationModule.id == module_id).first()
+    if not module:
+        raise HTTPException(status_code=404, detail="Module not found")
     
-    if not validation:
-        raise HTTPException(status_code=404, detail="Validation not found")
+    # Check permissions
+    project = db.query(Project).filter(Project.id == module.project_id).first()
+    if current_user.role.value == "scholar" and project.scholar_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    elif current_user.role.value not in ["scholar", "admin"]:
+        raise HTTPException(status_code=403, detail="Not authorized")
     
-    # Update validation with scholar review
-    validation.scholar_reviewed = True
-    validation.scholar_approved = approve
-    validation.scholar_notes = scholar_notes
-    validation.reviewed_at = func.now()
+    summary = _apply_correction_reviews(db, module, request.decisions)
     
-    # If approved, add to feedback library
-    if approve:
-        # Get assignment and AI analysis for context
-        assignment = db.query(ValidatorAssignment).filter(
-            ValidatorAssignment.id == validation.assignment_id
-        ).first()
-        
-        ai_analysis = db.query(AIAnalysis).filter(
-            AIAnalysis.module_id == module_id,
-            AIAnalysis.case_id == assignment.case_id
-        ).first()
-        
-        # Check if already in feedback library (check by case + module)
-        existing_feedback = db.query(FeedbackLibrary).filter(
-            FeedbackLibrary.module_id == module_id,
-            FeedbackLibrary.example_case_id == assignment.case_id
-        ).first()
-        
-        if not existing_feedback:
-            # Create feedback library entry with correct field names
-            feedback = FeedbackLibrary(
-                module_id=module_id,
-                question_text=module.question_text,
-                wrong_answer=ai_analysis.ai_answer if ai_analysis else None,
-                correct_answer=validation.validator_correction,
-                correction_reason=validation.validator_reasoning,
-                example_case_id=assignment.case_id,
-                helped_improve=None  # Will be evaluated in Round 2
-            )
-            db.add(feedback)
- 
-    db.commit()
+    return {
+        "success": True,
+        **summary
+    }
+
 
-    # Check if all corrections are now reviewed — if so, mark module as corrections_reviewed
+def _apply_correction_reviews(db: Session, module: VerificationModule,
+                              decisions: List[ReviewCorrectionRequest]) -> dict:
+    """
+    Apply scholar review decisions to validations of one module and commit.
+
+    Uses a fixed number of queries regardless of how many decisions there are:
+    one to load the validations (with case and AI answer), one pending count,
+    one batched UPDATE flush and one multi-row feedback library INSERT.
+    """
+    # Last decision wins if a validation appears twice
+    decisions_by_id = {d.validation_id: d for d in decisions}
+
+    rows = db.query(
+        ValidationFeedback,
+        ValidatorAssignment.case_id,
+        AIAnalysis.ai_answer
+    ).join(
+        ValidatorAssignment,
+        ValidationFeedback.assignment_id == ValidatorAssignment.id
+    ).outerjoin(
+        AIAnalysis,
+        ValidationFeedback.ai_analysis_id == AIAnalysis.id
+    ).filter(
+        ValidatorAssignment.module_id == module.id,
+        ValidationFeedback.id.in_(list(decisions_by_id))
+    ).all()
+
+    missing = sorted(set(decisions_by_id) - {validation.id for validation, _, _ in rows})
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Validation(s) not found in this module: {missing}"
+        )
+
+    # Pending corrections before this batch; updated incrementally below
     pending_corrections = db.query(ValidationFeedback).join(
         ValidatorAssignment,
         ValidationFeedback.assignment_id == ValidatorAssignment.id
     ).filter(
-        ValidatorAssignment.module_id == module_id,
+        ValidatorAssignment.module_id == module.id,
         ValidationFeedback.is_correct == False,
         ValidationFeedback.scholar_reviewed == False
     ).count()
 
+    reviewed_at = datetime.utcnow()
+    library_entries = []
+    approved_count = 0
+
+    for validation, case_id, ai_answer in rows:
+        decision = decisions_by_id[validation.id]
+
+        if validation.is_correct == False and not validation.scholar_reviewed:
+            pending_corrections -= 1
+
+        # Update validation with scholar review
+        validation.scholar_reviewed = True
+        validation.scholar_approved = decision.approve
+        validation.scholar_notes = decision.scholar_notes
+        validation.reviewed_at = reviewed_at
+
+        if decision.approve:
+            approved_count += 1
+            library_entries.append({
+                "module_id": module.id,
+                "question_text": module.question_text,
+                "wrong_answer": ai_answer,
+                "correct_answer": validation.validator_correction,
+                "correction_reason": validation.validator_reasoning,
+                "example_case_id": case_id,
+                "added_at": reviewed_at,
+                "times_referenced": 0,
+                "helped_improve": None  # Will be evaluated in Round 2
+            })
+
+    # Add approved corrections to the feedback library (one entry per case + module)
+    if library_entries:
+        db.execute(
+            dialect_insert(db, FeedbackLibrary).values(library_entries).on_conflict_do_nothing(
+                index_elements=["module_id", "example_case_id"]
+            )
+        )
+
+    # All corrections reviewed — mark module as corrections_reviewed
     if pending_corrections == 0:
         module.status = "corrections_reviewed"
-        db.commit()
+
+    db.commit()
 
     return {
-        "success": True,
-        "validation_id": validation_id,
-        "approved": approve,
-        "added_to_feedback_library": approve,
+        "reviewed_count": len(rows),
+        "approved_count": approved_count,
+        "rejected_count": len(rows) - approved_count,
+        "corrections_pending": pending_corrections,
         "corrections_reviewed": pending_corrections == 0
     }
 
@@ -1623,6 +2216,8 @@ def trust_validator_bulk_approve(
 ):
     """
     Scholar trusts validator - bulk approve all pending corrections.
+    Set-based and idempotent: calling it again approves nothing new and
+    never duplicates feedback library entries.
     """
     # Get module
     module = db.query(VerificationModule).filter(VerificationModule.id == module_id).first()
@@ -1636,47 +2231,49 @@ def trust_validator_bulk_approve(
     elif current_user.role.value not in ["scholar", "admin"]:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    # Get all unreviewed corrections
-    validations = db.query(ValidationFeedback).join(
+    # Pending corrections for this module (incorrect and not yet reviewed)
+    pending = db.query(ValidationFeedback).join(
         ValidatorAssignment,
         ValidationFeedback.assignment_id == ValidatorAssignment.id
     ).filter(
         ValidatorAssignment.module_id == module_id,
         ValidationFeedback.is_correct == False,
         ValidationFeedback.scholar_reviewed == False
-    ).all()
-    
-    count = 0
-    from app.models import FeedbackLibrary
-    
-    for validation in validations:
-        # Mark as reviewed and approved
-        validation.scholar_reviewed = True
-        validation.scholar_approved = True
-        validation.scholar_notes = "Auto-approved via Trust Validator"
-        validation.reviewed_at = func.now()
-        
-        # Add to feedback library
-        assignment = db.query(ValidatorAssignment).filter(
-            ValidatorAssignment.id == validation.assignment_id
-        ).first()
-        
-        ai_analysis = db.query(AIAnalysis).filter(
-            AIAnalysis.module_id == module_id,
-            AIAnalysis.case_id == assignment.case_id
-        ).first()
-        
-        feedback = FeedbackLibrary(
-            module_id=module_id,
-            question_text=module.question_text,
-            wrong_answer=ai_analysis.ai_answer if ai_analysis else None,
-            correct_answer=validation.validator_correction,
-            correction_reason=validation.validator_reasoning,
-            example_case_id=assignment.case_id,
-            helped_improve=None
-        )
-        db.add(feedback)
-        count += 1
+    )
+
+    # Copy every pending correction into the feedback library in one INSERT...SELECT.
+    # Cases already in the library are skipped by the (module_id, example_case_id) constraint.
+    library_rows = pending.outerjoin(
+        AIAnalysis,
+        ValidationFeedback.ai_analysis_id == AIAnalysis.id
+    ).with_entities(
+        literal(module_id),
+        literal(module.question_text),
+        AIAnalysis.ai_answer,
+        ValidationFeedback.validator_correction,
+        ValidationFeedback.validator_reasoning,
+        ValidatorAssignment.case_id,
+        literal(datetime.utcnow()),
+        literal(0)
+    )
+    insert_feedback = dialect_insert(db, FeedbackLibrary).from_select(
+        [
+            "module_id", "question_text", "wrong_answer", "correct_answer",
+            "correction_reason", "example_case_id", "added_at", "times_referenced"
+        ],
+        library_rows
+    ).on_conflict_do_nothing(index_elements=["module_id", "example_case_id"])
+    db.execute(insert_feedback)
+
+    # Mark all pending corrections as reviewed and approved in one UPDATE
+    count = db.query(ValidationFeedback).filter(
+        ValidationFeedback.id.in_(pending.with_entities(ValidationFeedback.id))
+    ).update({
+        ValidationFeedback.scholar_reviewed: True,
+        ValidationFeedback.scholar_approved: True,
+        ValidationFeedback.scholar_notes: "Auto-approved via Trust Validator",
+        ValidationFeedback.reviewed_at: func.now()
+    }, synchronize_session=False)
     
     # All corrections reviewed — mark module as corrections_reviewed
     module.status = "corrections_reviewed"
@@ -1689,46 +2286,96 @@ def trust_validator_bulk_approve(
     }
 
 @router.get("/modules/{module_id}/results")
-def get_module_results(
+async def get_module_results(
     module_id: int,
-    round: int = 1,
-    db: Session = Depends(get_db),
+    response: Response,
+    round_number: int = Query(1, alias="round"),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get validation results and analytics for a module round.
     Used by scholars to decide whether to trust AI and proceed.
+    
+    The ?round= query parameter is read into round_number so the builtin
+    round() stays usable below.
+
+    For closed rounds the ETag is a watermark of the round's analyses and
+    the module's validations (304 while it matches), and results are served
+    from the in-process results cache until the watermark moves.
     """
     # Get module
-    module = db.query(VerificationModule).filter(VerificationModule.id == module_id).first()
+    module = await db.get(VerificationModule, module_id)
     if not module:
         raise HTTPException(status_code=404, detail="Module not found")
 
     # Check permissions
-    project = db.query(Project).filter(Project.id == module.project_id).first()
+    project = await db.get(Project, module.project_id)
     if current_user.role.value == "scholar" and project.scholar_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
     elif current_user.role.value not in ["scholar", "admin"]:
         raise HTTPException(status_code=403, detail="Not authorized")
 
+    # Closed rounds (a later round exists or the module is completed) only
+    # change when validations are edited: ETag + cached results
+    round_closed = round_number < (module.ai_round or 1) or module.status == "completed"
+    if round_closed:
+        analysis_version = (await db.execute(
+            select(func.count(AIAnalysis.id), func.max(AIAnalysis.id)).where(
+                AIAnalysis.module_id == module_id,
+                AIAnalysis.ai_round == round_number
+            )
+        )).one()
+        if analysis_version[0] == 0:
+            raise HTTPException(status_code=404, detail="No analyses found for this round")
+        validation_version = (await db.execute(
+            select(
+                func.count(ValidationFeedback.id),
+                func.max(ValidationFeedback.id),
+                func.max(ValidationFeedback.submitted_at),
+                func.max(ValidationFeedback.reviewed_at)
+            ).join(
+                ValidatorAssignment,
+                ValidationFeedback.assignment_id == ValidatorAssignment.id
+            ).where(
+                ValidatorAssignment.module_id == module_id
+            )
+        )).one()
+        etag = make_etag(
+            "results", module_id, round_number, module.updated_at,
+            *analysis_version, *validation_version
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        set_cache_headers(response, etag)
+        cached = results_cache.get(module_id, round_number, etag)
+        if cached is not None:
+            return cached
+
     # Get all AI analyses for this module and round
-    analyses = db.query(AIAnalysis).filter(
-        AIAnalysis.module_id == module_id,
-        AIAnalysis.ai_round == round
-    ).all()
+    analyses = (await db.execute(
+        select(AIAnalysis).where(
+            AIAnalysis.module_id == module_id,
+            AIAnalysis.ai_round == round_number
+        ).order_by(AIAnalysis.id)
+    )).scalars().all()
 
     total_cases = len(analyses)
 
     if total_cases == 0:
         raise HTTPException(status_code=404, detail="No analyses found for this round")
 
-    # Get all validations for this round
-    validations = db.query(ValidationFeedback).join(
-        ValidatorAssignment,
-        ValidationFeedback.assignment_id == ValidatorAssignment.id
-    ).filter(
-        ValidatorAssignment.module_id == module_id
-    ).all()
+    # Get all validations for this round, each with its assignment's case id
+    validation_rows = (await db.execute(
+        select(ValidationFeedback, ValidatorAssignment.case_id).join(
+            ValidatorAssignment,
+            ValidationFeedback.assignment_id == ValidatorAssignment.id
+        ).where(
+            ValidatorAssignment.module_id == module_id
+        )
+    )).all()
+    validations = [v for v, _ in validation_rows]
 
     # Basic accuracy
     ai_correct = sum(1 for v in validations if v.is_correct)
@@ -1751,11 +2398,7 @@ def get_module_results(
             and tier["min"] <= a.ai_confidence < tier["max"]
         ]
         tier_case_ids = {a.case_id for a in tier_analyses}
-        tier_validations = [v for v in validations
-            if db.query(ValidatorAssignment).filter(
-                ValidatorAssignment.id == v.assignment_id
-            ).first().case_id in tier_case_ids
-        ]
+        tier_validations = [v for v, case_id in validation_rows if case_id in tier_case_ids]
         tier_correct = sum(1 for v in tier_validations if v.is_correct)
         tier_total = len(tier_analyses)
         tier_accuracy = round((tier_correct / tier_total * 100)) if tier_total > 0 else None
@@ -1772,22 +2415,20 @@ def get_module_results(
 
     ai_answers = Counter(a.ai_answer for a in analyses if a.ai_answer)
 
+    # First analysis of this round per case
+    analysis_by_case = {}
+    for a in analyses:
+        analysis_by_case.setdefault(a.case_id, a)
+
     # Map case_id → validator correction or "correct" (kept AI answer)
     validator_answers = {}
-    for v in validations:
-        assignment = db.query(ValidatorAssignment).filter(
-            ValidatorAssignment.id == v.assignment_id
-        ).first()
-        ai_analysis = db.query(AIAnalysis).filter(
-            AIAnalysis.module_id == module_id,
-            AIAnalysis.case_id == assignment.case_id,
-            AIAnalysis.ai_round == round
-        ).first()
+    for v, case_id in validation_rows:
+        ai_analysis = analysis_by_case.get(case_id)
         if v.is_correct:
             answer = ai_analysis.ai_answer if ai_analysis else "Unknown"
         else:
             answer = v.validator_correction or "Unknown"
-        validator_answers[assignment.case_id] = answer
+        validator_answers[case_id] = answer
 
     validator_answer_counts = Counter(validator_answers.values())
 
@@ -1818,7 +2459,7 @@ def get_module_results(
         trust_level = "medium"
         recommendation = (
             f"AI accuracy is {accuracy_percentage}% overall. "
-            f"Consider running a Round {round + 1} with feedback from this round's corrections "
+            f"Consider running a Round {round_number + 1} with feedback from this round's corrections "
             f"before applying to the full corpus."
         )
     else:
@@ -1829,12 +2470,12 @@ def get_module_results(
             f"with improved guidance before applying to the full corpus."
         )
 
-    return {
+    results = {
         "module_id": module_id,
         "module_name": module.module_name,
         "question_text": module.question_text,
         "answer_type": module.answer_type,
-        "round": round,
+        "round": round_number,
         "total_rounds": module.ai_round,
         "total_cases": total_cases,
         "ai_correct": ai_correct,
@@ -1846,7 +2487,43 @@ def get_module_results(
         "recommendation": recommendation,
         "high_conf_percentage": high_conf_percentage,
         "low_conf_percentage": low_conf_percentage,
-    }  
+    }
+    if round_closed:
+        results_cache.put(module_id, round_number, etag, results)
+    return results
+
+
+@router.get("/modules/{module_id}/export")
+def export_module_results(
+    module_id: int,
+    format: str = Query("csv", pattern="^(csv|parquet)$"),
+    round_number: Optional[int] = Query(None, alias="round"),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Download a module's AI analyses with their validations and case
+    metadata as CSV or Parquet, streamed (all rounds unless ?round= is given).
+    """
+    module = db.query(VerificationModule).filter(VerificationModule.id == module_id).first()
+    if not module:
+        raise HTTPException(status_code=404, detail="Module not found")
+    
+    project = db.query(Project).filter(Project.id == module.project_id).first()
+    if current_user.role.value == "scholar" and project.scholar_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    elif current_user.role.value not in ["scholar", "admin"]:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    filename = f"project-{project.id}-module-{module.module_number}"
+    if round_number is not None:
+        filename += f"-round-{round_number}"
+    return export_response(
+        db.get_bind(),
+        export_statement(module_id=module_id, round_number=round_number),
+        format,
+        filename
+    )
 
 @router.post("/modules/{module_id}/start-new-round")
 def start_new_round(
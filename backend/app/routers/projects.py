@@ -2,15 +2,39 @@
 Project management routes - admin creates and manages projects.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import datetime, date
 
-from app.database import get_db
+from app.database import get_db, get_read_db, get_async_read_db
 from app.models import User, Project, CourtCase, VerificationModule, ProjectContext
 from app.schemas import ProjectCreate, ProjectResponse, ProjectUpdate
 from app.dependencies import require_admin, get_current_user
+from app.utils.project_queries import (
+    list_project_summaries_async,
+    get_project_summary,
+    validator_has_project_access,
+    project_to_dict
+)
+from app.utils.case_queries import browse_cases, get_case, METADATA_COLUMNS
+from app.utils.budget import budget_status
+from app.utils.exports import export_response, export_statement
+from app.utils.http_cache import etag_matches, make_etag, not_modified, set_cache_headers
+from app.utils.analytics import (
+    GROUP_BY_COLUMNS,
+    build_snapshot_task,
+    delete_snapshot,
+    ensure_snapshot,
+    group_by_report
+)
+from app.utils.search_index import search_cases, search_index_available
+from app.utils.embeddings import (
+    build_embedding_index_task,
+    delete_embedding_index,
+    load_embedding_index
+)
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
@@ -71,10 +95,12 @@ def create_project(
 
 
 @router.get("/", response_model=List[ProjectResponse])
-def list_projects(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+async def list_projects(
+    response: Response,
+    after_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=500),
+    skip: int = Query(0, ge=0, deprecated=True),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -83,60 +109,19 @@ def list_projects(
     - Admins see all projects
     - Scholars see projects they're assigned to
     - Validators see projects with cases assigned to them
+    
+    Keyset pagination: pass the X-Next-Cursor header value of the previous
+    page as after_id to get the next page. The header is absent on the last page.
+    skip (OFFSET paging) still works but is deprecated: deep offsets get slower.
     """
-    if current_user.role.value == "admin":
-        # Admins see all projects
-        projects = db.query(Project).offset(skip).limit(limit).all()
-    elif current_user.role.value == "scholar":
-        # Scholars see their assigned projects
-        projects = db.query(Project).filter(
-            Project.scholar_id == current_user.id
-        ).offset(skip).limit(limit).all()
-    else:
-        # Validators see projects they have assignments in
-        # (We'll implement this later when assignments are built)
-        projects = []
-    
-    # Enrich projects with scholar email
-    result = []
-    for project in projects:
-        project_dict = {
-            "id": project.id,
-            "name": project.name,
-            "description": project.description,
-            "admin_id": project.admin_id,
-            "scholar_id": project.scholar_id,
-            "parquet_filename": project.parquet_filename,
-            "parquet_filepath": project.parquet_filepath,
-            "total_cases": project.total_cases,
-            "status": project.status,
-            "sent_to_scholar_at": project.sent_to_scholar_at,
-            "launched_at": project.launched_at,
-            "is_active": project.is_active,
-            "created_at": project.created_at,
-            "updated_at": project.updated_at,
-        }
-        
-        # Add admin email
-        admin = db.query(User).filter(User.id == project.admin_id).first()
-        if admin:
-            project_dict["admin_email"] = admin.email
-
-        # Add scholar email if scholar is assigned
-        if project.scholar_id:
-            scholar = db.query(User).filter(User.id == project.scholar_id).first()
-            if scholar:
-                project_dict["scholar_email"] = scholar.email
-        
-        # Add module count
-        module_count = db.query(VerificationModule).filter(
-            VerificationModule.project_id == project.id
-        ).count()
-        project_dict["module_count"] = module_count
-        
-        result.append(project_dict)
+    projects, next_cursor = await list_project_summaries_async(
+        db, current_user, after_id=after_id, limit=limit, skip=skip
+    )
     
-    return result
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    
+    return projects
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
@@ -150,7 +135,8 @@ def get_project(
     
     Users can only view projects they have access to.
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    # Admin and scholar users are loaded with the project
+    project = get_project_summary(db, project_id)
     
     if not project:
         raise HTTPException(
@@ -171,17 +157,7 @@ def get_project(
             )   
     elif current_user.role.value == "validator":
         # Validators can view projects where they have module assignments
-        from app.models import ValidatorAssignment, VerificationModule
-        
-        has_assignment = db.query(ValidatorAssignment).join(
-            VerificationModule,
-            ValidatorAssignment.module_id == VerificationModule.id
-        ).filter(
-            VerificationModule.project_id == project_id,
-            ValidatorAssignment.validator_id == current_user.id
-        ).first()
-        
-        if not has_assignment:
+        if not validator_has_project_access(db, project_id, current_user.id):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have access to this project"
@@ -193,36 +169,7 @@ def get_project(
             detail="You don't have access to this project"
         )
     
-    # Enrich with scholar email
-    project_dict = {
-        "id": project.id,
-        "name": project.name,
-        "description": project.description,
-        "admin_id": project.admin_id,
-        "scholar_id": project.scholar_id,
-        "parquet_filename": project.parquet_filename,
-        "parquet_filepath": project.parquet_filepath,
-        "total_cases": project.total_cases,
-        "status": project.status,
-        "sent_to_scholar_at": project.sent_to_scholar_at,
-        "launched_at": project.launched_at,
-        "is_active": project.is_active,
-        "created_at": project.created_at,
-        "updated_at": project.updated_at,
-    }
-    
-    # Add admin email
-    admin = db.query(User).filter(User.id == project.admin_id).first()
-    if admin:
-        project_dict["admin_email"] = admin.email
-
-    # Add scholar email if scholar is assigned
-    if project.scholar_id:
-        scholar = db.query(User).filter(User.id == project.scholar_id).first()
-        if scholar:
-            project_dict["scholar_email"] = scholar.email
-    
-    return project_dict
+    return project_to_dict(project)
 
 
 @router.patch("/{project_id}", response_model=ProjectResponse)
@@ -235,7 +182,8 @@ def update_project(
     """
     Update a project (Admin only).
     
-    Can update name, description, scholar assignment, or active status.
+    Can update name, description, scholar assignment, active status or AI budget limit
+    ("budget_limit": null removes the limit).
     """
     project = db.query(Project).filter(Project.id == project_id).first()
     
@@ -261,6 +209,8 @@ def update_project(
         project.scholar_id = project_data.scholar_id
     if project_data.is_active is not None:
         project.is_active = project_data.is_active
+    if "budget_limit" in project_data.model_fields_set:
+        project.budget_limit = project_data.budget_limit
     
     db.commit()
     db.refresh(project)
@@ -294,6 +244,9 @@ def delete_project(
         db.delete(project)
         db.commit()
         
+        delete_embedding_index(project_id)
+        delete_snapshot(project_id)
+        
         return None  # 204 No Content
         
     except Exception as e:
@@ -307,15 +260,27 @@ def delete_project(
 @router.get("/{project_id}/cases")
 def get_project_cases(
     project_id: int,
-    skip: int = 0,
-    limit: int = 1000,
+    response: Response,
+    after_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    include_text: bool = False,
+    court: Optional[str] = None,
+    state: Optional[str] = None,
+    election_type: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get all court cases for a project.
+    Browse court cases for a project.
     
-    Returns list of cases with all fields.
+    Returns case metadata; set include_text=true to also get opinion,
+    dissent and concurrence text. Filter by court, state, election_type
+    and an inclusive date_from/date_to range.
+    
+    Keyset pagination: pass the X-Next-Cursor header value of the previous
+    page as after_id to get the next page. The header is absent on the last page.
     """
     # Verify project exists and user has access
     project = db.query(Project).filter(Project.id == project_id).first()
@@ -325,31 +290,206 @@ def get_project_cases(
             detail=f"Project {project_id} not found"
         )
     
-    # Get cases
-    cases = db.query(CourtCase).filter(
-        CourtCase.project_id == project_id
-    ).offset(skip).limit(limit).all()
+    cases_data, next_cursor = browse_cases(
+        db,
+        project_id,
+        after_id=after_id,
+        limit=limit,
+        include_text=include_text,
+        court=court,
+        state=state,
+        election_type=election_type,
+        date_from=date_from,
+        date_to=date_to
+    )
+    
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    
+    return cases_data
+
+
+@router.get("/{project_id}/cases/{case_id}")
+def get_project_case(
+    project_id: int,
+    case_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get one court case with its opinion, dissent and concurrence text.
+    """
+    case_data = get_case(db, project_id, case_id)
+    if case_data is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Case {case_id} not found in project {project_id}"
+        )
+    
+    return case_data
+
+
+@router.get("/{project_id}/search")
+def search_project_cases(
+    project_id: int,
+    q: str = Query(..., min_length=1, max_length=500),
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Full-text search over opinion, dissent and concurrence text in a project.
+    
+    Query syntax: words are ANDed, "quoted phrases" match exactly, OR between
+    two terms matches either. Results are ranked best first, each with a
+    snippet where matches are wrapped in <mark></mark>.
+    """
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    # Verify user is the assigned scholar or admin
+    if current_user.role.value == "scholar":
+        if project.scholar_id != current_user.id:
+            raise HTTPException(status_code=403, detail="Only the assigned scholar can search this project")
+    elif current_user.role.value != "admin":
+        raise HTTPException(status_code=403, detail="Only scholars or admins can search cases")
+    
+    if not search_index_available(db):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Full-text search index is not available on this database"
+        )
+    
+    results = search_cases(db, project_id, q, limit=limit)
+    
+    return {
+        "project_id": project_id,
+        "query": q,
+        "count": len(results),
+        "results": results
+    }
+
+
+@router.get("/{project_id}/embeddings")
+def get_embedding_index_status(
+    project_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the status of the project's embedding index (used for similar-case lookups).
+    Admin or assigned scholar only.
+    """
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    if current_user.role.value == "scholar":
+        if project.scholar_id != current_user.id:
+            raise HTTPException(status_code=403, detail="Not authorized")
+    elif current_user.role.value != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    index = load_embedding_index(project_id)
     
-    # Convert to dictionaries
-    cases_data = []
-    for case in cases:
-        case_dict = {
-            "id": case.id,
+    return {
+        "project_id": project_id,
+        "built": index is not None,
+        "indexed_cases": len(index) if index is not None else 0,
+        "total_cases": project.total_cases,
+        "dimensions": index.dim if index is not None else None
+    }
+
+
+@router.post("/{project_id}/embeddings", status_code=status.HTTP_202_ACCEPTED)
+def rebuild_embedding_index(
+    project_id: int,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    (Re)build the project's embedding index in the background.
+    Admin or assigned scholar only.
+    """
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    if current_user.role.value == "scholar":
+        if project.scholar_id != current_user.id:
+            raise HTTPException(status_code=403, detail="Not authorized")
+    elif current_user.role.value != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    background_tasks.add_task(build_embedding_index_task, project_id)
+    
+    return {
+        "success": True,
+        "message": f"Building embedding index for {project.total_cases} cases"
+    }
+
+
+@router.get("/{project_id}/cases/{case_id}/similar")
+def get_similar_cases(
+    project_id: int,
+    case_id: int,
+    k: int = Query(10, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the k cases whose opinions are most similar to a case (cosine similarity
+    over the project's embedding index), best first.
+    """
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    # Verify user is the assigned scholar or admin
+    if current_user.role.value == "scholar":
+        if project.scholar_id != current_user.id:
+            raise HTTPException(status_code=403, detail="Not authorized")
+    elif current_user.role.value != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    index = load_embedding_index(project_id)
+    if index is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Embedding index is not built for this project"
+        )
+    if case_id not in index:
+        raise HTTPException(status_code=404, detail="Case not found in the embedding index")
+    
+    neighbours = index.most_similar(index.vector(case_id), k=k, exclude=[case_id])
+    cases_by_id = {
+        case.id: case
+        for case in db.query(*METADATA_COLUMNS).filter(
+            CourtCase.id.in_([neighbour_id for neighbour_id, _ in neighbours])
+        ).all()
+    }
+    
+    results = []
+    for neighbour_id, score in neighbours:
+        case = cases_by_id.get(neighbour_id)
+        if case is None:
+            continue  # Deleted since the index was built
+        results.append({
+            "case_id": case.id,
             "case_name": case.case_name,
-            "case_date": case.case_date.strftime('%Y-%m-%d') if case.case_date else None,
             "court": case.court,
-            "docket_number": case.docket_number,
-            "judges_names": case.judges_names,
-            "opinion_text": case.opinion_text,
-            "dissent_text": case.dissent_text,
-            "concur_text": case.concur_text,
-            "state": case.state,
-            "election_type": case.election_type,
-            "party_who_appointed_judge": case.party_who_appointed_judge,
-        }
-        cases_data.append(case_dict)
+            "case_date": str(case.case_date)[:10] if case.case_date else None,
+            "score": score
+        })
     
-    return cases_data
+    return {
+        "project_id": project_id,
+        "case_id": case_id,
+        "count": len(results),
+        "results": results
+    }
 
 
 @router.patch("/{project_id}/assign-scholar")
@@ -455,7 +595,7 @@ def update_ai_model(
     }
 
 @router.patch("/{project_id}/ai-provider")
-async def update_project_ai_provider(
+def update_project_ai_provider(
     project_id: int,
     ai_provider: str,
     db: Session = Depends(get_db),
@@ -501,6 +641,135 @@ async def update_project_ai_provider(
     return {"message": "AI provider updated successfully", "ai_provider": ai_provider}
 
 
+@router.get("/{project_id}/budget")
+def get_project_budget(
+    project_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    AI spend of a project: tokens and cost so far, budget limit, cost of
+    calls in flight and what is left. Admin or the assigned scholar.
+    """
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    if current_user.role.value == "scholar" and project.scholar_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    elif current_user.role.value not in ["scholar", "admin"]:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    return budget_status(db, project_id)
+
+
+@router.get("/{project_id}/export")
+def export_project_results(
+    project_id: int,
+    format: str = Query("csv", pattern="^(csv|parquet)$"),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Download every module's AI analyses in a project, with validations and
+    case metadata, as CSV or Parquet (streamed; memory use doesn't grow
+    with the corpus). Admin or the assigned scholar.
+    """
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    if current_user.role.value == "scholar" and project.scholar_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    elif current_user.role.value not in ["scholar", "admin"]:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    return export_response(db.get_bind(), export_statement(project_id=project_id), format, f"project-{project_id}")
+
+
+@router.get("/{project_id}/analytics")
+def get_project_analytics(
+    project_id: int,
+    background_tasks: BackgroundTasks,
+    group_by: List[str] = Query([]),
+    module_id: Optional[int] = None,
+    round_number: Optional[int] = Query(None, alias="round"),
+    refresh: bool = False,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Cross-module report over the project's analytics snapshot: analyses,
+    errors, validations, accuracy, confidence (ERROR analyses excluded),
+    tokens and cost per group, e.g.
+    ?group_by=court or ?group_by=module_number&group_by=state.
+    
+    Answers from the existing snapshot. If the database has changed since it
+    was built, the report is flagged stale and the snapshot is rebuilt in the
+    background; refresh=true rebuilds it first instead. A project without a
+    snapshot is built before answering. Admin or the assigned scholar.
+    """
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    if current_user.role.value == "scholar" and project.scholar_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    elif current_user.role.value not in ["scholar", "admin"]:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    invalid = [column for column in group_by if column not in GROUP_BY_COLUMNS]
+    if invalid or len(set(group_by)) != len(group_by):
+        raise HTTPException(
+            status_code=400,
+            detail=f"group_by must be distinct columns from: {', '.join(GROUP_BY_COLUMNS)}"
+        )
+    
+    snapshot = ensure_snapshot(db, project_id, refresh=refresh)
+    if snapshot["stale"]:
+        background_tasks.add_task(build_snapshot_task, project_id)
+    
+    return {
+        "project_id": project_id,
+        "group_by": group_by,
+        "snapshot": {
+            "rows": snapshot["rows"],
+            "built_at": datetime.utcfromtimestamp(snapshot["built_at"]),
+            "stale": snapshot["stale"]
+        },
+        "groups": group_by_report(project_id, group_by, module_id=module_id, round_number=round_number)
+    }
+
+
+@router.post("/{project_id}/analytics/snapshot", status_code=status.HTTP_202_ACCEPTED)
+def rebuild_analytics_snapshot(
+    project_id: int,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    (Re)build the project's analytics snapshot in the background.
+    Admin or assigned scholar only.
+    """
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    if current_user.role.value == "scholar":
+        if project.scholar_id != current_user.id:
+            raise HTTPException(status_code=403, detail="Not authorized")
+    elif current_user.role.value != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    background_tasks.add_task(build_snapshot_task, project_id)
+    
+    return {
+        "success": True,
+        "message": f"Building analytics snapshot for project {project.name}"
+    }
+
+
 @router.patch("/{project_id}/send-to-scholar")
 def send_to_scholar(
     project_id: int,
@@ -652,12 +921,15 @@ def create_or_update_project_context(
 @router.get("/{project_id}/context")
 def get_project_context(
     project_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get project context.
     Available to anyone with access to the project.
+    ETag from the context's version and updated_at.
     """
     # Verify project exists
     project = db.query(Project).filter(Project.id == project_id).first()
@@ -668,6 +940,14 @@ def get_project_context(
     context = db.query(ProjectContext).filter(
         ProjectContext.project_id == project_id
     ).first()
+
+    if context:
+        etag = make_etag("context", project_id, context.version, context.updated_at)
+    else:
+        etag = make_etag("context", project_id, 0)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
     
     if not context:
         return {
@@ -2,7 +2,7 @@
 File upload routes - handle Parquet file uploads and parsing.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File
 from sqlalchemy.orm import Session
 from pathlib import Path
 import shutil
@@ -13,6 +13,7 @@ from app.models import User, Project, CourtCase
 from app.schemas import UploadSummary
 from app.dependencies import require_admin
 from app.utils.parquet_parser import parse_parquet_file, get_parquet_info
+from app.utils.embeddings import build_embedding_index_task, delete_embedding_index
 
 router = APIRouter(prefix="/uploads", tags=["Uploads"])
 
@@ -22,8 +23,9 @@ UPLOAD_DIR.mkdir(exist_ok=True)
 
 
 @router.post("/projects/{project_id}/parquet", response_model=UploadSummary)
-async def upload_parquet(
+def upload_parquet(
     project_id: int,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin)
@@ -31,13 +33,16 @@ async def upload_parquet(
     """
     Upload a Parquet file and import court cases into a project.
     
+    A plain (sync) handler on purpose: saving, parsing and inserting all block,
+    so FastAPI runs it in the threadpool instead of on the event loop.
+    
     Steps:
     1. Verify project exists and user has access
     2. Save uploaded file
     3. Parse Parquet file
     4. Bulk insert court cases into database
     5. Update project metadata
-    6. Return summary
+    6. Return summary (the embedding index is rebuilt in the background)
     """
     # Verify project exists
     project = db.query(Project).filter(Project.id == project_id).first()
@@ -121,6 +126,8 @@ async def upload_parquet(
             detail=f"Database error: {str(e)}"
         )
     
+    background_tasks.add_task(build_embedding_index_task, project_id)
+    
     return UploadSummary(
         success=True,
         project_id=project_id,
@@ -182,6 +189,8 @@ def remove_parquet(
         
         db.commit()
         
+        delete_embedding_index(project_id)
+        
         return {
             "success": True,
             "message": f"Removed Parquet file and deleted {cases_deleted} cases"
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
-from datetime import datetime
+from datetime import datetime, date
 from typing import Optional, List
 
 # ============================================================================
@@ -67,6 +67,7 @@ class ProjectUpdate(BaseModel):
     description: Optional[str] = None
     scholar_id: Optional[int] = None
     is_active: Optional[bool] = None
+    budget_limit: Optional[float] = Field(None, ge=0)  # USD; an explicit null removes the limit
 
 
 class ProjectResponse(ProjectBase):
@@ -89,7 +90,10 @@ class ProjectResponse(ProjectBase):
     ai_model: str = "Sonnet 4.5"
     total_tokens_used: int = 0
     total_cost: float = 0.0
-    budget_limit: float = 1000.0
+    budget_limit: Optional[float] = 1000.0  # None = no spend ceiling
+
+    # Only filled in by list endpoints
+    module_count: Optional[int] = None
 
     is_active: bool = True
     created_at: datetime
@@ -136,6 +140,17 @@ class ProjectContextResponse(BaseModel):
 # VERIFICATION MODULE SCHEMAS
 # ============================================================================
 
+class SamplingFilter(BaseModel):
+    """Inclusion query restricting which cases a module samples from"""
+    text: Optional[str] = Field(None, max_length=500)  # Keywords / "quoted phrases", matched via full-text search
+    court: Optional[str] = None
+    state: Optional[str] = None
+    election_type: Optional[str] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    similar_to_corrections: Optional[bool] = None  # Only cases near the module's approved corrections (embedding index)
+    similar_k: Optional[int] = Field(None, ge=1, le=1000)  # Neighbours per correction (default 50)
+
 class VerificationModuleCreate(BaseModel):
     """Schema for creating a verification module"""
     module_name: str = Field(..., min_length=1, max_length=200)
@@ -144,6 +159,7 @@ class VerificationModuleCreate(BaseModel):
     answer_options: Optional[List[str]] = None  # Required if answer_type is "multiple_choice"
     module_context: Optional[str] = None
     sample_size: int = Field(..., gt=0, le=1000)  # Between 1 and 1000
+    inclusion_query: Optional[SamplingFilter] = None
     ai_provider: str = "ollama-8b"
 
 class VerificationModuleUpdate(BaseModel):
@@ -154,6 +170,7 @@ class VerificationModuleUpdate(BaseModel):
     answer_options: Optional[List[str]] = None
     module_context: Optional[str] = None
     sample_size: Optional[int] = Field(None, gt=0, le=1000)
+    inclusion_query: Optional[SamplingFilter] = None
 
 class VerificationModuleResponse(BaseModel):
     """Schema for verification module responses"""
@@ -166,6 +183,7 @@ class VerificationModuleResponse(BaseModel):
     answer_options: Optional[List[str]] = None
     module_context: Optional[str] = None
     sample_size: int
+    inclusion_query: Optional[SamplingFilter] = None
     ai_provider: str = "ollama-8b"
     status: str
     ai_round: int
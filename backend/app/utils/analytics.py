@@ -0,0 +1,214 @@
+"""
+Columnar analytics snapshot per project.
+
+Cross-module reports ("accuracy by court across all modules") run on a
+Parquet copy of the project's analyses instead of walking ORM rows:
+
+    {ANALYTICS_DIR}/project_{id}/snapshot.parquet   export rows (app/utils/exports.py)
+    {ANALYTICS_DIR}/project_{id}/meta.json          watermark, row count, build time
+
+The snapshot holds one row per AI analysis with its case metadata and
+validation, written by the streaming exporter (constant memory). Its
+watermark - counts and max ids/timestamps of cases, analyses and
+validations - is compared against a few aggregate queries to tell whether
+the snapshot is stale. Reports answer from the existing snapshot, flagged
+stale, while a background task (build_snapshot_task) re-exports it, so a
+busy project does not pay for a full export on every report; only a project
+without a snapshot yet is built synchronously.
+
+group_by_report() reads only the columns a report needs (with module and
+round filters pushed down to the Parquet reader) and aggregates them with
+pyarrow's vectorized group-by. A rebuild writes a new folder and swaps it
+in with two renames (replace_folder), so reports running meanwhile read
+the old or the new snapshot, never a missing one.
+"""
+
+import json
+import shutil
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models import AIAnalysis, CourtCase, ValidationFeedback, VerificationModule
+from app.utils.exports import export_statement, stream_export
+from app.utils.files import new_temp_folder, replace_folder
+
+# Columns reports can group by (case_year is derived from case_date)
+GROUP_BY_COLUMNS = [
+    "module_id", "module_number", "round", "court", "state", "election_type",
+    "party_who_appointed_judge", "case_year", "model_used", "ai_answer", "final_answer",
+]
+
+# One build at a time per project
+_build_locks: Dict[int, threading.Lock] = defaultdict(threading.Lock)
+
+
+def snapshot_dir(project_id: int) -> Path:
+    """Folder holding one project's snapshot files."""
+    return Path(settings.ANALYTICS_DIR) / f"project_{project_id}"
+
+
+def current_watermark(db: Session, project_id: int) -> dict:
+    """What the snapshot must reflect to be fresh (three aggregate queries)."""
+    cases = db.query(func.count(CourtCase.id)).filter(CourtCase.project_id == project_id).scalar()
+    analyses = db.query(func.count(AIAnalysis.id), func.max(AIAnalysis.id)).join(
+        VerificationModule, VerificationModule.id == AIAnalysis.module_id
+    ).filter(VerificationModule.project_id == project_id).one()
+    validations = db.query(
+        func.count(ValidationFeedback.id),
+        func.max(ValidationFeedback.id),
+        func.max(ValidationFeedback.submitted_at),
+        func.max(ValidationFeedback.reviewed_at)
+    ).join(
+        AIAnalysis, AIAnalysis.id == ValidationFeedback.ai_analysis_id
+    ).join(
+        VerificationModule, VerificationModule.id == AIAnalysis.module_id
+    ).filter(VerificationModule.project_id == project_id).one()
+    return {
+        "cases": cases,
+        "analyses": list(analyses),
+        "validations": [str(value) if value is not None else None for value in validations],
+    }
+
+
+def load_snapshot_meta(project_id: int) -> Optional[dict]:
+    meta_path = snapshot_dir(project_id) / "meta.json"
+    if not meta_path.exists():
+        return None
+    return json.loads(meta_path.read_text())
+
+
+def build_snapshot(db: Session, project_id: int) -> dict:
+    """(Re)write a project's snapshot; returns its metadata."""
+    with _build_locks[project_id]:
+        watermark = current_watermark(db, project_id)
+        meta = load_snapshot_meta(project_id)
+        if meta and meta["watermark"] == watermark:
+            return meta  # built by a concurrent request meanwhile
+
+        folder = snapshot_dir(project_id)
+        tmp_folder = new_temp_folder(folder)
+
+        start = time.perf_counter()
+        try:
+            with open(tmp_folder / "snapshot.parquet", "wb") as f:
+                for chunk in stream_export(db.get_bind(), export_statement(project_id=project_id), "parquet"):
+                    f.write(chunk)
+            meta = {
+                "project_id": project_id,
+                "watermark": watermark,
+                "rows": pq.read_metadata(tmp_folder / "snapshot.parquet").num_rows,
+                "built_at": time.time(),
+                "build_seconds": round(time.perf_counter() - start, 3),
+            }
+            (tmp_folder / "meta.json").write_text(json.dumps(meta))
+        except BaseException:
+            shutil.rmtree(tmp_folder, ignore_errors=True)
+            raise
+
+        # Swap in the new snapshot
+        replace_folder(tmp_folder, folder)
+        return meta
+
+
+def ensure_snapshot(db: Session, project_id: int, refresh: bool = False) -> dict:
+    """
+    Metadata of a usable snapshot. An existing one is returned as is, marked
+    "stale" if the database has moved on; it is built first only when
+    missing, or when stale and refresh=True.
+    """
+    meta = load_snapshot_meta(project_id)
+    if meta is not None and meta["watermark"] == current_watermark(db, project_id):
+        return {**meta, "stale": False}
+    if meta is not None and not refresh:
+        return {**meta, "stale": True}
+    return {**build_snapshot(db, project_id), "stale": False}
+
+
+def group_by_report(project_id: int, group_by: List[str], module_id: Optional[int] = None,
+                    round_number: Optional[int] = None) -> List[dict]:
+    """
+    Analyses, errors, validations, accuracy, mean confidence, tokens and
+    cost per group, largest groups first (one total row when group_by is
+    empty). ERROR analyses (stored with confidence 0) are counted in
+    "errors" and left out of the confidence mean.
+    """
+    source = [column for column in group_by if column != "case_year"]
+    if "case_year" in group_by:
+        source.append("case_date")
+    columns = sorted(set(source) | {"ai_analysis_id", "ai_answer", "is_correct", "ai_confidence", "tokens_used", "cost"})
+
+    filters = []
+    if module_id is not None:
+        filters.append(("module_id", "=", module_id))
+    if round_number is not None:
+        filters.append(("round", "=", round_number))
+    path = snapshot_dir(project_id) / "snapshot.parquet"
+    try:
+        table = pq.read_table(path, columns=columns, filters=filters or None, memory_map=True)
+    except FileNotFoundError:
+        # Caught between the two renames of a rebuild's swap: the new snapshot is in place now
+        table = pq.read_table(path, columns=columns, filters=filters or None, memory_map=True)
+
+    if "case_year" in group_by:
+        table = table.append_column("case_year", pc.year(table["case_date"]))
+    is_error = pc.fill_null(pc.equal(table["ai_answer"], "ERROR"), False)
+    table = table.append_column("error", pc.cast(is_error, pa.int64()))
+    table = table.append_column("confidence", pc.if_else(is_error, pa.scalar(None, pa.float64()), table["ai_confidence"]))
+    table = table.append_column("correct", pc.cast(table["is_correct"], pa.int64()))
+
+    result = table.group_by(group_by).aggregate([
+        ("ai_analysis_id", "count"),
+        ("error", "sum"),
+        ("is_correct", "count"),  # non-null only: validated analyses
+        ("correct", "sum"),
+        ("confidence", "mean"),
+        ("tokens_used", "sum"),
+        ("cost", "sum"),
+    ])
+    validated = result["is_correct_count"]
+    accuracy = pc.if_else(
+        pc.greater(validated, 0),
+        pc.divide(pc.cast(pc.fill_null(result["correct_sum"], 0), pa.float64()), pc.cast(validated, pa.float64())),
+        pa.scalar(None, pa.float64())
+    )
+    result = pa.table({
+        **{column: result[column] for column in group_by},
+        "analyses": result["ai_analysis_id_count"],
+        "errors": result["error_sum"],
+        "validated": validated,
+        "correct": pc.fill_null(result["correct_sum"], 0),
+        "accuracy": pc.round(accuracy, 4),
+        "mean_confidence": pc.round(result["confidence_mean"], 4),
+        "tokens": pc.fill_null(result["tokens_used_sum"], 0),
+        "cost": pc.round(pc.fill_null(result["cost_sum"], 0.0), 6),
+    })
+    if group_by:
+        result = result.sort_by([("analyses", "descending")] + [(column, "ascending") for column in group_by])
+    return result.to_pylist()
+
+
+def build_snapshot_task(project_id: int):
+    """Rebuild a snapshot in the background with its own database session."""
+    if _build_locks[project_id].locked():
+        return  # already being rebuilt; a later report schedules another if needed
+    db = SessionLocal()
+    try:
+        build_snapshot(db, project_id)
+    finally:
+        db.close()
+
+
+def delete_snapshot(project_id: int):
+    """Remove a project's snapshot files (e.g. when the project is deleted)."""
+    shutil.rmtree(snapshot_dir(project_id), ignore_errors=True)
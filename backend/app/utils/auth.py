@@ -5,20 +5,79 @@ This module provides:
 - Password hashing using bcrypt
 - JWT token creation and verification
 - User authentication helpers
+
+bcrypt is CPU-bound (~250 ms at 12 rounds), so hashing and verification run
+in a bounded process pool (PASSWORD_HASH_WORKERS processes) instead of on the
+request thread. The cost is set by BCRYPT_ROUNDS; hashes made with a
+different cost are flagged for re-hashing by verify_and_update_password.
 """
 
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
-# Password hashing context with updated bcrypt settings
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=12  # Explicit rounds setting
-)
+
+@lru_cache(maxsize=None)
+def get_pwd_context(rounds: int) -> CryptContext:
+    """bcrypt context where any hash not using exactly `rounds` needs an update."""
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds
+    )
+
+
+# Password hashing context with the configured bcrypt cost
+pwd_context = get_pwd_context(settings.BCRYPT_ROUNDS)
+
+# ============================================================================
+# PASSWORD HASHING POOL
+# ============================================================================
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _hash_in_worker(password: str, rounds: int) -> str:
+    return get_pwd_context(rounds).hash(password)
+
+
+def _verify_and_update_in_worker(plain_password: str, hashed_password: str,
+                                 rounds: int) -> Tuple[bool, Optional[str]]:
+    return get_pwd_context(rounds).verify_and_update(plain_password, hashed_password)
+
+
+def _run_in_pool(fn, *args):
+    """Run a bcrypt call in the worker pool (inline when PASSWORD_HASH_WORKERS is 0)."""
+    global _pool
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return fn(*args)
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+    return _pool.submit(fn, *args).result()
+
+
+def shutdown_password_pool():
+    """Stop the worker processes (called on application shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+            _pool = None
 
 # ============================================================================
 # PASSWORD HASHING
@@ -42,7 +101,7 @@ def hash_password(password: str) -> str:
     if len(password.encode('utf-8')) > 72:
         raise ValueError("Password too long (max 72 bytes)")
     
-    return pwd_context.hash(password)
+    return _run_in_pool(_hash_in_worker, password, settings.BCRYPT_ROUNDS)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -59,7 +118,34 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Example:
         is_valid = verify_password("mypassword123", stored_hash)
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    valid, _ = verify_and_update_password(plain_password, hashed_password)
+    return valid
+
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and re-hash it if the stored hash uses an outdated cost.
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password from database
+        
+    Returns:
+        (is_valid, new_hash) where new_hash is None unless the stored hash
+        should be replaced (only ever set when is_valid is True)
+        
+    Example:
+        is_valid, new_hash = verify_and_update_password("mypassword123", user.hashed_password)
+        if is_valid and new_hash:
+            user.hashed_password = new_hash
+    """
+    try:
+        return _run_in_pool(
+            _verify_and_update_in_worker, plain_password, hashed_password, settings.BCRYPT_ROUNDS
+        )
+    except ValueError:
+        # Not a recognizable bcrypt hash (e.g. a disabled account marker)
+        return False, None
 
 
 # ============================================================================
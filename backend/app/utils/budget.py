@@ -0,0 +1,182 @@
+"""
+AI spend accounting and budget limits per project.
+
+- Usage is added to Project.total_tokens_used / total_cost as each provider
+  call finishes, with one UPDATE ... SET total_cost = total_cost + :cost
+  (no read-modify-write, so concurrent launches and workers can't lose each
+  other's increments), in its own short transaction on the engine, so spend
+  is durable mid-round without committing the request's session.
+- Before a launch, estimate_round_cost() prices the round from its prompt
+  token counts plus the reply token cap per case; a launch whose worst case
+  doesn't fit the remaining budget is refused.
+- During a round, RoundBudget.reserve() sets aside each call's worst-case
+  cost before it is dispatched. A call that only fits once other in-flight
+  calls settle waits for them (throttle, up to BUDGET_WAIT_SECONDS); a call
+  that can't fit halts dispatch (BudgetExceeded). Spent + reserved never
+  passes budget_limit within one process; across worker processes the
+  overshoot is bounded by their in-flight calls. Each project has its own
+  lock, so one project's waiting calls don't hold up another's dispatch.
+
+A project with budget_limit NULL has no ceiling (usage is still recorded).
+"""
+
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models import Project
+
+# USD per token (prompt and completion) by AI provider
+PRICE_PER_TOKEN = {
+    "groq-llama-8b": 0.00000027,
+    "groq-llama-70b": 0.00000059,
+    "groq-llama-405b": 0.00000059,
+}
+
+# project_id -> worst-case cost of calls dispatched but not yet charged
+_in_flight: Dict[int, float] = defaultdict(float)
+# project_id -> condition guarding its _in_flight entry
+_conditions: Dict[int, threading.Condition] = {}
+_conditions_lock = threading.Lock()
+
+
+class BudgetExceeded(Exception):
+    """A call or round doesn't fit the project's remaining budget."""
+
+
+def _project_condition(project_id: int) -> threading.Condition:
+    with _conditions_lock:
+        return _conditions.setdefault(project_id, threading.Condition())
+
+
+def price_per_token(ai_provider: str) -> float:
+    """USD per token for a provider (0 for the dummy AI)."""
+    return PRICE_PER_TOKEN.get(ai_provider, 0.0)
+
+
+def estimate_round_cost(prompt_tokens: List[int], max_reply_tokens: int, price: float) -> dict:
+    """Token and cost estimate of a round from its prompts' token counts."""
+    total_prompt = sum(prompt_tokens)
+    max_tokens = total_prompt + max_reply_tokens * len(prompt_tokens)
+    return {
+        "cases": len(prompt_tokens),
+        "prompt_tokens": total_prompt,
+        "max_tokens": max_tokens,
+        "max_cost": round(max_tokens * price, 6),
+    }
+
+
+def _spend(db, project_id: int) -> Tuple[float, Optional[float], int]:
+    """(total_cost, budget_limit, total_tokens_used) of a project (db: Session or Connection)."""
+    row = db.execute(
+        select(Project.total_cost, Project.budget_limit, Project.total_tokens_used).where(Project.id == project_id)
+    ).one()
+    return row.total_cost or 0.0, row.budget_limit, row.total_tokens_used or 0
+
+
+def budget_status(db: Session, project_id: int) -> dict:
+    """Spend, limit and what is left for a project (including in-flight calls)."""
+    spent, limit, tokens = _spend(db, project_id)
+    with _project_condition(project_id):
+        reserved = _in_flight.get(project_id, 0.0)
+    return {
+        "project_id": project_id,
+        "budget_limit": limit,
+        "total_cost": round(spent, 6),
+        "total_tokens_used": tokens,
+        "in_flight_cost": round(reserved, 6),
+        "remaining": None if limit is None else round(max(limit - spent - reserved, 0.0), 6),
+    }
+
+
+def check_round(db: Session, project_id: int, estimate: dict):
+    """Raise BudgetExceeded if a round's worst-case cost exceeds what is left."""
+    status = budget_status(db, project_id)
+    if status["remaining"] is not None and estimate["max_cost"] > status["remaining"]:
+        raise BudgetExceeded(
+            f"estimated cost up to ${estimate['max_cost']:.4f} for {estimate['cases']} cases "
+            f"exceeds the remaining budget of ${status['remaining']:.4f}"
+        )
+
+
+class RoundBudget:
+    """
+    Reserve-before-dispatch / charge-on-finish accounting for one round.
+
+    Spend is read and charged on connections of its own from the session's
+    engine; the session and the analyses pending in it are left alone.
+    """
+
+    def __init__(self, db: Session, project_id: int, price: float, max_reply_tokens: int):
+        self.engine = db.get_bind()
+        self.condition = _project_condition(project_id)
+        self.project_id = project_id
+        self.price = price
+        self.max_reply_tokens = max_reply_tokens
+        self.tokens = 0
+        self.cost = 0.0
+
+    def reserve(self, prompt_tokens: int) -> float:
+        """
+        Set aside a call's worst-case cost before dispatching it.
+
+        Waits while the call only fits once other in-flight calls settle;
+        raises BudgetExceeded when it can't fit.
+        """
+        reserved = (prompt_tokens + self.max_reply_tokens) * self.price
+        if reserved == 0:
+            return 0.0
+        deadline = time.monotonic() + settings.BUDGET_WAIT_SECONDS
+        with self.condition:
+            while True:
+                with self.engine.connect() as connection:
+                    spent, limit, _ = _spend(connection, self.project_id)
+                if limit is None:
+                    break
+                if spent + reserved > limit:
+                    raise BudgetExceeded(
+                        f"budget of ${limit:.4f} reached (spent ${spent:.4f}, "
+                        f"next call up to ${reserved:.4f})"
+                    )
+                if spent + _in_flight[self.project_id] + reserved <= limit:
+                    break
+                timeout = deadline - time.monotonic()
+                if timeout <= 0 or not self.condition.wait(timeout):
+                    raise BudgetExceeded(
+                        f"budget of ${limit:.4f} is held by calls in flight "
+                        f"(waited {settings.BUDGET_WAIT_SECONDS}s)"
+                    )
+            _in_flight[self.project_id] += reserved
+        return reserved
+
+    def release(self, reserved: float):
+        """Return a reservation whose call didn't complete."""
+        if reserved == 0:
+            return
+        with self.condition:
+            _in_flight[self.project_id] -= reserved
+            if _in_flight[self.project_id] < 1e-12:  # float residue
+                del _in_flight[self.project_id]
+            self.condition.notify_all()
+
+    def charge(self, reserved: float, tokens: int):
+        """
+        Add a finished call's usage to the project (atomic UPDATE in its own
+        transaction), then release its reservation.
+        """
+        cost = tokens * self.price
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(update(Project).where(Project.id == self.project_id).values(
+                    total_tokens_used=func.coalesce(Project.total_tokens_used, 0) + tokens,
+                    total_cost=func.coalesce(Project.total_cost, 0.0) + cost,
+                ))
+        finally:
+            self.release(reserved)
+        self.tokens += tokens
+        self.cost += cost
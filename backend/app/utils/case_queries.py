@@ -0,0 +1,131 @@
+"""
+Case browser queries.
+
+Pages through a project's court cases without loading what the caller
+doesn't need:
+- keyset pagination on CourtCase.id (WHERE id > cursor), backed by the
+  (project_id, id) index, so page 5000 costs the same as page 1
+- column projection: metadata only unless opinion text is requested
+- server-side filters on court, state, election type and date range,
+  each backed by a (project_id, column) index
+
+Opinion text is fetched one case at a time (get_case) when a case is opened.
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models import CourtCase
+
+
+# Columns returned for every case
+METADATA_COLUMNS = [
+    CourtCase.id,
+    CourtCase.case_name,
+    CourtCase.case_date,
+    CourtCase.court,
+    CourtCase.docket_number,
+    CourtCase.judges_names,
+    CourtCase.state,
+    CourtCase.election_type,
+    CourtCase.party_who_appointed_judge,
+]
+
+# Large text columns, only returned when include_text=True
+TEXT_COLUMNS = [
+    CourtCase.opinion_text,
+    CourtCase.dissent_text,
+    CourtCase.concur_text,
+]
+
+
+def browse_cases(
+    db: Session,
+    project_id: int,
+    after_id: Optional[int] = None,
+    limit: int = 100,
+    include_text: bool = False,
+    court: Optional[str] = None,
+    state: Optional[str] = None,
+    election_type: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None
+) -> Tuple[List[dict], Optional[int]]:
+    """
+    Get one keyset page of cases for a project.
+
+    Args:
+        after_id: Return cases with id greater than this (cursor from previous page)
+        limit: Page size
+        include_text: Also return opinion, dissent and concurrence text
+        court, state, election_type: Exact-match filters
+        date_from, date_to: Inclusive case_date range
+
+    Returns:
+        (case dictionaries, cursor for the next page or None on the last page)
+    """
+    columns = METADATA_COLUMNS + (TEXT_COLUMNS if include_text else [])
+    query = db.query(*columns).filter(CourtCase.project_id == project_id)
+
+    if after_id is not None:
+        query = query.filter(CourtCase.id > after_id)
+    query = apply_case_filters(
+        query,
+        court=court,
+        state=state,
+        election_type=election_type,
+        date_from=date_from,
+        date_to=date_to
+    )
+
+    # Fetch one extra row to know whether another page exists
+    rows = query.order_by(CourtCase.id).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    cases = []
+    for row in rows:
+        case_dict = row._asdict()
+        case_dict["case_date"] = row.case_date.strftime('%Y-%m-%d') if row.case_date else None
+        cases.append(case_dict)
+
+    next_cursor = cases[-1]["id"] if has_more else None
+    return cases, next_cursor
+
+
+def get_case(db: Session, project_id: int, case_id: int) -> Optional[dict]:
+    """Get one case of a project with its metadata and text, or None."""
+    row = db.query(*METADATA_COLUMNS, *TEXT_COLUMNS).filter(
+        CourtCase.project_id == project_id,
+        CourtCase.id == case_id
+    ).first()
+    if row is None:
+        return None
+
+    case_dict = row._asdict()
+    case_dict["case_date"] = row.case_date.strftime('%Y-%m-%d') if row.case_date else None
+    return case_dict
+
+
+def apply_case_filters(
+    query,
+    court: Optional[str] = None,
+    state: Optional[str] = None,
+    election_type: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None
+):
+    """Add metadata filters (exact match, inclusive date range) to a CourtCase query."""
+    if court is not None:
+        query = query.filter(CourtCase.court == court)
+    if state is not None:
+        query = query.filter(CourtCase.state == state)
+    if election_type is not None:
+        query = query.filter(CourtCase.election_type == election_type)
+    if date_from is not None:
+        query = query.filter(CourtCase.case_date >= datetime.combine(date_from, time.min))
+    if date_to is not None:
+        query = query.filter(CourtCase.case_date < datetime.combine(date_to + timedelta(days=1), time.min))
+    return query
@@ -0,0 +1,275 @@
+"""
+Local embedding index over court opinions.
+
+Each case gets a fixed-size vector from a hashed TF-IDF projection, computed
+on the CPU with NumPy only (no model download, no GPU):
+1. opinion words are hashed into 2^18 buckets (stable crc32 hash)
+2. each bucket gets a sublinear TF x IDF weight (IDF from the project corpus)
+3. buckets are projected to EMBEDDING_DIM dimensions with a fixed random
+   sign/dimension assignment, and the vector is L2-normalized
+
+Vectors are stored per project as a memory-mapped NumPy matrix:
+
+    {EMBEDDING_DIR}/project_{id}/vectors.npy   float32 [n_cases, dim]
+    {EMBEDDING_DIR}/project_{id}/ids.npy       int64   [n_cases]
+
+Because rows are normalized, cosine similarity is a single matrix-vector
+product, so top-k queries over 500k vectors take milliseconds.
+
+One build runs at a time per project. Each writes to its own temp folder,
+which replaces the live one with two renames, so readers never see a
+partly written or half-deleted index.
+"""
+
+import json
+import re
+import shutil
+import threading
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models import CourtCase
+from app.utils.files import new_temp_folder, replace_folder
+
+HASH_BUCKETS = 2 ** 18
+
+# Only the start of long opinions is embedded
+MAX_EMBEDDED_CHARS = 20000
+
+_WORD_RE = re.compile(r"[a-z][a-z\-']{2,}")
+
+# Fixed bucket → (dimension, sign) assignment, identical across processes
+_rng = np.random.default_rng(20260219)
+_BUCKET_SIGN = _rng.choice(np.array([-1.0, 1.0], dtype=np.float32), size=HASH_BUCKETS)
+_BUCKET_DIM_SEED = _rng.integers(0, 2 ** 31 - 1, size=HASH_BUCKETS, dtype=np.int64)
+
+# Loaded indexes: project_id -> (mtime, index)
+_INDEX_CACHE: Dict[int, Tuple[float, "EmbeddingIndex"]] = {}
+
+# One build at a time per project
+_build_locks: Dict[int, threading.Lock] = defaultdict(threading.Lock)
+
+
+def index_dir(project_id: int) -> Path:
+    """Folder holding one project's embedding files."""
+    return Path(settings.EMBEDDING_DIR) / f"project_{project_id}"
+
+
+def hash_buckets(text: str) -> np.ndarray:
+    """Hash the words of a text into bucket ids."""
+    words = _WORD_RE.findall(text[:MAX_EMBEDDED_CHARS].lower())
+    return np.fromiter(
+        (zlib.crc32(w.encode()) % HASH_BUCKETS for w in words),
+        dtype=np.int64,
+        count=len(words)
+    )
+
+
+def embed_buckets(buckets: np.ndarray, idf: np.ndarray, dim: int) -> np.ndarray:
+    """Project one document's hashed words to a normalized dim-sized vector."""
+    vector = np.zeros(dim, dtype=np.float32)
+    if buckets.size == 0:
+        return vector
+
+    unique, counts = np.unique(buckets, return_counts=True)
+    weights = (1.0 + np.log(counts)).astype(np.float32) * idf[unique] * _BUCKET_SIGN[unique]
+    vector = np.bincount(_BUCKET_DIM_SEED[unique] % dim, weights=weights, minlength=dim).astype(np.float32)
+
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+class EmbeddingIndex:
+    """Memory-mapped vectors for one project with top-k cosine queries."""
+
+    def __init__(self, project_id: int, ids: np.ndarray, vectors: np.ndarray, idf: np.ndarray):
+        self.project_id = project_id
+        self.ids = ids
+        self.vectors = vectors
+        self.idf = idf
+        self.dim = vectors.shape[1]
+        self._row_of = {int(case_id): row for row, case_id in enumerate(ids)}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, case_id: int):
+        return case_id in self._row_of
+
+    def vector(self, case_id: int) -> Optional[np.ndarray]:
+        """Stored vector for a case, or None if it isn't indexed."""
+        row = self._row_of.get(case_id)
+        return None if row is None else np.asarray(self.vectors[row])
+
+    def embed_text(self, text: str) -> np.ndarray:
+        """Vector for arbitrary text using this project's IDF."""
+        return embed_buckets(hash_buckets(text), self.idf, self.dim)
+
+    def most_similar(self, query: np.ndarray, k: int = 10,
+                     exclude: Iterable[int] = ()) -> List[Tuple[int, float]]:
+        """
+        Top-k cases by cosine similarity to a (normalized) query vector.
+
+        Returns:
+            List of (case_id, score), best first
+        """
+        scores = self.vectors @ query
+        excluded_rows = [self._row_of[c] for c in exclude if c in self._row_of]
+        if excluded_rows:
+            scores[excluded_rows] = -np.inf
+
+        k = min(k, len(scores) - len(excluded_rows))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(self.ids[row]), float(scores[row])) for row in top]
+
+    def similar_to_cases(self, case_ids: List[int], k: int = 10,
+                         exclude_seeds: bool = True) -> List[Tuple[int, float]]:
+        """Top-k cases closest to the centroid of the given cases."""
+        seeds = [self.vector(c) for c in case_ids if c in self]
+        if not seeds:
+            return []
+        centroid = np.mean(seeds, axis=0)
+        norm = np.linalg.norm(centroid)
+        if norm == 0:
+            return []
+        return self.most_similar(centroid / norm, k, exclude=case_ids if exclude_seeds else ())
+
+    def neighbours(self, case_ids: List[int], k: int = 10, chunk_size: int = 32) -> List[int]:
+        """
+        Union of each case's own top-k neighbours (seeds themselves excluded).
+
+        Seeds are scored in chunks (one matrix-matrix product per chunk)
+        instead of one scan of the matrix per seed.
+        """
+        seed_rows = [self._row_of[c] for c in dict.fromkeys(case_ids) if c in self._row_of]
+        k = min(k, len(self) - 1)
+        if not seed_rows or k <= 0:
+            return []
+
+        found = set()
+        for start in range(0, len(seed_rows), chunk_size):
+            rows = seed_rows[start:start + chunk_size]
+            scores = self.vectors @ np.asarray(self.vectors[rows]).T   # [n_cases, len(rows)]
+            scores[rows, np.arange(len(rows))] = -np.inf
+            top = np.argpartition(-scores, k - 1, axis=0)[:k]
+            found.update(int(case_id) for case_id in self.ids[top.ravel()])
+
+        return sorted(found - set(case_ids))
+
+
+def build_embedding_index(db: Session, project_id: int, batch_size: int = 1000) -> EmbeddingIndex:
+    """
+    (Re)compute vectors for every case in a project and write them to disk.
+
+    Streams opinions twice (document frequencies, then vectors) so memory
+    stays flat regardless of corpus size.
+    """
+    with _build_locks[project_id]:
+        _write_embedding_index(db, project_id, batch_size)
+    return load_embedding_index(project_id)
+
+
+def _write_embedding_index(db: Session, project_id: int, batch_size: int):
+    dim = settings.EMBEDDING_DIM
+
+    def stream():
+        return db.query(CourtCase.id, CourtCase.opinion_text).filter(
+            CourtCase.project_id == project_id
+        ).order_by(CourtCase.id).yield_per(batch_size)
+
+    # Pass 1: document frequency per bucket
+    document_frequency = np.zeros(HASH_BUCKETS, dtype=np.int64)
+    n_docs = 0
+    for _, text in stream():
+        document_frequency[np.unique(hash_buckets(text or ""))] += 1
+        n_docs += 1
+    idf = (np.log((1 + n_docs) / (1 + document_frequency)) + 1).astype(np.float32)
+
+    # Pass 2: vectors, written straight into the memory-mapped file
+    # (a temp folder of this build's own: other worker processes may be building too)
+    folder = index_dir(project_id)
+    tmp_folder = new_temp_folder(folder)
+    try:
+        vectors = np.lib.format.open_memmap(
+            tmp_folder / "vectors.npy", mode="w+", dtype=np.float32, shape=(n_docs, dim)
+        )
+        ids = np.zeros(n_docs, dtype=np.int64)
+        for row, (case_id, text) in enumerate(stream()):
+            if row >= n_docs:
+                break  # cases added while building are picked up next rebuild
+            ids[row] = case_id
+            vectors[row] = embed_buckets(hash_buckets(text or ""), idf, dim)
+        vectors.flush()
+        del vectors
+
+        np.save(tmp_folder / "ids.npy", ids)
+        np.save(tmp_folder / "idf.npy", idf)
+        (tmp_folder / "meta.json").write_text(json.dumps({
+            "project_id": project_id,
+            "n_cases": n_docs,
+            "dim": dim,
+            "hash_buckets": HASH_BUCKETS,
+        }))
+    except BaseException:
+        shutil.rmtree(tmp_folder, ignore_errors=True)
+        raise
+
+    # Swap in the new index
+    replace_folder(tmp_folder, folder)
+    _INDEX_CACHE.pop(project_id, None)
+
+
+def load_embedding_index(project_id: int) -> Optional[EmbeddingIndex]:
+    """Open a project's index (memory-mapped, cached until rebuilt), or None."""
+    try:
+        return _open_embedding_index(project_id)
+    except FileNotFoundError:
+        # Caught between the two renames of a swap: the new index is in place now
+        return _open_embedding_index(project_id)
+
+
+def _open_embedding_index(project_id: int) -> Optional[EmbeddingIndex]:
+    folder = index_dir(project_id)
+    vectors_path = folder / "vectors.npy"
+    if not vectors_path.exists():
+        _INDEX_CACHE.pop(project_id, None)
+        return None
+
+    mtime = vectors_path.stat().st_mtime
+    cached = _INDEX_CACHE.get(project_id)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    index = EmbeddingIndex(
+        project_id,
+        ids=np.load(folder / "ids.npy"),
+        vectors=np.load(vectors_path, mmap_mode="r"),
+        idf=np.load(folder / "idf.npy")
+    )
+    _INDEX_CACHE[project_id] = (mtime, index)
+    return index
+
+
+def build_embedding_index_task(project_id: int):
+    """Rebuild an index in the background with its own database session."""
+    db = SessionLocal()
+    try:
+        build_embedding_index(db, project_id)
+    finally:
+        db.close()
+
+
+def delete_embedding_index(project_id: int):
+    """Remove a project's index files (e.g. when its cases are deleted)."""
+    _INDEX_CACHE.pop(project_id, None)
+    shutil.rmtree(index_dir(project_id), ignore_errors=True)
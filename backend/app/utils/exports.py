@@ -0,0 +1,160 @@
+"""
+Streaming export of AI analyses with their validations and case metadata.
+
+One row per AIAnalysis (a module, round and case), joined to its case's
+metadata and, when it has been validated, to the ValidationFeedback, plus
+final_answer (the AI answer if the validator accepted it, else the
+validator's correction). Scope: a module round, a whole module or a
+whole project.
+
+Rows are read with a server-side cursor (yield_per: a named cursor on
+PostgreSQL, incremental fetches on SQLite) EXPORT_BATCH_ROWS at a time and
+each batch is written by a pyarrow CSV or Parquet writer (one row group per
+batch) into a buffer that is drained into the response, so memory stays
+flat however many rows the export has.
+
+The export opens its own connection on the session's engine: it runs while
+the response streams, after the request's session has been closed.
+"""
+
+import io
+import json
+from typing import Iterator, Optional
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from sqlalchemy import case as sql_case, select
+from sqlalchemy.engine import Engine
+from starlette.responses import StreamingResponse
+
+from app.models import AIAnalysis, CourtCase, ValidationFeedback, VerificationModule
+
+# Rows fetched and written per batch (Parquet row group size)
+EXPORT_BATCH_ROWS = 5000
+
+# format -> (media type, file extension)
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+# (column name, selected expression, Arrow type), in output order
+EXPORT_COLUMNS = [
+    ("project_id", VerificationModule.project_id, pa.int64()),
+    ("module_id", VerificationModule.id, pa.int64()),
+    ("module_number", VerificationModule.module_number, pa.int32()),
+    ("module_name", VerificationModule.module_name, pa.string()),
+    ("question_text", VerificationModule.question_text, pa.string()),
+    ("round", AIAnalysis.ai_round, pa.int32()),
+    ("case_id", CourtCase.id, pa.int64()),
+    ("case_name", CourtCase.case_name, pa.string()),
+    ("case_date", CourtCase.case_date, pa.timestamp("us")),
+    ("court", CourtCase.court, pa.string()),
+    ("docket_number", CourtCase.docket_number, pa.string()),
+    ("judges_names", CourtCase.judges_names, pa.string()),
+    ("state", CourtCase.state, pa.string()),
+    ("election_type", CourtCase.election_type, pa.string()),
+    ("party_who_appointed_judge", CourtCase.party_who_appointed_judge, pa.string()),
+    ("ai_analysis_id", AIAnalysis.id, pa.int64()),
+    ("ai_answer", AIAnalysis.ai_answer, pa.string()),
+    ("ai_reasoning", AIAnalysis.ai_reasoning, pa.string()),
+    ("ai_confidence", AIAnalysis.ai_confidence, pa.float64()),
+    ("model_used", AIAnalysis.model_used, pa.string()),
+    ("tokens_used", AIAnalysis.tokens_used, pa.int64()),
+    ("cost", AIAnalysis.cost, pa.float64()),
+    ("generated_at", AIAnalysis.generated_at, pa.timestamp("us")),
+    ("validation_id", ValidationFeedback.id, pa.int64()),
+    ("is_correct", ValidationFeedback.is_correct, pa.bool_()),
+    ("validator_correction", ValidationFeedback.validator_correction, pa.string()),
+    ("validator_reasoning", ValidationFeedback.validator_reasoning, pa.string()),
+    ("validator_notes", ValidationFeedback.validator_notes, pa.string()),
+    ("scholar_reviewed", ValidationFeedback.scholar_reviewed, pa.bool_()),
+    ("scholar_approved", ValidationFeedback.scholar_approved, pa.bool_()),
+    ("scholar_notes", ValidationFeedback.scholar_notes, pa.string()),
+    ("submitted_at", ValidationFeedback.submitted_at, pa.timestamp("us")),
+    ("reviewed_at", ValidationFeedback.reviewed_at, pa.timestamp("us")),
+    ("final_answer", sql_case(
+        (ValidationFeedback.is_correct == True, AIAnalysis.ai_answer),
+        (ValidationFeedback.is_correct == False, ValidationFeedback.validator_correction),
+    ), pa.string()),
+]
+
+EXPORT_SCHEMA = pa.schema([(name, arrow_type) for name, _, arrow_type in EXPORT_COLUMNS])
+
+# JSON columns, written as JSON text
+_JSON_COLUMNS = {"judges_names"}
+
+
+def export_statement(project_id: Optional[int] = None, module_id: Optional[int] = None,
+                     round_number: Optional[int] = None):
+    """SELECT of the export rows for a project, a module or a module round."""
+    statement = select(
+        *[expression.label(name) for name, expression, _ in EXPORT_COLUMNS]
+    ).select_from(AIAnalysis).join(
+        VerificationModule, VerificationModule.id == AIAnalysis.module_id
+    ).join(
+        CourtCase, CourtCase.id == AIAnalysis.case_id
+    ).outerjoin(
+        ValidationFeedback, ValidationFeedback.ai_analysis_id == AIAnalysis.id
+    )
+    if project_id is not None:
+        statement = statement.where(VerificationModule.project_id == project_id)
+    if module_id is not None:
+        statement = statement.where(AIAnalysis.module_id == module_id)
+    if round_number is not None:
+        statement = statement.where(AIAnalysis.ai_round == round_number)
+    return statement.order_by(AIAnalysis.id)
+
+
+def _record_batch(rows) -> pa.RecordBatch:
+    columns = list(zip(*rows)) if rows else [()] * len(EXPORT_COLUMNS)
+    arrays = []
+    for (name, _, arrow_type), values in zip(EXPORT_COLUMNS, columns):
+        if name in _JSON_COLUMNS:
+            values = [None if value is None else json.dumps(value) for value in values]
+        arrays.append(pa.array(values, type=arrow_type))
+    return pa.RecordBatch.from_arrays(arrays, schema=EXPORT_SCHEMA)
+
+
+def stream_export(engine: Engine, statement, format: str) -> Iterator[bytes]:
+    """Encoded export (CSV or Parquet), one chunk per batch of rows."""
+    buffer = io.BytesIO()
+
+    def drain() -> bytes:
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    if format == "parquet":
+        writer = pq.ParquetWriter(buffer, EXPORT_SCHEMA, compression="zstd")
+    else:
+        writer = pa_csv.CSVWriter(buffer, EXPORT_SCHEMA)
+
+    with engine.connect() as connection:
+        result = connection.execution_options(yield_per=EXPORT_BATCH_ROWS).execute(statement)
+        wrote_rows = False
+        for rows in result.partitions():
+            writer.write_batch(_record_batch(rows))
+            wrote_rows = True
+            data = drain()
+            if data:
+                yield data
+        if not wrote_rows:
+            writer.write_batch(_record_batch([]))  # CSV header / valid empty Parquet
+
+    writer.close()
+    data = drain()
+    if data:
+        yield data
+
+
+def export_response(engine: Engine, statement, format: str, filename: str) -> StreamingResponse:
+    """StreamingResponse downloading the export as <filename>.<csv|parquet>."""
+    media_type, extension = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        stream_export(engine, statement, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{extension}"'}
+    )
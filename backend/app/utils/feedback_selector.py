@@ -0,0 +1,231 @@
+"""
+Feedback example selection for round 2+ prompts.
+
+Instead of inlining the whole feedback library into every prompt, each case
+gets the library entries most relevant to it, capped by a token budget:
+- relevance = TF-IDF cosine similarity between the case's opinion text and
+  the example case's text plus the correction reason, or cosine similarity
+  of the stored vectors when the project's embedding index covers the case
+  and every example case
+- examples are added best-first until the budget or max count is reached
+- term vectors of cases are cached in-process; rankings are cached per case
+- times_referenced is updated for every example actually used
+"""
+
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import case as sql_case, func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models import CourtCase, FeedbackLibrary, VerificationModule
+from app.utils.embeddings import load_embedding_index
+from app.utils.tokens import estimate_tokens
+
+# Only the start of long opinions is used for relevance scoring
+MAX_SCORED_CHARS = 20000
+
+_WORD_RE = re.compile(r"[a-z][a-z\-']{2,}")
+
+_STOPWORDS = frozenset("""
+the and for that with this from was were are but not have has had his her its
+their they them which who whom what when where while would could should shall
+may might must been being any all also such than then there these those upon
+into onto over under about after before other only same some very court case
+opinion judge justice state plaintiff defendant appellant appellee
+""".split())
+
+# case_id -> term frequencies (bounded LRU shared across launches, which run
+# on several threads at once)
+_TERM_CACHE: "OrderedDict[int, Counter]" = OrderedDict()
+_TERM_CACHE_SIZE = 4096
+_TERM_CACHE_LOCK = threading.Lock()
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase content words (3+ letters, no stopwords)."""
+    return [w for w in _WORD_RE.findall(text.lower()) if w not in _STOPWORDS]
+
+
+def case_terms(case_id: Optional[int], text: str) -> Counter:
+    """Term frequencies for a case's text, cached by case id."""
+    if case_id is not None:
+        with _TERM_CACHE_LOCK:
+            terms = _TERM_CACHE.get(case_id)
+            if terms is not None:
+                _TERM_CACHE.move_to_end(case_id)
+                return terms
+
+    # Tokenized outside the lock: other launches needn't wait for it
+    terms = Counter(tokenize(text[:MAX_SCORED_CHARS]))
+
+    if case_id is not None:
+        with _TERM_CACHE_LOCK:
+            _TERM_CACHE[case_id] = terms
+            _TERM_CACHE.move_to_end(case_id)
+            while len(_TERM_CACHE) > _TERM_CACHE_SIZE:
+                _TERM_CACHE.popitem(last=False)
+    return terms
+
+
+def render_example(example: dict) -> str:
+    """Text an example adds to the prompt (mirrors _build_llama_prompt)."""
+    rendered = (
+        f"\nExample N:\n"
+        f"  Wrong answer: {example['wrong_answer']}\n"
+        f"  Correct answer: {example['correct_answer']}\n"
+    )
+    if example["correction_reason"]:
+        rendered += f"  Why it was wrong: {example['correction_reason']}\n"
+    return rendered
+
+
+class FeedbackExampleSelector:
+    """
+    Picks the most relevant feedback library entries for each case.
+
+    Usage:
+        selector = FeedbackExampleSelector(db, module)
+        for case in sampled_cases:
+            examples = selector.select(case)   # list of example dicts
+        selector.record_usage()                 # bumps times_referenced
+    """
+
+    def __init__(self, db: Session, module: VerificationModule,
+                 token_budget: int = None, max_examples: int = None):
+        self.db = db
+        self.token_budget = settings.FEEDBACK_TOKEN_BUDGET if token_budget is None else token_budget
+        self.max_examples = settings.FEEDBACK_MAX_EXAMPLES if max_examples is None else max_examples
+
+        # One query: library entries with their example case text
+        rows = db.query(
+            FeedbackLibrary.id,
+            FeedbackLibrary.wrong_answer,
+            FeedbackLibrary.correct_answer,
+            FeedbackLibrary.correction_reason,
+            FeedbackLibrary.example_case_id,
+            CourtCase.opinion_text
+        ).outerjoin(
+            CourtCase, CourtCase.id == FeedbackLibrary.example_case_id
+        ).filter(
+            FeedbackLibrary.module_id == module.id
+        ).order_by(FeedbackLibrary.id).all()
+
+        self.examples = []
+        for row in rows:
+            example = {
+                "id": row.id,
+                "wrong_answer": row.wrong_answer,
+                "correct_answer": row.correct_answer,
+                "correction_reason": row.correction_reason,
+            }
+            example["tokens"] = estimate_tokens(render_example(example))
+            terms = case_terms(row.example_case_id, row.opinion_text or "")
+            terms = terms + Counter(tokenize(row.correction_reason or ""))
+            self.examples.append((example, terms))
+
+        # Smoothed IDF over the library (one document per example)
+        document_frequency = Counter()
+        for _, terms in self.examples:
+            document_frequency.update(terms.keys())
+        n_docs = len(self.examples)
+        self.idf = {
+            term: math.log((1 + n_docs) / (1 + df)) + 1
+            for term, df in document_frequency.items()
+        }
+
+        self.example_vectors = [self._vector(terms) for _, terms in self.examples]
+
+        # Embedding vectors of example cases, if all of them are indexed
+        self.embeddings = load_embedding_index(module.project_id)
+        self.example_embeddings = None
+        if self.embeddings is not None and rows:
+            example_case_ids = [row.example_case_id for row in rows]
+            if all(case_id in self.embeddings for case_id in example_case_ids):
+                self.example_embeddings = np.stack(
+                    [self.embeddings.vector(case_id) for case_id in example_case_ids]
+                )
+        self._rankings: Dict[int, List[int]] = {}
+        self.usage = Counter()
+
+    def __len__(self):
+        return len(self.examples)
+
+    def _vector(self, terms: Counter) -> Dict[str, float]:
+        """L2-normalized TF-IDF vector restricted to library vocabulary."""
+        vector = {
+            term: (1 + math.log(count)) * self.idf[term]
+            for term, count in terms.items()
+            if term in self.idf
+        }
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        return {term: w / norm for term, w in vector.items()} if norm else {}
+
+    def rank(self, case: CourtCase) -> List[int]:
+        """Indexes of library examples, most relevant first (cached per case)."""
+        if case.id in self._rankings:
+            return self._rankings[case.id]
+
+        if self.example_embeddings is not None and case.id in self.embeddings:
+            similarities = self.example_embeddings @ self.embeddings.vector(case.id)
+            scores = [(float(score), index) for index, score in enumerate(similarities)]
+        else:
+            case_vector = self._vector(case_terms(case.id, case.opinion_text or ""))
+            scores = []
+            for index, example_vector in enumerate(self.example_vectors):
+                # Iterate the smaller vector
+                small, large = sorted((case_vector, example_vector), key=len)
+                score = sum(w * large.get(term, 0.0) for term, w in small.items())
+                scores.append((score, index))
+
+        # Highest score first; ties keep library order (oldest first)
+        ranking = [index for _, index in sorted(scores, key=lambda s: (-s[0], s[1]))]
+        self._rankings[case.id] = ranking
+        return ranking
+
+    def select(self, case: CourtCase) -> List[dict]:
+        """
+        Most relevant examples for a case that fit the token budget.
+
+        Returns:
+            Example dicts with wrong_answer, correct_answer, correction_reason
+        """
+        selected = []
+        if self.max_examples <= 0:
+            return selected
+
+        tokens_used = 0
+        for index in self.rank(case):
+            example, _ = self.examples[index]
+            if tokens_used + example["tokens"] > self.token_budget:
+                continue
+            selected.append(example)
+            tokens_used += example["tokens"]
+            if len(selected) >= self.max_examples:
+                break
+
+        self.usage.update(example["id"] for example in selected)
+        return selected
+
+    def record_usage(self):
+        """
+        Add this run's usage to FeedbackLibrary.times_referenced (one UPDATE).
+        Caller commits.
+        """
+        if not self.usage:
+            return
+
+        self.db.query(FeedbackLibrary).filter(
+            FeedbackLibrary.id.in_(list(self.usage))
+        ).update({
+            FeedbackLibrary.times_referenced: func.coalesce(FeedbackLibrary.times_referenced, 0) + sql_case(
+                dict(self.usage), value=FeedbackLibrary.id, else_=0
+            )
+        }, synchronize_session=False)
+        self.usage.clear()
+
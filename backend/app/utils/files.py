@@ -0,0 +1,28 @@
+"""
+Folder helpers for on-disk artifacts that are rebuilt while being read
+(embedding indexes, analytics snapshots).
+
+A rebuild writes into its own temp folder next to the live one and swaps it
+in with two renames, so readers see the old or the new folder, never a
+partly written one.
+"""
+
+import shutil
+import uuid
+from pathlib import Path
+
+
+def new_temp_folder(folder: Path) -> Path:
+    """Create a uniquely named empty folder next to folder to build into."""
+    tmp_folder = folder.with_name(f"{folder.name}.tmp-{uuid.uuid4().hex}")
+    tmp_folder.mkdir(parents=True)
+    return tmp_folder
+
+
+def replace_folder(new_folder: Path, folder: Path):
+    """Swap a fully written folder in for folder (rename aside, rename in, delete old)."""
+    old_folder = folder.with_name(f"{folder.name}.old-{uuid.uuid4().hex}")
+    if folder.exists():
+        folder.rename(old_folder)
+    new_folder.rename(folder)
+    shutil.rmtree(old_folder, ignore_errors=True)
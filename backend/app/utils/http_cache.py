@@ -0,0 +1,120 @@
+"""
+Conditional GET (ETag / If-None-Match) for dashboard reads, and an
+in-process cache of module round results.
+
+Modules, project context and the AI provider list rarely change, but the
+frontend fetches them on every view. Their endpoints send an ETag built from
+what the response depends on (updated_at / version columns, or aggregate
+counts and max ids for lists); a request whose If-None-Match still matches
+gets an empty 304 and the browser reuses its copy. Responses carry
+"Cache-Control: private, no-cache" - stored per user, revalidated each time.
+
+get_module_results is the expensive one (every analysis and validation of
+the module). For a closed round its ETag comes from a watermark of a few
+aggregates over the round's analyses and the module's validations, and the
+computed results are kept in ResultsCache under that ETag:
+- a write that changes the results (a validation submitted, edited or
+  reviewed, new analyses, a new round) changes the watermark, so the entry
+  is replaced on the next read - also when another worker process did it
+- an ORM update or delete of a module drops its entries right away
+- the cache holds at most RESULTS_CACHE_SIZE rounds (LRU)
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from fastapi import Response
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.models import VerificationModule
+
+# Must revalidate (ETag) before reuse; private: responses depend on the user
+PRIVATE_NO_CACHE = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """Weak ETag over the values a response is built from."""
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:24]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches etag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str, cache_control: str = PRIVATE_NO_CACHE) -> Response:
+    """Empty 304 response for a request whose copy is still current."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+
+def set_cache_headers(response: Response, etag: str, cache_control: str = PRIVATE_NO_CACHE):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+
+class ResultsCache:
+    """Thread-safe LRU of computed round results keyed by (module_id, round)."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[int, int], Tuple[str, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, module_id: int, round_number: int, etag: str) -> Optional[dict]:
+        """Cached results if they were computed for this ETag, else None."""
+        key = (module_id, round_number)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != etag:
+                if entry is not None:
+                    del self._entries[key]  # the round changed since
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, module_id: int, round_number: int, etag: str, results: dict):
+        key = (module_id, round_number)
+        with self._lock:
+            self._entries[key] = (etag, results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_module(self, module_id: int):
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == module_id]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+results_cache = ResultsCache(settings.RESULTS_CACHE_SIZE)
+
+
+# ============================================================================
+# INVALIDATION
+# ============================================================================
+
+@event.listens_for(VerificationModule, "after_update")
+@event.listens_for(VerificationModule, "after_delete")
+def _invalidate_changed_module(mapper, connection, target):
+    """Drop a module's rounds when it changes (new round, completion, deletion)."""
+    results_cache.invalidate_module(target.id)
@@ -0,0 +1,249 @@
+"""
+Request instrumentation: latency, SQL statements and response size per route.
+
+MetricsMiddleware (pure ASGI, so streamed responses are measured to the last
+byte) times every HTTP request, and SQLAlchemy cursor events on all engines
+(sync, async and replica) attribute each statement to the request that ran
+it. Per method, route template (e.g. /modules/modules/{module_id}/results)
+and status it keeps histograms of:
+- request latency (seconds)
+- SQL statements per request and SQL time per request
+- response size (bytes)
+
+GET /metrics renders them in Prometheus text format. Requests slower than
+SLOW_REQUEST_MS are logged with their most expensive statements, so N+1
+loops show up as one statement text executed hundreds of times.
+
+Metrics are per process; with several workers, scrape each one.
+"""
+
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+STATEMENT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 1000)
+DB_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# Distinct statement texts remembered per request for the slow-request log
+MAX_TRACKED_STATEMENTS = 200
+
+
+class RequestStats:
+    """Measurements for one in-flight request."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.elapsed: Optional[float] = None
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.response_bytes = 0
+        # statement text -> [executions, seconds]
+        self.queries: Dict[str, List] = {}
+
+    def finish(self):
+        """Stop the clock (at the last response byte; background tasks don't count)."""
+        if self.elapsed is None:
+            self.elapsed = time.perf_counter() - self.start
+
+    def add_statement(self, statement: str, seconds: float):
+        self.statements += 1
+        self.db_seconds += seconds
+        entry = self.queries.get(statement)
+        if entry is not None:
+            entry[0] += 1
+            entry[1] += seconds
+        elif len(self.queries) < MAX_TRACKED_STATEMENTS:
+            self.queries[statement] = [1, seconds]
+
+    def top_queries(self, n: int) -> List[Tuple[str, int, float]]:
+        """(statement, executions, seconds) with the most total time first."""
+        ranked = sorted(self.queries.items(), key=lambda item: item[1][1], reverse=True)
+        return [(statement, count, seconds) for statement, (count, seconds) in ranked[:n]]
+
+
+# The request being served in this context. Starlette copies the context into
+# threadpool workers, so sync routes and dependencies see the same object.
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+# ============================================================================
+# SQLALCHEMY HOOKS
+# ============================================================================
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    if _current_request.get() is not None:
+        conn.info.setdefault("statement_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_request.get()
+    starts = conn.info.get("statement_start")
+    if stats is None or not starts:
+        return
+    seconds = time.perf_counter() - starts.pop()
+    if stats.elapsed is None:
+        stats.add_statement(statement, seconds)
+
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+class Histogram:
+    """Cumulative-bucket histogram with one series per label tuple."""
+
+    def __init__(self, name: str, documentation: str, buckets: Tuple[float, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = buckets
+        # labels -> [bucket counts..., +Inf count], sum
+        self._series: Dict[tuple, list] = {}
+
+    def observe(self, labels: tuple, value: float):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        counts = series[0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+        counts[-1] += 1
+        series[1] += value
+
+    def clear(self):
+        self._series.clear()
+
+    def render(self, label_names: Tuple[str, ...]) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total) in sorted(self._series.items()):
+            label_text = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(label_names, labels))
+            for bound, count in zip(self.buckets, counts):
+                lines.append(f'{self.name}_bucket{{{label_text},le="{_format_number(bound)}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{label_text},le="+Inf"}} {counts[-1]}')
+            lines.append(f"{self.name}_sum{{{label_text}}} {_format_number(total)}")
+            lines.append(f"{self.name}_count{{{label_text}}} {counts[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Per-route request histograms shared by all requests in the process."""
+
+    LABELS = ("method", "route", "status")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency = Histogram(
+            "http_request_duration_seconds", "Time to the last response byte.", LATENCY_BUCKETS
+        )
+        self.statements = Histogram(
+            "http_request_db_statements", "SQL statements executed per request.", STATEMENT_BUCKETS
+        )
+        self.db_time = Histogram(
+            "http_request_db_seconds", "Time spent executing SQL per request.", DB_TIME_BUCKETS
+        )
+        self.response_size = Histogram(
+            "http_response_size_bytes", "Response body size.", SIZE_BUCKETS
+        )
+
+    def record(self, method: str, route: str, status: int, stats: RequestStats):
+        labels = (method, route, str(status))
+        with self._lock:
+            self.latency.observe(labels, stats.elapsed)
+            self.statements.observe(labels, stats.statements)
+            self.db_time.observe(labels, stats.db_seconds)
+            self.response_size.observe(labels, stats.response_bytes)
+
+    def render(self) -> str:
+        """All metrics in Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            lines = []
+            for histogram in (self.latency, self.statements, self.db_time, self.response_size):
+                lines.extend(histogram.render(self.LABELS))
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        with self._lock:
+            for histogram in (self.latency, self.statements, self.db_time, self.response_size):
+                histogram.clear()
+
+
+registry = MetricsRegistry()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+# ============================================================================
+# MIDDLEWARE
+# ============================================================================
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route metrics for every HTTP request.
+
+    Usage:
+        app.add_middleware(MetricsMiddleware)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current_request.set(stats)
+        status = 500
+
+        async def send_and_measure(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                stats.response_bytes += len(message.get("body", b""))
+                if not message.get("more_body", False):
+                    stats.finish()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_measure)
+        finally:
+            _current_request.reset(token)
+            stats.finish()
+            # Route template, not the raw path, to keep label cardinality bounded
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            registry.record(scope["method"], route, status, stats)
+            if stats.elapsed * 1000 >= settings.SLOW_REQUEST_MS:
+                log_slow_request(scope["method"], scope["path"], status, stats)
+
+
+def log_slow_request(method: str, path: str, status: int, stats: RequestStats):
+    lines = [
+        f"Slow request: {method} {path} -> {status} in {stats.elapsed * 1000:.0f} ms "
+        f"({stats.statements} SQL statements, {stats.db_seconds * 1000:.0f} ms in SQL, "
+        f"{stats.response_bytes} bytes)"
+    ]
+    for statement, count, seconds in stats.top_queries(settings.SLOW_REQUEST_TOP_QUERIES):
+        sql = " ".join(statement.split())
+        lines.append(f"  {seconds * 1000:8.1f} ms  {count:5d}x  {sql[:300]}")
+    logger.warning("\n".join(lines))
@@ -0,0 +1,154 @@
+"""
+Project summary queries.
+
+Builds project listings in a fixed number of SQL statements:
+- admin and scholar users are eager-loaded with the project row
+- module counts come from one grouped subquery instead of a COUNT per project
+- listings use keyset pagination on Project.id (WHERE id > cursor), so deep
+  pages cost the same as the first one; OFFSET paging (skip) is still
+  accepted for older callers
+
+Listing statements are built once (project_page_statement) and executed by
+either a sync Session or an AsyncSession.
+"""
+
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+
+from app.models import Project, User, VerificationModule, ValidatorAssignment
+
+
+def project_page_statement(current_user: User, after_id: Optional[int] = None, limit: int = 100,
+                           skip: int = 0):
+    """
+    SELECT (Project, module_count) for one keyset page visible to the user,
+    with one extra row to detect a next page. None if the user sees nothing.
+    skip additionally drops that many rows (deprecated OFFSET paging).
+
+    - Admins see all projects
+    - Scholars see projects they're assigned to
+    - Validators see nothing here yet
+    """
+    role = current_user.role.value
+    if role not in ["admin", "scholar"]:
+        return None
+
+    counts = select(
+        VerificationModule.project_id.label("project_id"),
+        func.count(VerificationModule.id).label("module_count")
+    ).group_by(VerificationModule.project_id).subquery()
+
+    statement = select(
+        Project,
+        func.coalesce(counts.c.module_count, 0)
+    ).outerjoin(
+        counts, counts.c.project_id == Project.id
+    ).options(
+        joinedload(Project.admin),
+        joinedload(Project.scholar)
+    )
+
+    if role == "scholar":
+        statement = statement.where(Project.scholar_id == current_user.id)
+    if after_id is not None:
+        statement = statement.where(Project.id > after_id)
+
+    statement = statement.order_by(Project.id).limit(limit + 1)
+    if skip:
+        statement = statement.offset(skip)
+    return statement
+
+
+def _project_page(rows, limit: int) -> Tuple[List[dict], Optional[int]]:
+    """Serialize a fetched page and compute the next cursor."""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    projects = [project_to_dict(project, module_count) for project, module_count in rows]
+    next_cursor = projects[-1]["id"] if has_more else None
+    return projects, next_cursor
+
+
+def list_project_summaries(
+    db: Session,
+    current_user: User,
+    after_id: Optional[int] = None,
+    limit: int = 100,
+    skip: int = 0
+) -> Tuple[List[dict], Optional[int]]:
+    """
+    Get one keyset page of project summaries visible to the user.
+
+    Returns:
+        (project dictionaries, cursor for the next page or None on the last page)
+    """
+    statement = project_page_statement(current_user, after_id, limit, skip)
+    if statement is None:
+        return [], None
+    return _project_page(db.execute(statement).unique().all(), limit)
+
+
+async def list_project_summaries_async(
+    db: AsyncSession,
+    current_user: User,
+    after_id: Optional[int] = None,
+    limit: int = 100,
+    skip: int = 0
+) -> Tuple[List[dict], Optional[int]]:
+    """Async version of list_project_summaries."""
+    statement = project_page_statement(current_user, after_id, limit, skip)
+    if statement is None:
+        return [], None
+    result = await db.execute(statement)
+    return _project_page(result.unique().all(), limit)
+
+
+def get_project_summary(db: Session, project_id: int) -> Optional[Project]:
+    """Load a single project with admin and scholar eager-loaded."""
+    return db.query(Project).options(
+        joinedload(Project.admin),
+        joinedload(Project.scholar)
+    ).filter(Project.id == project_id).first()
+
+
+def validator_has_project_access(db: Session, project_id: int, validator_id: int) -> bool:
+    """True if the validator has any module assignment inside the project."""
+    return db.query(
+        db.query(ValidatorAssignment.id).join(
+            VerificationModule,
+            ValidatorAssignment.module_id == VerificationModule.id
+        ).filter(
+            VerificationModule.project_id == project_id,
+            ValidatorAssignment.validator_id == validator_id
+        ).exists()
+    ).scalar()
+
+
+def project_to_dict(project: Project, module_count: Optional[int] = None) -> dict:
+    """Serialize a project (with admin/scholar loaded) for ProjectResponse."""
+    return {
+        "id": project.id,
+        "name": project.name,
+        "description": project.description,
+        "admin_id": project.admin_id,
+        "admin_email": project.admin.email if project.admin else None,
+        "scholar_id": project.scholar_id,
+        "scholar_email": project.scholar.email if project.scholar else None,
+        "parquet_filename": project.parquet_filename,
+        "parquet_filepath": project.parquet_filepath,
+        "total_cases": project.total_cases,
+        "status": project.status,
+        "sent_to_scholar_at": project.sent_to_scholar_at,
+        "launched_at": project.launched_at,
+        "ai_model": project.ai_model,
+        "total_tokens_used": project.total_tokens_used,
+        "total_cost": project.total_cost,
+        "budget_limit": project.budget_limit,
+        "is_active": project.is_active,
+        "created_at": project.created_at,
+        "updated_at": project.updated_at,
+        "module_count": module_count,
+    }
@@ -0,0 +1,289 @@
+"""
+Parsing and normalization of LLM replies to module questions.
+
+parse_reply() reads a reply in one pass, whichever shape the model used:
+- a JSON object {"answer", "reasoning", "confidence"} - bare, fenced in
+  ```json``` or surrounded by prose (JSON mode replies)
+- labeled lines (ANSWER / REASONING / CONFIDENCE) in any case, with markdown
+  bold or bullets, preamble text, and values continuing over several lines;
+  a repeated label's last value counts and template placeholders such as
+  "[your answer here]" are skipped (models sometimes echo the format first)
+- otherwise the first line is taken as the answer (e.g. "Yes. The court...")
+
+The answer is then normalized for the module's answer type:
+- yes_no:          "Yes" / "No"
+- multiple_choice: the matching entry of answer_options
+- integer:         digits only ("1,204 ballots" -> "1204")
+- date:            ISO YYYY-MM-DD (ISO, US numeric or "March 3, 2020" forms)
+- text:            stripped text
+
+Confidence accepts fractions, percentages or high/medium/low and is clamped
+to 0-1; a missing confidence stays None instead of a made-up default.
+A reply whose answer is missing or can't be normalized comes back with
+`error` set, so the caller can re-ask that case instead of storing it.
+"""
+
+import json
+import re
+from datetime import date
+from typing import List, Optional
+
+_FIELDS = {
+    "answer": "answer",
+    "final answer": "answer",
+    "reasoning": "reasoning",
+    "reason": "reasoning",
+    "explanation": "reasoning",
+    "confidence": "confidence",
+    "confidence score": "confidence",
+}
+
+# "ANSWER: Yes", "**Answer:** Yes", "- reasoning - ...", "## Confidence: 0.9"
+_LABEL_RE = re.compile(
+    r"^[\s>*\-#_`]*(final answer|answer|reasoning|reason|explanation|confidence score|confidence)"
+    r"[\s*_`]*[:\-]\s*[*_`]*\s*(.*)$",
+    re.IGNORECASE
+)
+# An unfilled template value: "[your answer here]", "<answer>"
+_PLACEHOLDER_RE = re.compile(r"^(\[.*\]|<.*>)$")
+_NUMBER_RE = re.compile(r"(\d+(?:\.\d+)?|\.\d+)\s*(%)?")
+_CONFIDENCE_WORDS = {"very high": 0.95, "high": 0.9, "medium": 0.7, "moderate": 0.7, "low": 0.4, "very low": 0.2}
+
+_YES = {"yes", "y", "true", "affirmative", "correct"}
+_NO = {"no", "n", "false", "negative", "incorrect"}
+
+_NUMBER_WORDS = {
+    word: value for value, word in enumerate(
+        "zero one two three four five six seven eight nine ten eleven twelve thirteen "
+        "fourteen fifteen sixteen seventeen eighteen nineteen twenty".split()
+    )
+}
+_INTEGER_RE = re.compile(r"-?\d[\d,]*")
+
+_MONTHS = {
+    name: number
+    for number, names in enumerate([
+        ("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"),
+        ("may",), ("jun", "june"), ("jul", "july"), ("aug", "august"),
+        ("sep", "sept", "september"), ("oct", "october"), ("nov", "november"), ("dec", "december"),
+    ], start=1)
+    for name in names
+}
+_MONTH = r"(" + "|".join(sorted(_MONTHS, key=len, reverse=True)) + r")\.?"
+_ISO_DATE_RE = re.compile(r"\b(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})\b")
+_US_DATE_RE = re.compile(r"\b(\d{1,2})[/-](\d{1,2})[/-](\d{4})\b")
+_MONTH_DAY_YEAR_RE = re.compile(_MONTH + r"\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})\b", re.IGNORECASE)
+_DAY_MONTH_YEAR_RE = re.compile(r"\b(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?" + _MONTH + r",?\s+(\d{4})\b", re.IGNORECASE)
+
+
+class ParsedReply:
+    """Fields read from one reply; `error` is set when the answer is unusable."""
+
+    def __init__(self, answer: Optional[str] = None, reasoning: Optional[str] = None,
+                 confidence: Optional[float] = None, format: str = "bare", error: Optional[str] = None):
+        self.answer = answer
+        self.reasoning = reasoning
+        self.confidence = confidence
+        self.format = format
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        return (f"ParsedReply(answer={self.answer!r}, confidence={self.confidence!r}, "
+                f"format={self.format!r}, error={self.error!r})")
+
+
+def parse_reply(raw: Optional[str], answer_type: str, answer_options: Optional[List[str]] = None) -> ParsedReply:
+    """Read and normalize a model reply (see module docstring)."""
+    text = (raw or "").strip()
+    if not text:
+        return ParsedReply(error="empty reply")
+
+    reply = _read_json(text) or _read_labeled(text) or _read_bare(text)
+
+    if reply.answer is None or not str(reply.answer).strip():
+        reply.error = "no answer found"
+        return reply
+
+    answer = normalize_answer(str(reply.answer), answer_type, answer_options)
+    if answer is None:
+        reply.error = f"answer {str(reply.answer)[:80]!r} is not a valid {answer_type.replace('_', '/')} answer"
+    else:
+        reply.answer = answer
+    return reply
+
+
+def _read_json(text: str) -> Optional[ParsedReply]:
+    """The first JSON object in the text with an answer key, if any."""
+    start = text.find("{")
+    if start == -1:
+        return None
+    decoder = json.JSONDecoder()
+    while start != -1:
+        try:
+            obj, _ = decoder.raw_decode(text, start)
+        except json.JSONDecodeError:
+            obj = None
+        if isinstance(obj, dict):
+            fields = {str(key).strip().lower().replace("_", " "): value for key, value in obj.items()}
+            values = {}
+            for key, value in fields.items():
+                field = _FIELDS.get(key)
+                if field and field not in values:
+                    values[field] = value
+            if "answer" in values:
+                answer = values["answer"]
+                if isinstance(answer, bool):
+                    answer = "Yes" if answer else "No"
+                reasoning = values.get("reasoning")
+                return ParsedReply(
+                    answer=None if answer is None else str(answer),
+                    reasoning=None if reasoning is None else str(reasoning).strip(),
+                    confidence=parse_confidence(values.get("confidence")),
+                    format="json"
+                )
+        start = text.find("{", start + 1)
+    return None
+
+
+def _read_labeled(text: str) -> Optional[ParsedReply]:
+    """ANSWER / REASONING / CONFIDENCE lines; unlabeled lines continue the previous field."""
+    values = {}
+    current = None
+    for line in text.splitlines():
+        match = _LABEL_RE.match(line)
+        if match:
+            value = match.group(2).strip()
+            if _PLACEHOLDER_RE.match(value):
+                current = None  # echoed format template
+                continue
+            # A repeated label replaces the earlier value (template echoed, then answered)
+            current = _FIELDS[match.group(1).lower()]
+            values[current] = [value]
+        elif current and line.strip():
+            values[current].append(line.strip())
+
+    if "answer" not in values:
+        return None
+    answer = " ".join(part for part in values["answer"] if part)
+    reasoning = " ".join(part for part in values.get("reasoning", []) if part)
+    confidence = values.get("confidence")
+    return ParsedReply(
+        answer=answer.strip("*_` ") or None,
+        reasoning=reasoning or None,
+        confidence=parse_confidence(confidence[0]) if confidence else None,
+        format="labeled"
+    )
+
+
+def _read_bare(text: str) -> ParsedReply:
+    """No structure: the first line is the answer, the rest the reasoning."""
+    first, _, rest = text.partition("\n")
+    return ParsedReply(answer=first.strip(), reasoning=rest.strip() or None, format="bare")
+
+
+def parse_confidence(value) -> Optional[float]:
+    """0-1 confidence from 0.85, "85%", "85", "High", ...; None if absent or unreadable."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        number, percent = float(value), False
+    else:
+        text = str(value).strip().lower()
+        for word, score in _CONFIDENCE_WORDS.items():
+            if text.startswith(word):
+                return score
+        match = _NUMBER_RE.search(text)
+        if not match:
+            return None
+        number, percent = float(match.group(1)), bool(match.group(2))
+    if percent or 1 < number <= 100:
+        number /= 100
+    return min(max(number, 0.0), 1.0)
+
+
+def normalize_answer(answer: str, answer_type: str, answer_options: Optional[List[str]] = None) -> Optional[str]:
+    """Canonical form of an answer for its type, or None if it doesn't fit."""
+    answer = answer.strip().strip("*_`\"'").strip()
+    if not answer:
+        return None
+    if answer_type == "yes_no":
+        return _normalize_yes_no(answer)
+    if answer_type == "multiple_choice" and answer_options:
+        return _match_option(answer, answer_options)
+    if answer_type == "integer":
+        return _normalize_integer(answer)
+    if answer_type == "date":
+        return _normalize_date(answer)
+    return answer
+
+
+def _words(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def _normalize_yes_no(answer: str) -> Optional[str]:
+    words = _words(answer)
+    if not words:
+        return None
+    if words[0] in _YES:
+        return "Yes"
+    if words[0] in _NO:
+        return "No"
+    return None
+
+
+def _match_option(answer: str, options: List[str]) -> Optional[str]:
+    """Exact (case/punctuation-insensitive) match, else the longest option named in the answer."""
+    wanted = " ".join(_words(answer))
+    normalized = [(" ".join(_words(option)), option) for option in options]
+    for key, option in normalized:
+        if key == wanted:
+            return option
+    contained = [(len(key), option) for key, option in normalized if key and f" {key} " in f" {wanted} "]
+    if not contained:
+        return None
+    contained.sort(reverse=True)
+    if len(contained) > 1 and contained[0][0] == contained[1][0]:
+        return None  # two different options named equally specifically
+    return contained[0][1]
+
+
+def _normalize_integer(answer: str) -> Optional[str]:
+    match = _INTEGER_RE.search(answer)
+    if match:
+        digits = match.group(0).replace(",", "")
+        try:
+            return str(int(digits))
+        except ValueError:
+            return None
+    words = _words(answer)
+    if words and words[0] in _NUMBER_WORDS:
+        return str(_NUMBER_WORDS[words[0]])
+    return None
+
+
+def _normalize_date(answer: str) -> Optional[str]:
+    candidates = []
+    match = _ISO_DATE_RE.search(answer)
+    if match:
+        candidates.append((int(match.group(1)), int(match.group(2)), int(match.group(3))))
+    match = _US_DATE_RE.search(answer)
+    if match:
+        candidates.append((int(match.group(3)), int(match.group(1)), int(match.group(2))))
+    match = _MONTH_DAY_YEAR_RE.search(answer)
+    if match:
+        candidates.append((int(match.group(3)), _MONTHS[match.group(1).lower()], int(match.group(2))))
+    match = _DAY_MONTH_YEAR_RE.search(answer)
+    if match:
+        candidates.append((int(match.group(3)), _MONTHS[match.group(2).lower()], int(match.group(1))))
+
+    for year, month, day in candidates:
+        try:
+            return date(year, month, day).isoformat()
+        except ValueError:
+            continue
+    return None
@@ -0,0 +1,123 @@
+"""
+Case sampling for verification modules.
+
+A module can restrict its sampling frame with an inclusion query
+(VerificationModule.inclusion_query), e.g.:
+
+    {
+        "text": "recount \"absentee ballots\"",
+        "court": "Supreme Court of Ohio",
+        "state": "OH",
+        "election_type": "General",
+        "date_from": "2000-01-01",
+        "date_to": "2020-12-31"
+    }
+
+Every key is optional. "text" is resolved through the full-text search index
+and the metadata keys through the court_cases indexes, all in one query that
+returns candidate ids only. The sample is drawn from those ids, so only the
+sampled cases are ever loaded with their opinion text.
+
+A module can also sample cases that resemble its approved corrections:
+
+    {"similar_to_corrections": true, "similar_k": 50}
+
+restricts the frame to the similar_k nearest neighbours (embedding index) of
+each case in the module's feedback library, combined with any other keys.
+The neighbour set can hold tens of thousands of ids, more than SQLite binds
+in one statement, so it is intersected with the frame in Python rather than
+sent as an IN list.
+"""
+
+import random
+from datetime import date
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models import CourtCase, FeedbackLibrary, VerificationModule
+from app.utils.case_queries import apply_case_filters
+from app.utils.embeddings import load_embedding_index
+from app.utils.search_index import search_index_available, text_match_clause
+
+
+DEFAULT_SIMILAR_K = 50
+
+
+def sampling_frame_ids(db: Session, project_id: int, inclusion_query: Optional[dict] = None,
+                       module_id: Optional[int] = None) -> List[int]:
+    """
+    Get the ids of all cases a module may sample from.
+
+    Args:
+        module_id: Module whose feedback library seeds "similar_to_corrections"
+
+    Raises:
+        ValueError: If the inclusion query uses text terms and no search index exists,
+                    or asks for similar cases and the project has no embedding index
+    """
+    inclusion_query = inclusion_query or {}
+
+    query = db.query(CourtCase.id).filter(CourtCase.project_id == project_id)
+    query = apply_case_filters(
+        query,
+        court=inclusion_query.get("court"),
+        state=inclusion_query.get("state"),
+        election_type=inclusion_query.get("election_type"),
+        date_from=_parse_date(inclusion_query.get("date_from")),
+        date_to=_parse_date(inclusion_query.get("date_to"))
+    )
+
+    if inclusion_query.get("text"):
+        if not search_index_available(db):
+            raise ValueError("Full-text search index is not available; cannot filter cases by text")
+        clause = text_match_clause(db, inclusion_query["text"])
+        if clause is not None:
+            query = query.filter(clause)
+
+    similar_ids = None
+    if inclusion_query.get("similar_to_corrections") and module_id is not None:
+        index = load_embedding_index(project_id)
+        if index is None:
+            raise ValueError("Embedding index is not built for this project; cannot sample similar cases")
+        seed_ids = [
+            case_id for (case_id,) in db.query(FeedbackLibrary.example_case_id).filter(
+                FeedbackLibrary.module_id == module_id
+            ).all()
+        ]
+        similar_ids = set(index.neighbours(seed_ids, k=inclusion_query.get("similar_k") or DEFAULT_SIMILAR_K))
+        if not similar_ids:
+            return []
+
+    frame = [case_id for (case_id,) in query.all()]
+    if similar_ids is not None:
+        frame = [case_id for case_id in frame if case_id in similar_ids]
+    return frame
+
+
+def draw_sample(db: Session, module: VerificationModule, sample_size: int) -> Tuple[List[CourtCase], int]:
+    """
+    Randomly sample cases from the module's sampling frame.
+
+    Returns:
+        (sampled cases in random order, frame size)
+        Fewer than sample_size cases are returned when the frame is smaller.
+    """
+    frame = sampling_frame_ids(db, module.project_id, module.inclusion_query, module_id=module.id)
+    sampled_ids = random.sample(frame, min(sample_size, len(frame)))
+
+    if not sampled_ids:
+        return [], len(frame)
+
+    cases_by_id = {
+        case.id: case
+        for case in db.query(CourtCase).filter(CourtCase.id.in_(sampled_ids)).all()
+    }
+    return [cases_by_id[case_id] for case_id in sampled_ids], len(frame)
+
+
+def _parse_date(value) -> Optional[date]:
+    """Accept date objects or ISO strings (JSON column values)."""
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
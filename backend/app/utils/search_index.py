@@ -0,0 +1,249 @@
+"""
+Full-text search over court opinions.
+
+Indexes CourtCase.opinion_text, dissent_text and concur_text:
+- SQLite: an FTS5 external-content table (court_cases_fts) kept in sync by
+  triggers on court_cases, so imports and deletes update it automatically
+- PostgreSQL: a generated tsvector column (court_cases.search_vector) with a
+  GIN index, which Postgres keeps in sync itself
+
+Both use English stemming and return ranked results with a highlighted snippet.
+"""
+
+import re
+from typing import List, Optional
+
+from sqlalchemy import column, inspect, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.models import CourtCase
+
+FTS_TABLE = "court_cases_fts"
+
+# Matches "quoted phrases" or single terms in a user query
+_TERM_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+# ============================================================================
+# DDL
+# ============================================================================
+
+_SQLITE_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        opinion_text, dissent_text, concur_text,
+        content='court_cases', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON court_cases BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, opinion_text, dissent_text, concur_text)
+        VALUES (new.id, new.opinion_text, new.dissent_text, new.concur_text);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON court_cases BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, opinion_text, dissent_text, concur_text)
+        VALUES ('delete', old.id, old.opinion_text, old.dissent_text, old.concur_text);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+    AFTER UPDATE OF opinion_text, dissent_text, concur_text ON court_cases BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, opinion_text, dissent_text, concur_text)
+        VALUES ('delete', old.id, old.opinion_text, old.dissent_text, old.concur_text);
+        INSERT INTO {FTS_TABLE}(rowid, opinion_text, dissent_text, concur_text)
+        VALUES (new.id, new.opinion_text, new.dissent_text, new.concur_text);
+    END
+    """,
+]
+
+_POSTGRES_DDL = [
+    """
+    ALTER TABLE court_cases ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(opinion_text, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(concur_text, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(dissent_text, '')), 'B')
+    ) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_court_cases_search_vector
+    ON court_cases USING GIN (search_vector)
+    """,
+]
+
+
+def create_search_index(connection: Connection) -> bool:
+    """
+    Create the search index if it doesn't exist yet (safe to call repeatedly).
+
+    Existing cases are indexed the first time the SQLite FTS table is created.
+
+    Returns:
+        True if full-text search is available on this database
+    """
+    table_names = inspect(connection).get_table_names()
+    if "court_cases" not in table_names:
+        return False
+
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        is_new = FTS_TABLE not in table_names
+        try:
+            for statement in _SQLITE_DDL:
+                connection.execute(text(statement))
+        except OperationalError:
+            # SQLite built without FTS5
+            return False
+        if is_new:
+            rebuild_search_index(connection)
+        return True
+
+    if dialect == "postgresql":
+        for statement in _POSTGRES_DDL:
+            connection.execute(text(statement))
+        return True
+
+    return False
+
+
+def rebuild_search_index(connection: Connection):
+    """Re-index every case (SQLite only; Postgres generated columns never drift)."""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+
+
+def search_index_available(db: Session) -> bool:
+    """True if the search index exists on the session's database."""
+    bind = db.get_bind()
+    if bind.dialect.name == "sqlite":
+        return db.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": FTS_TABLE}
+        ).first() is not None
+    if bind.dialect.name == "postgresql":
+        return db.execute(text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'court_cases' AND column_name = 'search_vector'"
+        )).first() is not None
+    return False
+
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+def to_fts5_query(query: str) -> Optional[str]:
+    """
+    Convert a user query into FTS5 syntax.
+
+    Terms and "quoted phrases" are ANDed together; a bare OR between two
+    terms is kept as OR. Every term is quoted so punctuation in user input
+    can't break the MATCH expression.
+
+    Example:
+        to_fts5_query('recount "absentee ballots" OR mail')
+        # Returns: '"recount" "absentee ballots" OR "mail"'
+    """
+    parts = []
+    for phrase, word in _TERM_RE.findall(query):
+        if word == "OR":
+            if parts and parts[-1] != "OR":
+                parts.append("OR")
+            continue
+        term = (phrase or word).replace('"', "").strip()
+        if term:
+            parts.append(f'"{term}"')
+
+    if parts and parts[-1] == "OR":
+        parts.pop()
+    return " ".join(parts) or None
+
+
+def text_match_clause(db: Session, query: str):
+    """
+    SQL filter on CourtCase that keeps cases whose text matches the query.
+
+    Resolved through the inverted index, so it can be combined with other
+    CourtCase filters in a single statement. Returns None for an empty query.
+    """
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        match = to_fts5_query(query)
+        if not match:
+            return None
+        matching_ids = text(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match"
+        ).bindparams(match=match).columns(column("rowid")).subquery()
+        return CourtCase.id.in_(select(matching_ids.c.rowid))
+
+    if dialect == "postgresql":
+        return text(
+            "court_cases.search_vector @@ websearch_to_tsquery('english', :query)"
+        ).bindparams(query=query)
+
+    return None
+
+
+def search_cases(db: Session, project_id: int, query: str, limit: int = 20) -> List[dict]:
+    """
+    Ranked full-text search within one project.
+
+    Returns:
+        List of {case_id, case_name, court, case_date, score, snippet},
+        best match first. Snippet matches are wrapped in <mark></mark>.
+    """
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        match = to_fts5_query(query)
+        if not match:
+            return []
+        # bm25 is lower-is-better; weight the majority opinion above the others
+        rows = db.execute(text(f"""
+            SELECT c.id, c.case_name, c.court, c.case_date,
+                   -bm25({FTS_TABLE}, 1.0, 0.5, 0.5) AS score,
+                   snippet({FTS_TABLE}, -1, '<mark>', '</mark>', '…', 24) AS snippet
+            FROM {FTS_TABLE}
+            JOIN court_cases c ON c.id = {FTS_TABLE}.rowid
+            WHERE {FTS_TABLE} MATCH :match AND c.project_id = :project_id
+            ORDER BY bm25({FTS_TABLE}, 1.0, 0.5, 0.5)
+            LIMIT :limit
+        """), {"match": match, "project_id": project_id, "limit": limit}).all()
+
+    elif dialect == "postgresql":
+        # Rank and limit first, then build headlines only for the returned rows
+        rows = db.execute(text("""
+            SELECT ranked.id, ranked.case_name, ranked.court, ranked.case_date, ranked.score,
+                   ts_headline('english', coalesce(c.opinion_text, ''), ranked.q,
+                               'StartSel=<mark>, StopSel=</mark>, MaxFragments=1, MaxWords=24, MinWords=8') AS snippet
+            FROM (
+                SELECT c.id, c.case_name, c.court, c.case_date, q,
+                       ts_rank_cd(c.search_vector, q) AS score
+                FROM court_cases c, websearch_to_tsquery('english', :query) q
+                WHERE c.project_id = :project_id AND c.search_vector @@ q
+                ORDER BY score DESC
+                LIMIT :limit
+            ) ranked
+            JOIN court_cases c ON c.id = ranked.id
+            ORDER BY ranked.score DESC
+        """), {"query": query, "project_id": project_id, "limit": limit}).all()
+
+    else:
+        return []
+
+    return [
+        {
+            "case_id": row.id,
+            "case_name": row.case_name,
+            "court": row.court,
+            "case_date": str(row.case_date)[:10] if row.case_date else None,
+            "score": float(row.score),
+            "snippet": row.snippet,
+        }
+        for row in rows
+    ]
@@ -0,0 +1,161 @@
+"""
+Token counting for AI prompts and replies.
+
+Each model gets a TokenCounter:
+- with the `tokenizers` package installed and TOKENIZER_DIR holding the
+  model's tokenizer.json (<model>.json, "/" in the name as "--"), counts are
+  exact and opinions are cut at a token boundary
+- otherwise counts come from a characters-per-token ratio, calibrated as
+  calls finish against the prompt_tokens the provider reports (moving
+  average, starting at CHARS_PER_TOKEN)
+
+The counter decides how much opinion text goes into a prompt: at most
+AI_MAX_OPINION_TOKENS, and never more than fits the model's context window
+next to the rest of the prompt, the reply and any re-asks.
+reply_token_cap() sizes max_tokens by answer type - a Yes/No reply needs a
+fraction of what a free-text answer does, and the cap is what budgets and
+provider rate limits are charged up front.
+"""
+
+import logging
+import math
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    from tokenizers import Tokenizer
+except ImportError:  # optional: calibrated estimate instead
+    Tokenizer = None
+
+# Starting characters-per-token ratio (English prose, Llama 3 tokenizer: ~4-4.5)
+CHARS_PER_TOKEN = 4
+
+# Calibration: weight of each observed call, and bounds on the learned ratio
+CALIBRATION_WEIGHT = 0.1
+CHARS_PER_TOKEN_RANGE = (2.0, 8.0)
+
+# Estimated counts may be off by a few percent; keep this share of the window free
+ESTIMATE_HEADROOM = 0.1
+
+# Context window (tokens) per model
+CONTEXT_WINDOWS = {
+    "llama-3.1-8b-instant": 131072,
+    "llama-3.3-70b-versatile": 131072,
+    "meta-llama/llama-4-maverick-17b-128e-instruct": 131072,
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+
+# max_tokens per answer type: the answer plus 2-4 sentences of reasoning and
+# a confidence, with room for JSON keys and the odd longer sentence
+REPLY_TOKENS = {
+    "yes_no": 200,
+    "integer": 200,
+    "date": 200,
+    "multiple_choice": 200,  # plus the longest option
+    "text": 400,
+}
+DEFAULT_REPLY_TOKENS = 500
+
+# Tokens of the follow-up message of a re-ask (_reask_instruction)
+REASK_TOKENS = 100
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate at the default ratio (no model needed)."""
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+class TokenCounter:
+    """Token counts and truncation for one model."""
+
+    def __init__(self, model: str):
+        self.model = model
+        self.context_window = CONTEXT_WINDOWS.get(model, DEFAULT_CONTEXT_WINDOW)
+        self.chars_per_token = float(CHARS_PER_TOKEN)
+        self.observations = 0
+        self.tokenizer = _load_tokenizer(model)
+
+    @property
+    def exact(self) -> bool:
+        return self.tokenizer is not None
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self.tokenizer is not None:
+            return len(self.tokenizer.encode(text, add_special_tokens=False).ids)
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def count_messages(self, messages: List[dict]) -> int:
+        return self.count("\n".join(m["content"] for m in messages))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """The longest prefix of text within max_tokens."""
+        if max_tokens <= 0 or not text:
+            return ""
+        if self.tokenizer is None:
+            return text[:int(max_tokens * self.chars_per_token)]
+        # Tokens are rarely over 16 characters: don't encode the whole opinion
+        head = text[:max_tokens * 16]
+        encoding = self.tokenizer.encode(head, add_special_tokens=False)
+        if len(encoding.ids) <= max_tokens:
+            return head
+        return head[:encoding.offsets[max_tokens - 1][1]]
+
+    def observe(self, text: str, prompt_tokens: Optional[int]):
+        """Calibrate the ratio against the prompt tokens the provider reported."""
+        if self.tokenizer is not None or not prompt_tokens or not text:
+            return
+        low, high = CHARS_PER_TOKEN_RANGE
+        observed = min(max(len(text) / prompt_tokens, low), high)
+        self.chars_per_token += CALIBRATION_WEIGHT * (observed - self.chars_per_token)
+        self.observations += 1
+
+    def opinion_allowance(self, prompt_tokens: int, reply_tokens: int) -> int:
+        """
+        Opinion tokens a prompt can take: AI_MAX_OPINION_TOKENS, or less if
+        the rest of the prompt (prompt_tokens), the reply and the re-asks
+        would otherwise overflow the context window.
+        """
+        window = self.context_window if self.exact else int(self.context_window * (1 - ESTIMATE_HEADROOM))
+        reasks = settings.AI_REASK_ATTEMPTS * (reply_tokens + REASK_TOKENS)
+        room = window - prompt_tokens - reply_tokens - reasks
+        return max(0, min(settings.AI_MAX_OPINION_TOKENS, room))
+
+
+_counters: Dict[str, TokenCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def token_counter(model: str) -> TokenCounter:
+    """The shared counter of a model (calibration carries across launches)."""
+    with _counters_lock:
+        if model not in _counters:
+            _counters[model] = TokenCounter(model)
+        return _counters[model]
+
+
+def _load_tokenizer(model: str):
+    if Tokenizer is None or not settings.TOKENIZER_DIR:
+        return None
+    path = Path(settings.TOKENIZER_DIR) / f"{model.replace('/', '--')}.json"
+    if not path.exists():
+        return None
+    try:
+        return Tokenizer.from_file(str(path))
+    except Exception as e:
+        logger.warning("Could not load tokenizer %s: %s - estimating token counts", path, e)
+        return None
+
+
+def reply_token_cap(answer_type: str, answer_options: Optional[List[str]] = None) -> int:
+    """max_tokens for a reply to a question of this answer type."""
+    cap = REPLY_TOKENS.get(answer_type, DEFAULT_REPLY_TOKENS)
+    if answer_type == "multiple_choice" and answer_options:
+        cap += max(estimate_tokens(option) for option in answer_options)
+    return cap
@@ -0,0 +1,200 @@
+"""
+Span tracing for the AI analysis pipeline.
+
+A trace covers one module launch. Spans inside it time the pipeline stages
+(sampling, prompt build, provider call, parse, DB write, assignment creation)
+and carry attributes such as case ids and token counts. Finished traces are
+appended to TRACE_FILE as JSON lines, one span per line, with
+OpenTelemetry-style trace/span ids and unix-nanosecond timestamps.
+
+TRACE_LEVEL sets how much is written:
+- off:   nothing
+- round: the root span and one span per stage
+- case:  also one span per case and its steps (latency, tokens)
+- debug: also the raw provider response (first 500 characters)
+
+The root span always carries per-stage totals (stage_ms, stage_count) summed
+over every span, including ones the level doesn't write, so "round" still
+shows where round time goes.
+
+Usage:
+    with start_trace("launch_module", module_id=module.id):
+        with span("sampling") as sampling_span:
+            cases, frame_size = draw_sample(db, module, module.sample_size)
+            sampling_span.set(frame_size=frame_size)
+"""
+
+import json
+import logging
+import secrets
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+LEVELS = {"off": 0, "round": 1, "case": 2, "debug": 3}
+
+# Characters of free text (e.g. raw responses) kept at TRACE_LEVEL=debug
+DEBUG_TEXT_CHARS = 500
+
+
+class Span:
+    """One timed stage of a trace."""
+
+    def __init__(self, trace: "Trace", name: str, parent_id: Optional[str], attributes: dict):
+        self.trace = trace
+        self.name = name
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.attributes = dict(attributes)
+        self.status = "ok"
+        self.start_ns = time.time_ns()
+        self._start = time.perf_counter()
+        self.duration_ms: Optional[float] = None
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def debug(self, **attributes):
+        """Attributes written only at TRACE_LEVEL=debug (long strings truncated)."""
+        if self.trace.level >= LEVELS["debug"]:
+            self.attributes.update({
+                key: value[:DEBUG_TEXT_CHARS] if isinstance(value, str) else value
+                for key, value in attributes.items()
+            })
+
+    def record_error(self, error: BaseException):
+        self.status = "error"
+        self.attributes["error.type"] = type(error).__name__
+        self.attributes["error.message"] = str(error)[:DEBUG_TEXT_CHARS]
+
+    def end(self):
+        self.duration_ms = (time.perf_counter() - self._start) * 1000
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "name": self.name,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.start_ns + int(self.duration_ms * 1_000_000),
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """Stand-in yielded when tracing is off, so call sites needn't check."""
+
+    def set(self, **attributes):
+        pass
+
+    def debug(self, **attributes):
+        pass
+
+    def record_error(self, error: BaseException):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """Spans of one pipeline run, buffered until the run ends."""
+
+    def __init__(self, level: int):
+        self.trace_id = secrets.token_hex(16)
+        self.level = level
+        self.root: Optional[Span] = None
+        self.spans: List[Span] = []
+        self.stage_ms = defaultdict(float)
+        self.stage_count = defaultdict(int)
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("span", default=None)
+
+
+@contextmanager
+def span(name: str, level: str = "round", **attributes):
+    """
+    Time a stage of the current trace (no-op outside a trace).
+
+    `level` is the lowest TRACE_LEVEL at which the span is written; its time
+    counts towards the root's stage totals either way. Exceptions mark the
+    span as an error and propagate.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield _NOOP_SPAN
+        return
+
+    parent = _current_span.get()
+    current = Span(trace, name, parent.span_id if parent else None, attributes)
+    if parent is None:
+        trace.root = current
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.record_error(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        current.end()
+        if current is trace.root:
+            current.set(
+                stage_ms={stage: round(ms, 3) for stage, ms in trace.stage_ms.items()},
+                stage_count=dict(trace.stage_count)
+            )
+        else:
+            trace.stage_ms[name] += current.duration_ms
+            trace.stage_count[name] += 1
+        if trace.level >= LEVELS[level]:
+            trace.spans.append(current)
+
+
+@contextmanager
+def start_trace(name: str, **attributes):
+    """Open a trace with a root span; it is exported when the block exits."""
+    level = LEVELS[settings.TRACE_LEVEL]
+    if level == LEVELS["off"]:
+        yield _NOOP_SPAN
+        return
+
+    trace = Trace(level)
+    token = _current_trace.set(trace)
+    try:
+        with span(name, **attributes) as root:
+            yield root
+    finally:
+        _current_trace.reset(token)
+        export_trace(trace)
+
+
+_export_lock = threading.Lock()
+
+
+def export_trace(trace: Trace):
+    """Append a trace's spans to TRACE_FILE (one JSON object per line)."""
+    if not trace.spans:
+        return
+    lines = "".join(json.dumps(s.to_dict(), default=str) + "\n" for s in trace.spans)
+    path = Path(settings.TRACE_FILE)
+    try:
+        with _export_lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(lines)
+    except OSError as e:
+        # Tracing must never fail a launch
+        logger.warning("Could not write trace %s to %s: %s", trace.trace_id, path, e)
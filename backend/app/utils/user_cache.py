@@ -0,0 +1,103 @@
+"""
+In-process cache of authenticated users.
+
+get_current_user resolves the JWT subject (email) through this cache instead
+of querying the users table on every request:
+- entries live for USER_CACHE_TTL_SECONDS and the cache holds at most
+  USER_CACHE_SIZE users (least recently used evicted first)
+- any ORM insert/update/delete of a User drops the affected entries, and a
+  bulk UPDATE/DELETE on users clears the whole cache
+- the TTL bounds staleness across worker processes, which don't share memory
+
+Cached values are column snapshots, not session-bound objects, so they are
+safe to share between requests and threads.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models import User
+
+# Columns copied into the cache (hashed_password is never cached)
+CACHED_COLUMNS = ("id", "email", "role", "full_name", "is_active", "created_at", "updated_at")
+
+
+class UserCache:
+    """Thread-safe TTL + LRU cache of user snapshots keyed by token subject."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, subject: str) -> Optional[User]:
+        """Fresh cached user for a subject, or None."""
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[subject]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(subject)
+            self.hits += 1
+            snapshot = entry[1]
+        # A new transient User per request; never attached to a session
+        return User(**snapshot)
+
+    def put(self, subject: str, user: User):
+        """Cache a snapshot of a user loaded from the database."""
+        snapshot = {column: getattr(user, column) for column in CACHED_COLUMNS}
+        with self._lock:
+            self._entries[subject] = (time.monotonic() + self.ttl_seconds, snapshot)
+            self._entries.move_to_end(subject)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, subject: str):
+        with self._lock:
+            self._entries.pop(subject, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+user_cache = UserCache(settings.USER_CACHE_SIZE, settings.USER_CACHE_TTL_SECONDS)
+
+
+# ============================================================================
+# INVALIDATION
+# ============================================================================
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_changed_user(mapper, connection, target):
+    """Drop a user's entry when it changes (old and new email on renames)."""
+    history = inspect(target).attrs.email.history
+    for email in {target.email, *history.deleted}:
+        if email:
+            user_cache.invalidate(email)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_on_bulk_change(orm_execute_state):
+    """Bulk UPDATE/DELETE on users bypasses per-object events; clear everything."""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ is User:
+        user_cache.clear()
@@ -0,0 +1,119 @@
+"""
+Benchmark: local embedding index (build throughput and top-k query latency).
+
+1. Builds an index from N synthetic opinions through build_embedding_index
+   (reports cases/second).
+2. Writes a V-vector matrix straight to a memory-mapped file, loads it the way
+   the app does and times top-k cosine queries and batched neighbour lookups.
+
+Index files go to a temporary folder, never to uploads/.
+
+Usage (from backend/):
+    python -m benchmarks.bench_embeddings
+    python -m benchmarks.bench_embeddings --cases 20000 --vectors 500000 --k 50
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+from app.core.config import settings
+from app.models import UserRole, Project, CourtCase
+from app.utils.embeddings import build_embedding_index, index_dir, load_embedding_index
+from benchmarks.common import make_session_factory, make_user, timed
+
+TOPICS = [
+    "absentee ballots recount canvass county board certified tally",
+    "ballot access petition signatures nominating filing deadline",
+    "campaign finance contribution disclosure committee expenditure",
+    "redistricting apportionment district boundaries population census",
+    "voter registration purge residency eligibility identification",
+]
+FILLER = "court held appeal statute election judgment review trial evidence".split()
+
+
+def synthetic_opinion(rng: random.Random, words: int = 600) -> str:
+    """Filler text with a dominant topic, so neighbours are meaningful."""
+    topic = rng.choice(TOPICS).split()
+    return " ".join(rng.choice(topic if rng.random() < 0.3 else FILLER) for _ in range(words))
+
+
+def bench_build(n_cases: int):
+    _, SessionFactory = make_session_factory()
+    db = SessionFactory()
+    admin = make_user(db, "admin@bench.edu", UserRole.ADMIN)
+    project = Project(name="Embeddings", admin_id=admin.id)
+    db.add(project)
+    db.flush()
+
+    rng = random.Random(7)
+    db.add_all([
+        CourtCase(project_id=project.id, case_name=f"Case {i}", opinion_text=synthetic_opinion(rng))
+        for i in range(n_cases)
+    ])
+    db.commit()
+
+    start = time.perf_counter()
+    index = build_embedding_index(db, project.id)
+    elapsed = time.perf_counter() - start
+    print(f"  build: {n_cases} cases in {elapsed:.2f} s ({n_cases / elapsed:,.0f} cases/s)")
+
+    assert len(index) == n_cases
+    db.close()
+
+
+def bench_query(n_vectors: int, k: int, project_id: int = 999999):
+    dim = settings.EMBEDDING_DIM
+    folder = index_dir(project_id)
+    folder.mkdir(parents=True)
+
+    with timed(f"write {n_vectors:,} x {dim} vectors"):
+        rng = np.random.default_rng(7)
+        centers = rng.standard_normal((64, dim), dtype=np.float32)
+        vectors = np.lib.format.open_memmap(
+            folder / "vectors.npy", mode="w+", dtype=np.float32, shape=(n_vectors, dim)
+        )
+        for start in range(0, n_vectors, 50000):
+            stop = min(start + 50000, n_vectors)
+            block = centers[rng.integers(0, 64, stop - start)]
+            block += 0.5 * rng.standard_normal(block.shape, dtype=np.float32)
+            vectors[start:stop] = block / np.linalg.norm(block, axis=1, keepdims=True)
+        vectors.flush()
+        del vectors
+        np.save(folder / "ids.npy", np.arange(1, n_vectors + 1, dtype=np.int64))
+        np.save(folder / "idf.npy", np.ones(1, dtype=np.float32))
+
+    with timed("load index (memory-mapped)"):
+        index = load_embedding_index(project_id)
+
+    query_ids = random.Random(7).sample(range(1, n_vectors + 1), 20)
+    latencies = []
+    for case_id in query_ids:
+        start = time.perf_counter()
+        results = index.most_similar(index.vector(case_id), k=k, exclude=[case_id])
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert len(results) == k and case_id not in {r[0] for r in results}
+
+    print(f"  top-{k} query: p50 {statistics.median(latencies):.1f} ms, max {max(latencies):.1f} ms")
+
+    seed_ids = random.Random(8).sample(range(1, n_vectors + 1), 50)
+    with timed(f"neighbours of 50 seeds (k={k})"):
+        found = index.neighbours(seed_ids, k=k)
+    print(f"  neighbour frame: {len(found)} cases")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cases", type=int, default=5000, help="synthetic opinions to embed")
+    parser.add_argument("--vectors", type=int, default=500000, help="vectors in the query benchmark")
+    parser.add_argument("--k", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.EMBEDDING_DIR = tmp
+        bench_build(args.cases)
+        bench_query(args.vectors, args.k)
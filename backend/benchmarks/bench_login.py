@@ -0,0 +1,91 @@
+"""
+Benchmark: login throughput under concurrency (bcrypt cost).
+
+Seeds U users whose hashes use an outdated bcrypt cost, then logs them all
+in from C concurrent threads, once with hashing on the request threads
+(PASSWORD_HASH_WORKERS=0) and once through the worker pool. The first pass
+also upgrades every stored hash to BCRYPT_ROUNDS.
+
+Usage (from backend/):
+    python -m benchmarks.bench_login
+    python -m benchmarks.bench_login --users 64 --concurrency 32 --rounds 12 --workers 4
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.security import OAuth2PasswordRequestForm
+
+from app.core.config import settings
+from app.models import User, UserRole
+from app.routers.auth import login
+from app.utils.auth import get_pwd_context, shutdown_password_pool
+from benchmarks.common import make_session_factory
+
+PASSWORD = "validator123"
+
+
+def seed(SessionFactory, n_users: int, old_rounds: int):
+    db = SessionFactory()
+    old_hash = get_pwd_context(old_rounds).hash(PASSWORD)
+    db.add_all([
+        User(email=f"ta{i}@bench.edu", hashed_password=old_hash, role=UserRole.VALIDATOR)
+        for i in range(n_users)
+    ])
+    db.commit()
+    db.close()
+
+
+def run_logins(SessionFactory, n_users: int, concurrency: int, label: str):
+    def one_login(i):
+        db = SessionFactory()
+        try:
+            form = OAuth2PasswordRequestForm(username=f"ta{i}@bench.edu", password=PASSWORD)
+            return login(form_data=form, db=db)["access_token"]
+        finally:
+            db.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as threads:
+        tokens = list(threads.map(one_login, range(n_users)))
+    elapsed = time.perf_counter() - start
+
+    assert all(tokens)
+    print(f"  {label}: {n_users} logins in {elapsed:.2f} s ({n_users / elapsed:.1f} logins/s)")
+
+
+def count_upgraded(SessionFactory, rounds: int) -> int:
+    db = SessionFactory()
+    prefix = f"$2b${rounds:02d}$"
+    upgraded = db.query(User).filter(User.hashed_password.startswith(prefix)).count()
+    db.close()
+    return upgraded
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=10, help="BCRYPT_ROUNDS for the run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    args = parser.parse_args()
+
+    settings.BCRYPT_ROUNDS = args.rounds
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # File database: sessions are used from several threads at once
+        _, SessionFactory = make_session_factory(f"sqlite:///{tmp}/bench.db")
+        seed(SessionFactory, args.users, old_rounds=args.rounds - 1)
+
+        settings.PASSWORD_HASH_WORKERS = 0
+        run_logins(SessionFactory, args.users, args.concurrency, "request threads (with hash upgrade)")
+        print(f"  hashes upgraded to {args.rounds} rounds: {count_upgraded(SessionFactory, args.rounds)}/{args.users}")
+        run_logins(SessionFactory, args.users, args.concurrency, "request threads")
+
+        settings.PASSWORD_HASH_WORKERS = args.workers
+        run_logins(SessionFactory, args.users, args.concurrency, "warm-up pool")
+        run_logins(SessionFactory, args.users, args.concurrency, f"process pool ({args.workers} workers)")
+        shutdown_password_pool()
@@ -0,0 +1,113 @@
+"""
+Benchmark: validator dashboard (get_my_assignments).
+
+Seeds one validator with N modules x M assigned cases (half validated) and
+checks that the number of SQL statements does not grow with N.
+
+Usage (from backend/):
+    python -m benchmarks.bench_my_assignments
+    python -m benchmarks.bench_my_assignments --modules 50 --cases 500
+"""
+
+import argparse
+import asyncio
+import tempfile
+
+from app.models import (
+    UserRole, Project, CourtCase, VerificationModule, ValidatorAssignment,
+    AIAnalysis, ValidationFeedback
+)
+from app.routers.modules import get_my_assignments
+from benchmarks.common import (
+    make_async_session_factory, make_session_factory, make_user, QueryCounter, timed
+)
+
+
+def seed(db, n_modules: int, n_cases: int):
+    """Create one project per 10 modules, each module with n_cases assignments."""
+    admin = make_user(db, "admin@bench.edu", UserRole.ADMIN)
+    scholar = make_user(db, "scholar@bench.edu", UserRole.SCHOLAR)
+    validator = make_user(db, "ta@bench.edu", UserRole.VALIDATOR)
+
+    projects = []
+    for p in range(max(1, n_modules // 10)):
+        project = Project(name=f"Project {p}", admin_id=admin.id, scholar_id=scholar.id)
+        db.add(project)
+        projects.append(project)
+    db.flush()
+
+    cases = [CourtCase(project_id=projects[0].id, case_name=f"Case {i}") for i in range(n_cases)]
+    db.add_all(cases)
+    db.flush()
+
+    for m in range(n_modules):
+        module = VerificationModule(
+            project_id=projects[m % len(projects)].id,
+            module_number=m + 1,
+            module_name=f"Module {m}",
+            question_text="Was the election contested?",
+            answer_type="yes_no",
+            sample_size=n_cases,
+            status="validation_in_progress"
+        )
+        db.add(module)
+        db.flush()
+
+        assignments = [
+            ValidatorAssignment(module_id=module.id, case_id=c.id, validator_id=validator.id)
+            for c in cases
+        ]
+        analyses = [
+            AIAnalysis(module_id=module.id, case_id=c.id, ai_answer="Yes", ai_round=1)
+            for c in cases
+        ]
+        db.add_all(assignments + analyses)
+        db.flush()
+
+        db.add_all([
+            ValidationFeedback(assignment_id=a.id, ai_analysis_id=an.id, is_correct=True)
+            for a, an in zip(assignments[: n_cases // 2], analyses[: n_cases // 2])
+        ])
+
+    db.commit()
+    return validator
+
+
+async def call_endpoint(AsyncSessionFactory, validator):
+    async with AsyncSessionFactory() as db:
+        return await get_my_assignments(db=db, current_user=validator)
+
+
+def run(n_modules: int, n_cases: int) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{tmp}/bench.db"
+        _, SessionFactory = make_session_factory(url)
+        db = SessionFactory()
+        validator = seed(db, n_modules, n_cases)
+        db.refresh(validator)
+        db.expunge(validator)
+        db.close()
+
+        async_engine, AsyncSessionFactory = make_async_session_factory(url)
+        with QueryCounter(async_engine) as counter:
+            with timed(f"get_my_assignments ({n_modules} modules x {n_cases} cases)"):
+                result = asyncio.run(call_endpoint(AsyncSessionFactory, validator))
+
+    assert len(result) == n_modules
+    assert all(r["completed_cases"] == n_cases // 2 for r in result)
+    print(f"  SQL statements: {counter.count}")
+    return counter.count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--modules", type=int, default=50)
+    parser.add_argument("--cases", type=int, default=500)
+    args = parser.parse_args()
+
+    small = run(5, args.cases)
+    large = run(args.modules, args.cases)
+
+    if small != large:
+        raise SystemExit(f"[X] Query count grows with module count ({small} -> {large})")
+    print(f"[OK] Constant query count ({large}) regardless of module count")
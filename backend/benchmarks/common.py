@@ -0,0 +1,134 @@
+"""
+Shared helpers for the backend benchmarks.
+
+Every benchmark runs against a throwaway SQLite database so it never touches
+database.db. Run benchmarks from the backend/ folder:
+
+    python -m benchmarks.bench_my_assignments
+"""
+
+import sys
+import time
+from contextlib import ExitStack, contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, create_db_engine
+from app import models  # noqa: F401  (registers all tables on Base.metadata)
+from app.models import User, UserRole
+
+
+def make_session_factory(url: str = "sqlite://"):
+    """
+    Create a fresh database with all tables and return (engine, SessionFactory).
+
+    The default URL is an in-memory SQLite database shared across threads.
+    Other URLs get the app's pooling and SQLite pragmas (create_db_engine).
+    """
+    engine = create_db_engine(url)
+
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def make_async_session_factory(url: str):
+    """
+    Async (engine, SessionFactory) for a database created by make_session_factory.
+
+    Use a file URL: an in-memory database is not shared between the sync and
+    async engines.
+    """
+    engine = create_db_engine(url, async_=True)
+    return engine, async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+
+class QueryCounter:
+    """Counts SQL statements executed on an engine (sync or async) while active."""
+
+    def __init__(self, engine):
+        self.engine = getattr(engine, "sync_engine", engine)
+        self.count = 0
+        self.statements = []
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._before_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._before_execute)
+        return False
+
+
+@contextmanager
+def timed(label: str):
+    """Print wall time for the wrapped block."""
+    start = time.perf_counter()
+    yield
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"  {label}: {elapsed_ms:.1f} ms")
+
+
+def reset_peak_rss() -> bool:
+    """
+    Reset the process's peak RSS (Linux: /proc/self/clear_refs), so the next
+    peak_rss_mb() covers only what runs after this call. Returns False where
+    unsupported; the peak is then the process lifetime's.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size in MB (since the last reset_peak_rss, on Linux)."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@contextmanager
+def measure(results: dict, label: str, *engines):
+    """
+    Record wall time, peak RSS and SQL statement count of the block.
+
+    Stores {"wall_s", "peak_rss_mb", "queries"} in results[label] and prints
+    it. Statements are counted on every engine given (sync or async).
+    """
+    reset_peak_rss()
+    with ExitStack() as stack:
+        counters = [stack.enter_context(QueryCounter(engine)) for engine in engines]
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+    results[label] = {
+        "wall_s": round(elapsed, 4),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "queries": sum(counter.count for counter in counters),
+    }
+    print(f"  {label:24s} {elapsed:9.3f} s  {results[label]['peak_rss_mb']:8.1f} MB peak  "
+          f"{results[label]['queries']:6d} queries")
+
+
+def make_user(db, email: str, role: UserRole) -> User:
+    """Insert a user with a placeholder password hash (no bcrypt cost)."""
+    user = User(email=email, hashed_password="!", role=role, full_name=email.split("@")[0])
+    db.add(user)
+    db.flush()
+    return user
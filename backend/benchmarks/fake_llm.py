@@ -0,0 +1,249 @@
+"""
+Fake OpenAI/Groq-compatible chat completions server for load tests.
+
+Serves POST .../chat/completions (Groq clients call /openai/v1/chat/completions)
+with a lognormal latency distribution, token counts in `usage`, injected
+429 / 5xx errors and, optionally, replies that drift from the
+ANSWER / REASONING / CONFIDENCE format the prompts ask for (including
+refusals no parser can read). Requests with response_format
+{"type": "json_object"} get a JSON reply, whose drift is in key case and
+value formats only.
+
+Every decision (latency, error, answer, drift) is derived from the prompt and
+the attempt number, so a run is reproducible regardless of thread timing, and
+a retried request can succeed where the first attempt failed.
+
+GET /stats returns counters (requests, status codes, drifted replies).
+
+Usage (from backend/):
+    python -m benchmarks.fake_llm --port 8400 --latency-ms 300 --rate-429 0.05
+    # then run the app with GROQ_BASE_URL=http://127.0.0.1:8400 GROQ_API_KEY=fake
+
+    # or in-process:
+    server = FakeLLMServer(latency_ms=50, rate_5xx=0.02).start()
+    ... server.url ...
+    server.stop()
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Reply variants used when a reply drifts from the requested format
+DRIFT_FORMATS = ("lowercase", "markdown", "preamble", "percent", "multiline", "json", "bare", "refusal")
+
+
+def render_reply(answer: str, reasoning: str, confidence: float, drift: str = None) -> str:
+    """Reply text in the requested format, or in one of the DRIFT_FORMATS."""
+    if drift == "lowercase":
+        return f"answer: {answer.lower()}\nreasoning: {reasoning}\nconfidence: {confidence:.2f}"
+    if drift == "markdown":
+        return f"**ANSWER:** {answer}\n**REASONING:** {reasoning}\n**CONFIDENCE:** {confidence:.2f}"
+    if drift == "preamble":
+        return (f"Sure! Here is my analysis of the opinion.\n\nANSWER: {answer}\n"
+                f"REASONING: {reasoning}\nCONFIDENCE: {confidence:.2f}")
+    if drift == "percent":
+        return f"ANSWER: {answer}\nREASONING: {reasoning}\nCONFIDENCE: {confidence:.0%}"
+    if drift == "multiline":
+        first, _, rest = reasoning.partition(". ")
+        return f"ANSWER: {answer}\nREASONING: {first}.\n{rest}\nCONFIDENCE: {confidence:.2f}"
+    if drift == "json":
+        return "```json\n" + json.dumps(
+            {"answer": answer, "reasoning": reasoning, "confidence": confidence}, indent=2
+        ) + "\n```"
+    if drift == "bare":
+        return f"{answer}. {reasoning}"
+    if drift == "refusal":
+        return "I'm unable to determine this from the excerpt provided."
+    return f"ANSWER: {answer}\nREASONING: {reasoning}\nCONFIDENCE: {confidence:.2f}"
+
+
+class FakeLLMServer:
+    """Threaded HTTP server with the fake chat completions endpoint."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 200,
+                 latency_sigma: float = 0.5, rate_429: float = 0.0, rate_5xx: float = 0.0,
+                 drift: float = 0.0, retry_after_ms: int = 100, seed: int = 7):
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.drift = drift
+        self.retry_after_ms = retry_after_ms
+        self.seed = seed
+
+        self.stats = Counter()
+        self._attempts = Counter()
+        self._lock = threading.Lock()
+        self._thread = None
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeLLMServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats.clear()
+
+    def complete(self, body: dict):
+        """(status, headers, payload) for one chat completions request."""
+        prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+        digest = hashlib.sha256(prompt.encode()).hexdigest()
+        with self._lock:
+            self._attempts[digest] += 1
+            attempt = self._attempts[digest]
+            self.stats["requests"] += 1
+        rng = random.Random(f"{self.seed}:{digest}:{attempt}")
+
+        # Lognormal latency around the median
+        time.sleep(self.latency_ms / 1000 * math.exp(rng.gauss(0, self.latency_sigma)))
+
+        roll = rng.random()
+        if roll < self.rate_429:
+            self._count("status_429")
+            return 429, {"retry-after-ms": str(self.retry_after_ms)}, {
+                "error": {"message": "Rate limit reached", "type": "tokens", "code": "rate_limit_exceeded"}
+            }
+        if roll < self.rate_429 + self.rate_5xx:
+            status = rng.choice([500, 502, 503])
+            self._count(f"status_{status}")
+            return status, {}, {"error": {"message": "Service unavailable", "type": "internal_server_error"}}
+
+        # The answer depends on the prompt only, so retries agree with each other
+        answer_rng = random.Random(f"{self.seed}:{digest}")
+        answer = answer_rng.choice(["Yes", "No"])
+        confidence = round(answer_rng.uniform(0.55, 0.98), 2)
+        reasoning = ("The opinion discusses the certification of the results. "
+                     "The court addressed the challenge on the merits.")
+
+        if (body.get("response_format") or {}).get("type") == "json_object":
+            if rng.random() < self.drift:
+                # JSON mode keeps the syntax valid, not the keys or value formats
+                self._count("drift_json_keys")
+                content = json.dumps({"Answer": answer.upper(), "Reasoning": reasoning,
+                                      "Confidence": f"{confidence:.0%}"})
+            else:
+                content = json.dumps({"answer": answer, "reasoning": reasoning, "confidence": confidence})
+        elif rng.random() < self.drift:
+            drift = rng.choice(DRIFT_FORMATS)
+            self._count(f"drift_{drift}")
+            content = render_reply(answer, reasoning, confidence, drift)
+        else:
+            content = render_reply(answer, reasoning, confidence)
+
+        prompt_tokens = max(1, len(prompt) // 4)
+        completion_tokens = max(1, len(content) // 4)
+        self._count("status_200")
+        return 200, {}, {
+            "id": f"chatcmpl-{digest[:12]}-{attempt}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake-llm"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    return self._send(404, {}, {"error": {"message": "Not found"}})
+                length = int(self.headers.get("content-length", 0))
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except json.JSONDecodeError:
+                    return self._send(400, {}, {"error": {"message": "Invalid JSON"}})
+                self._send(*server.complete(body))
+
+            def do_GET(self):
+                if self.path.rstrip("/") == "/stats":
+                    with server._lock:
+                        return self._send(200, {}, dict(server.stats))
+                self._send(404, {}, {"error": {"message": "Not found"}})
+
+            def _send(self, status: int, headers: dict, payload: dict):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass  # one line per request would dominate a load test's output
+
+        return Handler
+
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    """Fake server options shared by this script and the load tests."""
+    parser.add_argument("--latency-ms", type=float, default=200, help="median response latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="lognormal spread")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="share of 429 responses")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="share of 500/502/503 responses")
+    parser.add_argument("--drift", type=float, default=0.0, help="share of replies in a drifted format")
+    parser.add_argument("--retry-after-ms", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=7)
+
+
+def server_options(args) -> dict:
+    return {
+        "latency_ms": args.latency_ms,
+        "latency_sigma": args.latency_sigma,
+        "rate_429": args.rate_429,
+        "rate_5xx": args.rate_5xx,
+        "drift": args.drift,
+        "retry_after_ms": args.retry_after_ms,
+        "seed": args.seed,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8400)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = FakeLLMServer(host=args.host, port=args.port, **server_options(args))
+    print(f"Fake LLM server on {server.url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,153 @@
+"""
+Load test: concurrent read endpoints served with async sessions.
+
+Drives the real app in-process (httpx + ASGI transport) against a temporary
+SQLite file, with real JWTs, at several concurrency levels:
+- GET /projects/                                  (admin)
+- GET /modules/validators/my-assignments          (validator)
+- GET /modules/modules/{id}/validation-cases      (validator)
+- GET /modules/modules/{id}/results               (scholar)
+
+As a baseline, the same project listing is also served by a sync twin route
+(sync Session in the threadpool, the pre-async implementation).
+
+Usage (from backend/):
+    python -m benchmarks.load_async_reads
+    python -m benchmarks.load_async_reads --requests 400 --concurrency 1 16 64
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+
+import httpx
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.database import get_db, get_async_db, get_read_db, get_async_read_db
+from app.main import app
+from app.models import (
+    UserRole, Project, CourtCase, VerificationModule, ValidatorAssignment,
+    AIAnalysis, ValidationFeedback, ModuleCaseSample
+)
+from app.routers.auth import get_current_user
+from app.utils.auth import create_access_token
+from app.utils.project_queries import list_project_summaries
+from benchmarks.common import make_async_session_factory, make_session_factory, make_user
+
+
+def seed(db, n_projects: int, n_cases: int):
+    admin = make_user(db, "admin@bench.edu", UserRole.ADMIN)
+    scholar = make_user(db, "scholar@bench.edu", UserRole.SCHOLAR)
+    validator = make_user(db, "ta@bench.edu", UserRole.VALIDATOR)
+
+    projects = [Project(name=f"Project {p}", admin_id=admin.id, scholar_id=scholar.id) for p in range(n_projects)]
+    db.add_all(projects)
+    db.flush()
+
+    module = VerificationModule(
+        project_id=projects[0].id, module_number=1, module_name="Module",
+        question_text="Was the election contested?", answer_type="yes_no",
+        sample_size=n_cases, status="validation_in_progress", ai_round=1
+    )
+    db.add(module)
+    db.flush()
+
+    for i in range(n_cases):
+        case = CourtCase(project_id=projects[0].id, case_name=f"Case {i}", opinion_text="Opinion text. " * 200)
+        db.add(case)
+        db.flush()
+        assignment = ValidatorAssignment(module_id=module.id, case_id=case.id, validator_id=validator.id, round=1)
+        analysis = AIAnalysis(module_id=module.id, case_id=case.id, ai_answer="Yes", ai_round=1,
+                              ai_confidence=0.5 + (i % 50) / 100)
+        db.add_all([assignment, analysis, ModuleCaseSample(module_id=module.id, case_id=case.id, sample_order=i + 1, round=1)])
+        db.flush()
+        db.add(ValidationFeedback(assignment_id=assignment.id, ai_analysis_id=analysis.id, is_correct=i % 4 != 0,
+                                  validator_correction=None if i % 4 else "No"))
+    db.commit()
+    return module.id
+
+
+def token(email: str, role: str) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': email, 'role': role})}"}
+
+
+async def hammer(client, path: str, headers: dict, n_requests: int, concurrency: int):
+    """Send n_requests GETs with at most `concurrency` in flight; return (req/s, p50 ms)."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, (path, response.status_code, response.text[:200])
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(n_requests)))
+    elapsed = time.perf_counter() - start
+    return n_requests / elapsed, statistics.median(latencies)
+
+
+async def main(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{tmp}/load.db"
+        _, SessionFactory = make_session_factory(url)
+        db = SessionFactory()
+        module_id = seed(db, args.projects, args.cases)
+        db.close()
+        _, AsyncSessionFactory = make_async_session_factory(url)
+
+        def override_db():
+            db = SessionFactory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        async def override_async_db():
+            async with AsyncSessionFactory() as db:
+                yield db
+
+        app.dependency_overrides[get_db] = override_db
+        app.dependency_overrides[get_read_db] = override_db
+        app.dependency_overrides[get_async_db] = override_async_db
+        app.dependency_overrides[get_async_read_db] = override_async_db
+
+        # Sync twin of list_projects (baseline)
+        @app.get("/_bench/projects-sync")
+        def list_projects_sync(db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+            return list_project_summaries(db, current_user, limit=100)[0]
+
+        admin = token("admin@bench.edu", "admin")
+        scholar = token("scholar@bench.edu", "scholar")
+        validator = token("ta@bench.edu", "validator")
+        scenarios = [
+            ("list_projects (sync baseline)", "/_bench/projects-sync", admin),
+            ("list_projects", "/projects/", admin),
+            ("my-assignments", "/modules/validators/my-assignments", validator),
+            ("validation-cases", f"/modules/modules/{module_id}/validation-cases", validator),
+            ("results", f"/modules/modules/{module_id}/results", scholar),
+        ]
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for label, path, headers in scenarios:
+                await hammer(client, path, headers, 5, 1)  # warm-up (user cache, pools)
+                for concurrency in args.concurrency:
+                    rps, p50 = await hammer(client, path, headers, args.requests, concurrency)
+                    print(f"  {label:32s} c={concurrency:<3d} {rps:8.1f} req/s   p50 {p50:7.1f} ms")
+
+        app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--projects", type=int, default=100)
+    parser.add_argument("--cases", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 32])
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,160 @@
+"""
+Load test: launch_module on the Groq path against the fake LLM server.
+
+Starts benchmarks/fake_llm.py in-process and points the Groq client at it
+(GROQ_BASE_URL), so prompts, HTTP calls, client retries, parsing and DB
+writes all run as in production. For each concurrency level C it launches C
+modules at once (sample size S each, one thread per launch, as concurrent
+requests would) and reports:
+- throughput (analyzed cases/s) and per-launch wall time
+- provider_call latency p50/p95 from the pipeline trace (TRACE_FILE)
+- injected errors (429/5xx) vs. cases still failed after client retries
+- drifted replies vs. replies re-asked and still unreadable after re-asks
+
+Usage (from backend/):
+    python -m benchmarks.load_launch
+    python -m benchmarks.load_launch --concurrency 1 8 32 --sample-size 50 \\
+        --latency-ms 400 --rate-429 0.1 --rate-5xx 0.02 --drift 0.2 --retries 3 --text-mode
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from app.core.config import settings
+from app.models import UserRole, Project, CourtCase, VerificationModule, ValidatorAssignment, AIAnalysis
+from app.routers.modules import launch_module
+from benchmarks.bench_embeddings import synthetic_opinion
+from benchmarks.common import make_session_factory, make_user
+from benchmarks.fake_llm import FakeLLMServer, add_server_arguments, server_options
+
+
+def seed(db, n_cases: int):
+    admin = make_user(db, "admin@bench.edu", UserRole.ADMIN)
+    scholar = make_user(db, "scholar@bench.edu", UserRole.SCHOLAR)
+    validator = make_user(db, "ta@bench.edu", UserRole.VALIDATOR)
+    project = Project(name="Load", admin_id=admin.id, scholar_id=scholar.id, ai_provider="groq-llama-8b")
+    db.add(project)
+    db.flush()
+
+    rng = random.Random(7)
+    db.add_all([
+        CourtCase(project_id=project.id, case_name=f"Case {i}", opinion_text=synthetic_opinion(rng, 400))
+        for i in range(n_cases)
+    ])
+    db.commit()
+
+    db.refresh(scholar)
+    db.refresh(validator)
+    db.expunge(scholar)
+    return project.id, scholar, validator.id
+
+
+def create_modules(db, project_id: int, validator_id: int, count: int, sample_size: int, first_number: int):
+    """Modules ready to launch (validator assigned), one per concurrent launch."""
+    module_ids = []
+    for n in range(first_number, first_number + count):
+        module = VerificationModule(
+            project_id=project_id, module_number=n, module_name=f"Module {n}",
+            question_text=f"Question {n}: was the election result contested?",
+            answer_type="yes_no", sample_size=sample_size, ai_provider="groq-llama-8b"
+        )
+        db.add(module)
+        db.flush()
+        db.add(ValidatorAssignment(module_id=module.id, validator_id=validator_id))
+        module_ids.append(module.id)
+    db.commit()
+    return module_ids
+
+
+def new_spans(trace_file: Path, offset: int):
+    """Spans written to the trace file after `offset`."""
+    if not trace_file.exists():
+        return []
+    with trace_file.open() as f:
+        f.seek(offset)
+        return [json.loads(line) for line in f]
+
+
+def percentile(values, q: float) -> float:
+    return statistics.quantiles(values, n=100)[int(q) - 1] if len(values) > 1 else (values or [0])[0]
+
+
+def run_level(SessionFactory, server, scholar, module_ids, trace_file: Path):
+    server.reset_stats()
+    offset = trace_file.stat().st_size if trace_file.exists() else 0
+
+    def one_launch(module_id):
+        db = SessionFactory()
+        try:
+            start = time.perf_counter()
+            launch_module(module_id, db=db, current_user=scholar)
+            return time.perf_counter() - start
+        finally:
+            db.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(module_ids)) as threads:
+        launch_times = list(threads.map(one_launch, module_ids))
+    elapsed = time.perf_counter() - start
+
+    db = SessionFactory()
+    analyses = db.query(AIAnalysis).filter(AIAnalysis.module_id.in_(module_ids)).all()
+    db.close()
+    failed = sum(1 for a in analyses if a.ai_answer == "ERROR")
+    unparsed = sum(1 for a in analyses if a.ai_answer == "ERROR" and a.ai_reasoning.startswith("Unparseable"))
+
+    stats = server.stats
+    injected = sum(count for key, count in stats.items() if key.startswith("status_") and key != "status_200")
+    drifted = sum(count for key, count in stats.items() if key.startswith("drift_"))
+    spans = new_spans(trace_file, offset)
+    latencies = [s["duration_ms"] for s in spans if s["name"] == "provider_call" and s["status"] == "ok"]
+    reasks = sum(1 for s in spans if s["name"] == "reask")
+
+    print(f"  c={len(module_ids):<3d} {len(analyses) / elapsed:7.1f} cases/s   "
+          f"launch p50 {statistics.median(launch_times):6.2f} s   "
+          f"provider_call p50 {percentile(latencies, 50):6.0f} ms p95 {percentile(latencies, 95):6.0f} ms")
+    print(f"         requests {stats['requests']}, injected errors {injected}, "
+          f"cases failed after retries {failed}/{len(analyses)}, "
+          f"drifted replies {drifted}, re-asked {reasks}, unparseable after re-asks {unparsed}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--sample-size", type=int, default=20, help="cases per launched module")
+    parser.add_argument("--retries", type=int, default=2, help="GROQ_MAX_RETRIES for the run")
+    parser.add_argument("--text-mode", action="store_true", help="ANSWER/REASONING lines instead of JSON mode")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = FakeLLMServer(**server_options(args)).start()
+    print(f"Fake LLM server on {server.url}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.GROQ_BASE_URL = server.url
+        settings.GROQ_MAX_RETRIES = args.retries
+        settings.AI_JSON_MODE = not args.text_mode
+        settings.TRACE_LEVEL = "case"
+        settings.TRACE_FILE = f"{tmp}/traces.jsonl"
+        os.environ["GROQ_API_KEY"] = "fake-key"
+
+        # File database: launches run on several threads at once
+        _, SessionFactory = make_session_factory(f"sqlite:///{tmp}/load.db")
+        db = SessionFactory()
+        project_id, scholar, validator_id = seed(db, max(200, args.sample_size * 4))
+
+        module_number = 1
+        for concurrency in args.concurrency:
+            module_ids = create_modules(db, project_id, validator_id, concurrency, args.sample_size, module_number)
+            module_number += concurrency
+            run_level(SessionFactory, server, scholar, module_ids, Path(settings.TRACE_FILE))
+        db.close()
+
+    server.stop()
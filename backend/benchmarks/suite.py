@@ -0,0 +1,318 @@
+"""
+Benchmark suite: backend hot paths on a synthetic corpus, against a baseline.
+
+Generates N synthetic opinions of realistic length into a Parquet file, then
+measures, on a temporary SQLite database:
+1. parse_parquet_file     Parquet -> case dicts
+2. upload_parquet         save, parse and insert into court_cases
+3. launch_module          sampling + dummy AI + per-case assignments
+4. get_validation_cases   validator queue (3/4 of the sample validated)
+5. get_module_results     scholar analytics for the round
+6. list_projects          admin dashboard
+
+Each step records wall time, peak RSS and SQL statement count. Read steps
+run once as a warm-up first. Results are compared with a stored baseline
+(benchmarks/baselines/<size>.json): a step slower or bigger than the
+tolerance, or issuing more SQL statements, is a regression and the run exits
+with status 1.
+
+Baselines are machine-specific; record one on the machine that compares
+against it (--save-baseline). The 1m corpus needs ~15 GB of disk, and
+parse_parquet_file holds the whole file in memory.
+
+Usage (from backend/):
+    python -m benchmarks.suite                      # 10k cases vs. baseline
+    python -m benchmarks.suite --size 100k --sample-size 2000
+    python -m benchmarks.suite --size 10k --save-baseline
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fastapi import BackgroundTasks, Response, UploadFile
+from sqlalchemy import and_, insert
+
+from app.core.config import settings
+from app.models import (
+    UserRole, Project, VerificationModule, ValidatorAssignment, AIAnalysis, ValidationFeedback
+)
+from app.routers import uploads
+from app.routers.modules import launch_module, get_validation_cases, get_module_results
+from app.routers.projects import list_projects
+from app.utils.parquet_parser import parse_parquet_file
+from benchmarks.common import make_async_session_factory, make_session_factory, make_user, measure
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+# Rows generated per Parquet row group
+CHUNK_ROWS = 10_000
+
+# Wall-time differences below this are noise, never regressions
+WALL_FLOOR_S = 0.05
+
+VOCABULARY = np.array((
+    "the court held that appellant appellee board of elections ballot ballots absentee "
+    "recount canvass county certified tally petition signatures nominating filing deadline "
+    "candidate statute section provides election code judgment affirmed reversed remanded "
+    "trial evidence testimony district commissioner registrar voter voters registration "
+    "residency eligibility we find no error in the ruling below because under plain meaning "
+    "of legislature intended precinct challenge contest writ mandamus injunction relief "
+    "respondent petitioner argues contends dissent concur opinion majority reasoning standard "
+    "review abuse discretion de novo clear and convincing count counted rejected accepted"
+).split())
+COURTS = ["Supreme Court", "Court of Appeals", "Superior Court", "District Court"]
+STATES = ["NY", "OH", "PA", "TX", "CA", "FL", "MI", "GA", "NC", "AZ"]
+ELECTION_TYPES = ["general", "primary", "special", "municipal", "school board"]
+JUDGES = ["Adams", "Baker", "Cohen", "Diaz", "Evans", "Fischer", "Garcia", "Hughes", "Ito"]
+
+
+def parse_size(value: str) -> int:
+    return SIZES.get(value.lower()) or int(value)
+
+
+def write_corpus(path: Path, n_cases: int, opinion_words: int, seed: int = 7):
+    """Write n_cases synthetic opinions (opinion_words +/- 50% words each) to Parquet."""
+    rng = np.random.default_rng(seed)
+    writer = None
+
+    for start in range(0, n_cases, CHUNK_ROWS):
+        rows = min(CHUNK_ROWS, n_cases - start)
+        ids = range(start, start + rows)
+
+        def texts(mean_words):
+            lengths = rng.integers(mean_words // 2, mean_words * 3 // 2 + 1, rows)
+            words = VOCABULARY[rng.integers(0, len(VOCABULARY), int(lengths.sum()))]
+            return [" ".join(chunk) for chunk in np.split(words, np.cumsum(lengths)[:-1])]
+
+        dissents = texts(max(1, opinion_words // 4))
+        has_dissent = rng.random(rows) < 0.1
+
+        table = pa.table({
+            "case_name": [f"Voter {i} v. Board of Elections" for i in ids],
+            "court": rng.choice(COURTS, rows),
+            "docket_number": [f"{1980 + i % 40}-CV-{i:07d}" for i in ids],
+            "state": rng.choice(STATES, rows),
+            "election_type": rng.choice(ELECTION_TYPES, rows),
+            "party_who_appointed_judge": rng.choice(["Democratic", "Republican"], rows),
+            "case_date": np.datetime64("1980-01-01") + rng.integers(0, 16000, rows),
+            "judges_names": [", ".join(rng.choice(JUDGES, 3, replace=False)) for _ in ids],
+            "opinion_text": texts(opinion_words),
+            "dissent_text": pa.array([d if flag else None for d, flag in zip(dissents, has_dissent)], pa.string()),
+        })
+        if writer is None:
+            writer = pq.ParquetWriter(path, table.schema)
+        writer.write_table(table)
+
+    writer.close()
+
+
+def seed(db, n_projects: int):
+    """Users and projects; the first project receives the corpus."""
+    admin = make_user(db, "admin@bench.edu", UserRole.ADMIN)
+    scholar = make_user(db, "scholar@bench.edu", UserRole.SCHOLAR)
+    validator = make_user(db, "ta@bench.edu", UserRole.VALIDATOR)
+    projects = [
+        Project(name=f"Project {p}", admin_id=admin.id, scholar_id=scholar.id)
+        for p in range(n_projects)
+    ]
+    db.add_all(projects)
+    db.commit()
+
+    project_id = projects[0].id
+    users = [admin, scholar, validator]
+    for user in users:
+        db.refresh(user)
+    # Detached snapshots: passing them as current_user never touches a session
+    db.expunge_all()
+    return users, project_id
+
+
+def add_validations(db, module_id: int):
+    """Validate 3/4 of the round's assignments; every third of those is a correction."""
+    rows = db.query(ValidatorAssignment.id, AIAnalysis.id).join(
+        AIAnalysis,
+        and_(
+            AIAnalysis.module_id == ValidatorAssignment.module_id,
+            AIAnalysis.case_id == ValidatorAssignment.case_id,
+            AIAnalysis.ai_round == ValidatorAssignment.round
+        )
+    ).filter(ValidatorAssignment.module_id == module_id).order_by(ValidatorAssignment.id).all()
+
+    feedback = [
+        {
+            "assignment_id": assignment_id,
+            "ai_analysis_id": analysis_id,
+            "round": 1,
+            "is_correct": i % 3 != 0,
+            "validator_correction": None if i % 3 else "No",
+            "validator_reasoning": None if i % 3 else "The opinion says otherwise.",
+        }
+        for i, (assignment_id, analysis_id) in enumerate(rows)
+        if i % 4 != 3
+    ]
+    if feedback:
+        db.execute(insert(ValidationFeedback), feedback)
+    db.commit()
+
+
+def upload_parquet_file(f, project_id: int, db, admin):
+    """upload_parquet as the route would run it (the index rebuild task is not run)."""
+    return uploads.upload_parquet(
+        project_id, BackgroundTasks(), file=UploadFile(f, filename="corpus.parquet"), db=db, admin=admin
+    )
+
+
+def run(args, tmp: Path) -> dict:
+    url = f"sqlite:///{tmp}/suite.db"
+    engine, SessionFactory = make_session_factory(url)
+    async_engine, AsyncSessionFactory = make_async_session_factory(url)
+
+    # Keep uploads and traces out of the working tree
+    uploads.UPLOAD_DIR = tmp
+    settings.TRACE_FILE = str(tmp / "traces.jsonl")
+
+    corpus = tmp / "corpus.parquet"
+    print(f"Writing {args.cases:,} synthetic opinions (~{args.opinion_words} words each)...")
+    write_corpus(corpus, args.cases, args.opinion_words)
+    print(f"  {corpus.stat().st_size / 1024 / 1024:,.1f} MB Parquet\n")
+
+    db = SessionFactory()
+    (admin, scholar, validator), project_id = seed(db, args.projects)
+    results = {}
+
+    with measure(results, "parse_parquet_file"):
+        parsed = parse_parquet_file(str(corpus))
+    assert parsed["success"] and len(parsed["cases"]) == args.cases
+    del parsed
+
+    with open(corpus, "rb") as f, measure(results, "upload_parquet", engine):
+        summary = upload_parquet_file(f, project_id, db, admin)
+    assert summary.cases_imported == args.cases
+
+    module = VerificationModule(
+        project_id=project_id, module_number=1, module_name="Contested",
+        question_text="Was the election result contested?", answer_type="yes_no",
+        sample_size=args.sample_size, ai_provider="dummy"
+    )
+    db.add(module)
+    db.flush()
+    db.add(ValidatorAssignment(module_id=module.id, validator_id=validator.id))
+    db.commit()
+    module_id = module.id
+
+    with measure(results, "launch_module", engine):
+        launched = launch_module(module_id, db=db, current_user=scholar)
+    assert launched["cases_sampled"] == min(args.sample_size, args.cases)
+
+    add_validations(db, module_id)
+    db.close()
+
+    async def call(route, **kwargs):
+        async with AsyncSessionFactory() as adb:
+            return await route(db=adb, **kwargs)
+
+    read_steps = [
+        ("get_validation_cases", get_validation_cases, {"module_id": module_id, "current_user": validator}),
+        ("get_module_results", get_module_results, {"module_id": module_id, "response": Response(), "round_number": 1,
+                                                   "if_none_match": None, "current_user": scholar}),
+        ("list_projects", list_projects, {"response": Response(), "after_id": None, "limit": 100, "current_user": admin}),
+    ]
+    for label, route, kwargs in read_steps:
+        asyncio.run(call(route, **kwargs))  # warm-up
+        with measure(results, label, async_engine):
+            asyncio.run(call(route, **kwargs))
+
+    engine.dispose()
+    asyncio.run(async_engine.dispose())
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Print current vs. baseline per step; return the regressions found."""
+    regressions = []
+    print(f"\nCompared with baseline recorded {baseline.get('recorded_at', '?')} "
+          f"on {baseline.get('machine', {}).get('platform', '?')}:")
+    for label, current in results.items():
+        base = baseline["results"].get(label)
+        if base is None:
+            print(f"  {label:24s} (no baseline)")
+            continue
+        changes = []
+        for metric in ("wall_s", "peak_rss_mb", "queries"):
+            now, before = current[metric], base[metric]
+            change = (now - before) / before if before else 0.0
+            changes.append(f"{metric} {before} -> {now} ({change:+.0%})")
+            if metric == "queries":
+                regressed = now > before
+            elif metric == "wall_s":
+                regressed = now > before * (1 + tolerance) and now - before > WALL_FLOOR_S
+            else:
+                regressed = now > before * (1 + tolerance)
+            if regressed:
+                regressions.append(f"{label}: {metric} {before} -> {now}")
+        print(f"  {label:24s} " + ", ".join(changes))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", default="10k", help="10k, 100k, 1m or a case count")
+    parser.add_argument("--opinion-words", type=int, default=2000, help="mean words per opinion")
+    parser.add_argument("--sample-size", type=int, default=500, help="cases sampled by launch_module")
+    parser.add_argument("--projects", type=int, default=200, help="projects listed by list_projects")
+    parser.add_argument("--baseline", type=Path, help="baseline JSON (default: baselines/<size>.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed time/RSS increase")
+    parser.add_argument("--output", type=Path, help="also write this run's results to a JSON file")
+    args = parser.parse_args()
+    args.cases = parse_size(args.size)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = run(args, Path(tmp))
+
+    report = {
+        "size": args.size.lower(),
+        "parameters": {
+            "cases": args.cases,
+            "opinion_words": args.opinion_words,
+            "sample_size": args.sample_size,
+            "projects": args.projects,
+        },
+        "machine": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+        },
+        "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    baseline_path = args.baseline or BASELINE_DIR / f"{report['size']}.json"
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nBaseline saved to {baseline_path}")
+    elif baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text())
+        if baseline.get("parameters") != report["parameters"]:
+            print(f"\nWarning: baseline parameters {baseline.get('parameters')} differ from this run's")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+        print("\nNo regressions.")
+    else:
+        print(f"\nNo baseline at {baseline_path} (run with --save-baseline to record one)")
@@ -2,10 +2,15 @@
 Create test users for development
 """
 
+from app.core.config import settings
 from app.database import SessionLocal, engine
 from app.models import Base, User, UserRole
 from app.utils.auth import hash_password
 
+# This script has no __main__ guard, so hash inline rather than in
+# spawned worker processes (which would re-run it on import)
+settings.PASSWORD_HASH_WORKERS = 0
+
 
 # Create tables first (in case they don't exist)
 Base.metadata.create_all(bind=engine)
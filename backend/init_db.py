@@ -10,11 +10,14 @@ Usage:
 
 from app.database import engine, Base
 from app.models import User, Project, CourtCase, Assignment, Verification  # Import ALL models
+from app.utils.search_index import create_search_index
 
 def init_db():
     """Create all database tables"""
     print("Creating database tables...")
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        search_enabled = create_search_index(connection)
     print("[OK] Database tables created successfully!")
     print("[OK] Database file: database.db")
     print("\nTables created:")
@@ -23,6 +26,7 @@ def init_db():
     print("  - court_cases")
     print("  - assignments")
     print("  - verifications")
+    print(f"  - full-text search index ({'enabled' if search_enabled else 'unavailable'})")
     
 def drop_db():
     """Drop all database tables (use with caution!)"""
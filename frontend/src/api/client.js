@@ -69,9 +69,16 @@ export const authAPI = {
 
 // Projects API
 export const projectsAPI = {
+  // All visible projects, following the X-Next-Cursor header page by page
   list: async () => {
-    const response = await apiClient.get('/projects/');
-    return response.data;
+    const projects = [];
+    let afterId;
+    do {
+      const response = await apiClient.get('/projects/', { params: { limit: 500, after_id: afterId } });
+      projects.push(...response.data);
+      afterId = response.headers['x-next-cursor'];
+    } while (afterId);
+    return projects;
   },
   
   create: async (projectData) => {
@@ -161,8 +168,26 @@ export const uploadAPI = {
 
 // Cases API
 export const casesAPI = {
-  list: async (projectId) => {
-    const response = await apiClient.get(`/projects/${projectId}/cases`);
+  // params: { after_id, limit, include_text, court, state, election_type, date_from, date_to }
+  list: async (projectId, params = {}) => {
+    const response = await apiClient.get(`/projects/${projectId}/cases`, { params });
+    return response.data;
+  },
+
+  // One page of case metadata and the cursor for the next page (null on the last page)
+  listPage: async (projectId, params = {}) => {
+    const response = await apiClient.get(`/projects/${projectId}/cases`, { params });
+    return { cases: response.data, nextCursor: response.headers['x-next-cursor'] || null };
+  },
+
+  // One case with its opinion, dissent and concurrence text
+  get: async (projectId, caseId) => {
+    const response = await apiClient.get(`/projects/${projectId}/cases/${caseId}`);
+    return response.data;
+  },
+
+  similar: async (projectId, caseId, k = 10) => {
+    const response = await apiClient.get(`/projects/${projectId}/cases/${caseId}/similar`, { params: { k } });
     return response.data;
   },
 };
@@ -264,6 +289,23 @@ export const modulesAPI = {
     return response.data;
   },
 
+  // decisions: [{ validation_id, approve, scholar_notes }]
+  reviewCorrections: async (moduleId, decisions) => {
+    const response = await apiClient.post(
+      `/modules/modules/${moduleId}/review-corrections`,
+      { decisions }
+    );
+    return response.data;
+  },
+
+  similarToCorrection: async (moduleId, validationId, k = 20) => {
+    const response = await apiClient.get(
+      `/modules/modules/${moduleId}/corrections/${validationId}/similar-cases`,
+      { params: { k } }
+    );
+    return response.data;
+  },
+
   trustValidator: async (moduleId) => {
     const response = await apiClient.post(`/modules/modules/${moduleId}/trust-validator`);
     return response.data;
@@ -309,6 +351,16 @@ export const validatorAPI = {
     return response.data;
   },
 
+  // Save many validations at once
+  // validations: [{ case_id, is_correct, corrected_answer, validator_reasoning, validator_notes }]
+  submitValidationsBulk: async (moduleId, validations) => {
+    const response = await apiClient.post(
+      `/modules/modules/${moduleId}/validations/bulk`,
+      { validations }
+    );
+    return response.data;
+  },
+
   // Submit all validations
   submitAllValidations: async (moduleId) => {
     const response = await apiClient.post(`/modules/modules/${moduleId}/submit-validation`);
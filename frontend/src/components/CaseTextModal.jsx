@@ -0,0 +1,65 @@
+import { useState, useEffect } from 'react';
+import { casesAPI } from '../api/client';
+
+const TEXT_SECTIONS = [
+  ['opinion_text', 'Opinion'],
+  ['dissent_text', 'Dissent'],
+  ['concur_text', 'Concurrence'],
+];
+
+export default function CaseTextModal({ projectId, caseId, onClose }) {
+  const [caseData, setCaseData] = useState(null);
+  const [error, setError] = useState('');
+
+  useEffect(() => {
+    const loadCase = async () => {
+      try {
+        setCaseData(await casesAPI.get(projectId, caseId));
+      } catch (err) {
+        setError(err.response?.data?.detail || 'Failed to load case');
+      }
+    };
+    loadCase();
+  }, [projectId, caseId]);
+
+  return (
+    <div className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center p-4 z-[60]">
+      <div className="bg-white rounded-lg shadow-xl w-full max-w-4xl max-h-[90vh] flex flex-col">
+        <div className="flex justify-between items-center p-6 border-b">
+          <div>
+            <h2 className="text-2xl font-serif font-bold text-cardozo-dark">
+              {caseData?.case_name || 'Loading case...'}
+            </h2>
+            {caseData && (
+              <p className="text-sm text-gray-600 mt-1">
+                {caseData.court} • {caseData.case_date || 'no date'} • {caseData.state}
+              </p>
+            )}
+          </div>
+          <button
+            onClick={onClose}
+            className="text-gray-400 hover:text-gray-600 transition"
+          >
+            <svg className="w-6 h-6" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+              <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M6 18L18 6M6 6l12 12" />
+            </svg>
+          </button>
+        </div>
+
+        <div className="flex-1 overflow-y-auto p-6 space-y-6">
+          {error && <p className="text-sm text-red-600">{error}</p>}
+          {caseData && TEXT_SECTIONS.map(([column, label]) => (
+            <div key={column}>
+              <h3 className="text-lg font-semibold text-cardozo-dark mb-2">{label}</h3>
+              {caseData[column] ? (
+                <p className="text-sm text-gray-900 whitespace-pre-wrap">{caseData[column]}</p>
+              ) : (
+                <p className="text-sm text-gray-400 italic">None</p>
+              )}
+            </div>
+          ))}
+        </div>
+      </div>
+    </div>
+  );
+}
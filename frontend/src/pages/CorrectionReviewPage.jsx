@@ -240,11 +240,13 @@ export default function CorrectionReviewPage({ user, onLogout }) {
                   <div className="flex-1 bg-gray-200 rounded-full h-2">
                     <div
                       className="bg-blue-600 h-2 rounded-full"
-                      style={{ width: `${currentCorrection.ai_confidence * 100}%` }}
+                      style={{ width: `${(currentCorrection.ai_confidence ?? 0) * 100}%` }}
                     ></div>
                   </div>
                   <span className="text-sm font-medium text-gray-900">
-                    {Math.round(currentCorrection.ai_confidence * 100)}%
+                    {currentCorrection.ai_confidence == null
+                      ? 'n/a'
+                      : `${Math.round(currentCorrection.ai_confidence * 100)}%`}
                   </span>
                 </div>
               </div>
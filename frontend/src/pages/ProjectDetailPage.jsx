@@ -2,6 +2,9 @@ import { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { authAPI, projectsAPI, casesAPI, uploadAPI, modulesAPI } from '../api/client';
 import Header from '../components/Header';
+import CaseTextModal from '../components/CaseTextModal';
+
+const CASES_PAGE_SIZE = 100;
 
 export default function ProjectDetailPage({ user: propUser, onLogout }) {
   const { projectId } = useParams();
@@ -9,6 +12,9 @@ export default function ProjectDetailPage({ user: propUser, onLogout }) {
   const [user, setUser] = useState(propUser || null);
   const [project, setProject] = useState(null);
   const [cases, setCases] = useState([]);
+  const [nextCasesCursor, setNextCasesCursor] = useState(null);
+  const [loadingMoreCases, setLoadingMoreCases] = useState(false);
+  const [openCaseId, setOpenCaseId] = useState(null);
   const [loading, setLoading] = useState(true);
   const [availableColumns, setAvailableColumns] = useState([]);
   const [selectedColumns, setSelectedColumns] = useState([
@@ -210,15 +216,17 @@ useEffect(() => {
 
   const loadData = async () => {
     try {
-      const [userData, projectData, casesData] = await Promise.all([
+      const [userData, projectData, casesPage] = await Promise.all([
         authAPI.getCurrentUser(),
         projectsAPI.get(projectId),
-        casesAPI.list(projectId),
+        casesAPI.listPage(projectId, { limit: CASES_PAGE_SIZE }),
       ]);
+      const casesData = casesPage.cases;
       
       setUser(userData);
       setProject(projectData);
       setCases(casesData);
+      setNextCasesCursor(casesPage.nextCursor);
 
       // Set AI provider from project data
       if (projectData.ai_provider) {
@@ -267,7 +275,7 @@ useEffect(() => {
   const handleRemoveParquet = async () => {
     if (!window.confirm(
       `Are you sure you want to remove the uploaded Parquet file?\n\n` +
-      `This will delete all ${cases.length} cases from this project.\n\n` +
+      `This will delete all ${project?.total_cases || 0} cases from this project.\n\n` +
       `This action CANNOT be undone.`
     )) {
       return;
@@ -365,7 +373,7 @@ useEffect(() => {
       `Are you sure you want to delete "${project?.name}"?\n\n` +
       `This will permanently delete:\n` +
       `- The project\n` +
-      `- All ${cases.length} court cases\n` +
+      `- All ${project?.total_cases || 0} court cases\n` +
       `- All uploaded files\n\n` +
       `This action CANNOT be undone.`
     )) {
@@ -570,6 +578,19 @@ useEffect(() => {
     }
   };
 
+  const loadMoreCases = async () => {
+    setLoadingMoreCases(true);
+    try {
+      const casesPage = await casesAPI.listPage(projectId, { limit: CASES_PAGE_SIZE, after_id: nextCasesCursor });
+      setCases((prev) => [...prev, ...casesPage.cases]);
+      setNextCasesCursor(casesPage.nextCursor);
+    } catch (err) {
+      console.error('Failed to load more cases:', err);
+    } finally {
+      setLoadingMoreCases(false);
+    }
+  };
+
   const renderCellContent = (value) => {
     if (value === null || value === undefined) {
       return <span className="text-gray-400 italic">null</span>;
@@ -1501,7 +1522,7 @@ useEffect(() => {
                   Source File Viewer
                 </h2>
                 <p className="text-sm text-gray-600 mt-1">
-                  {project?.parquet_filename} • {cases.length} cases
+                  {project?.parquet_filename} • {project?.total_cases || 0} cases
                 </p>
               </div>
               <button
@@ -1566,8 +1587,12 @@ useEffect(() => {
                       </tr>
                     </thead>
                     <tbody className="bg-white divide-y divide-gray-100">
-                      {cases.map((case_, idx) => (
-                        <tr key={idx} className="hover:bg-gray-50 transition">
+                      {cases.map((case_) => (
+                        <tr
+                          key={case_.id}
+                          onClick={() => setOpenCaseId(case_.id)}
+                          className="hover:bg-gray-50 transition cursor-pointer"
+                        >
                           {selectedColumns.map((column) => (
                             <td
                               key={column}
@@ -1584,8 +1609,17 @@ useEffect(() => {
                 
                 <div className="bg-gray-50 px-6 py-3 border-t border-gray-200 text-center">
                   <span className="text-sm text-gray-600">
-                    Showing <span className="font-semibold text-cardozo-dark">{cases.length}</span> court cases
+                    Showing <span className="font-semibold text-cardozo-dark">{cases.length}</span> of {project?.total_cases || 0} court cases · click a case to read its opinion
                   </span>
+                  {nextCasesCursor && (
+                    <button
+                      onClick={loadMoreCases}
+                      disabled={loadingMoreCases}
+                      className="block mx-auto mt-3 px-4 py-2 bg-cardozo-blue text-white rounded-lg text-sm font-medium hover:bg-[#005A94] transition disabled:opacity-50"
+                    >
+                      {loadingMoreCases ? 'Loading...' : 'Load More'}
+                    </button>
+                  )}
                 </div>
               </div>
             </div>
@@ -1603,6 +1637,15 @@ useEffect(() => {
         </div>
       )}
 
+      {/* Case Text Modal - opinion text is fetched for the opened case only */}
+      {openCaseId && (
+        <CaseTextModal
+          projectId={projectId}
+          caseId={openCaseId}
+          onClose={() => setOpenCaseId(null)}
+        />
+      )}
+
       {/* Module Context Editor Modal */}
       {showModuleContextModal && selectedModuleForContext && (
         <div className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center p-4 z-50 overflow-y-auto">
@@ -291,11 +291,13 @@ export default function ValidationPage({ user, onLogout }) {
                     <div className="flex-1 bg-gray-200 rounded-full h-2">
                       <div
                         className="bg-green-600 h-2 rounded-full"
-                        style={{ width: `${currentCase.ai_analysis.ai_confidence * 100}%` }}
+                        style={{ width: `${(currentCase.ai_analysis.ai_confidence ?? 0) * 100}%` }}
                       ></div>
                     </div>
                     <span className="text-sm font-medium text-gray-900">
-                      {Math.round(currentCase.ai_analysis.ai_confidence * 100)}%
+                      {currentCase.ai_analysis.ai_confidence == null
+                        ? 'n/a'
+                        : `${Math.round(currentCase.ai_analysis.ai_confidence * 100)}%`}
                     </span>
                   </div>
                 </div>
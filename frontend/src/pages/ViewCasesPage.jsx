@@ -2,12 +2,18 @@ import { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { projectsAPI, casesAPI } from '../api/client';
 import Header from '../components/Header';
+import CaseTextModal from '../components/CaseTextModal';
+
+const PAGE_SIZE = 100;
 
 export default function UploadPage({ user, onLogout }) {
   const { projectId } = useParams();
   const navigate = useNavigate();
   const [project, setProject] = useState(null);
   const [cases, setCases] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [openCaseId, setOpenCaseId] = useState(null);
   const [loading, setLoading] = useState(true);
   const [availableColumns, setAvailableColumns] = useState([]);
   const [selectedColumns, setSelectedColumns] = useState([
@@ -23,13 +29,15 @@ export default function UploadPage({ user, onLogout }) {
 
   const loadData = async () => {
     try {
-      const [projectData, casesData] = await Promise.all([
+      const [projectData, casesPage] = await Promise.all([
         projectsAPI.get(projectId),
-        casesAPI.list(projectId),
+        casesAPI.listPage(projectId, { limit: PAGE_SIZE }),
       ]);
+      const casesData = casesPage.cases;
       
       setProject(projectData);
       setCases(casesData);
+      setNextCursor(casesPage.nextCursor);
 
       if (casesData.length > 0) {
         const columns = Object.keys(casesData[0]).filter(
@@ -44,6 +52,19 @@ export default function UploadPage({ user, onLogout }) {
     }
   };
 
+  const loadMoreCases = async () => {
+    setLoadingMore(true);
+    try {
+      const casesPage = await casesAPI.listPage(projectId, { limit: PAGE_SIZE, after_id: nextCursor });
+      setCases((prev) => [...prev, ...casesPage.cases]);
+      setNextCursor(casesPage.nextCursor);
+    } catch (err) {
+      console.error('Failed to load more cases:', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const toggleColumn = (column) => {
     setSelectedColumns((prev) =>
       prev.includes(column)
@@ -105,7 +126,7 @@ export default function UploadPage({ user, onLogout }) {
             </h1>
             {project && (
             <p className="text-gray-600 mt-2">
-                {project.name} · {cases.length} cases
+                {project.name} · {project.total_cases} cases
             </p>
             )}
             <div className="w-24 h-1 bg-cardozo-gold mt-2"></div>
@@ -176,8 +197,12 @@ export default function UploadPage({ user, onLogout }) {
                   </tr>
                 </thead>
                 <tbody className="bg-white divide-y divide-gray-100">
-                  {cases.map((case_, idx) => (
-                    <tr key={idx} className="hover:bg-gray-50 transition">
+                  {cases.map((case_) => (
+                    <tr
+                      key={case_.id}
+                      onClick={() => setOpenCaseId(case_.id)}
+                      className="hover:bg-gray-50 transition cursor-pointer"
+                    >
                       {selectedColumns.map((column) => (
                         <td
                           key={column}
@@ -197,9 +222,26 @@ export default function UploadPage({ user, onLogout }) {
         {/* Summary Footer */}
         {cases.length > 0 && (
           <div className="mt-4 text-center text-sm text-gray-600">
-            Showing <span className="font-semibold text-cardozo-dark">{cases.length}</span> court cases
+            Showing <span className="font-semibold text-cardozo-dark">{cases.length}</span> of {project.total_cases} court cases · click a case to read its opinion
+            {nextCursor && (
+              <button
+                onClick={loadMoreCases}
+                disabled={loadingMore}
+                className="block mx-auto mt-3 px-4 py-2 bg-cardozo-blue text-white rounded-lg font-medium hover:bg-[#005A94] transition disabled:opacity-50"
+              >
+                {loadingMore ? 'Loading...' : 'Load More'}
+              </button>
+            )}
           </div>
         )}
+
+        {openCaseId && (
+          <CaseTextModal
+            projectId={projectId}
+            caseId={openCaseId}
+            onClose={() => setOpenCaseId(null)}
+          />
+        )}
       </main>
     </div>
   );